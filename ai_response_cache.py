@@ -0,0 +1,141 @@
+import os
+import re
+import time
+import asyncio
+import hashlib
+import logging
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from crawl_store import CrawlStore
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 是否启用 AI 推荐结果缓存
+AI_CACHE_ENABLED = os.getenv("AI_CACHE_ENABLED", "true").lower() == "true"
+# 缓存结果的有效期（秒）
+DEFAULT_AI_CACHE_TTL = float(os.getenv("AI_CACHE_TTL", "86400"))
+# 最多缓存的查询数（内存和持久化存储各自的上限）
+DEFAULT_AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "2000"))
+# 持久化存储每写入多少条结果清理一次超出条数上限的旧记录（启动时也清理一次）
+DEFAULT_AI_CACHE_TRIM_INTERVAL = int(os.getenv("AI_CACHE_TRIM_INTERVAL", "100"))
+
+# 持久化存储中的实体类型
+AI_RESPONSE = 'ai_response'
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# 查询末尾不影响含义的标点
+TRAILING_PUNCTUATION = '。．.！!？?，,；;、~～ '
+
+
+def normalize_query(query: str) -> str:
+    """归一化用户查询：全角/半角统一（NFKC）、忽略大小写、合并空白、去掉末尾标点"""
+    text = unicodedata.normalize('NFKC', query).casefold()
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
+    return text.rstrip(TRAILING_PUNCTUATION)
+
+
+def prompt_fingerprint(prompt: str) -> str:
+    """系统提示词的摘要；提示词修改后旧的缓存结果自动失效"""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:16]
+
+
+class AIResponseCache:
+    """DeepSeek 推荐结果的精确匹配缓存，保存 parse_ai_response 解析后的结果
+
+    键由归一化后的查询、推荐数量、模型、temperature 和系统提示词摘要组成，只有完全相同的请求才命中；
+    命中时跳过 AI 调用和 JSON 解析。结果先查进程内 LRU，再查持久化存储（重启后仍可命中），
+    两者都按有效期和条数上限淘汰：持久化存储在创建缓存时和每写入 trim_interval 条后清理一次，
+    两次清理之间最多超出上限 trim_interval 条。解析失败、没有推荐项目的结果不缓存。
+    持久化存储的读写在线程中执行（asyncio.to_thread），不阻塞事件循环。
+    结果在调用方之间共享，调用方不应原地修改。
+    """
+
+    def __init__(self, model: str, temperature: float, prompt: str, store: Optional[CrawlStore] = None,
+                 ttl: float = DEFAULT_AI_CACHE_TTL, max_entries: int = DEFAULT_AI_CACHE_MAX_ENTRIES,
+                 enabled: bool = AI_CACHE_ENABLED, trim_interval: int = DEFAULT_AI_CACHE_TRIM_INTERVAL):
+        self.model = model
+        self.temperature = temperature
+        self.prompt_hash = prompt_fingerprint(prompt)
+        self.store = store
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.trim_interval = max(1, trim_interval)
+        self.enabled = enabled and ttl > 0 and max_entries > 0
+        # 键 -> (解析结果, time.monotonic() 过期时刻)
+        self._entries: 'OrderedDict[Hashable, Tuple[Dict, float]]' = OrderedDict()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.trims = 0
+        if self.enabled and store is not None:
+            self._trim()
+
+    def key(self, query: str, limit: int) -> Hashable:
+        digest = hashlib.sha256(normalize_query(query).encode('utf-8')).hexdigest()
+        return (AI_RESPONSE, digest, limit, self.model, self.temperature, self.prompt_hash)
+
+    async def get(self, query: str, limit: int) -> Optional[Dict]:
+        """返回缓存的解析结果，没有或已过期时返回 None"""
+        if not self.enabled:
+            return None
+        key = self.key(query, limit)
+        cached = self._entries.get(key)
+        if cached is not None:
+            result, expires_at = cached
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+        if self.store is not None:
+            row = await asyncio.to_thread(self.store.load, key, self.ttl)
+            if row is not None:
+                result, fetched_at = row
+                self._remember(key, result, self.ttl - (time.time() - fetched_at))
+                self.store_hits += 1
+                return result
+        self.misses += 1
+        return None
+
+    async def put(self, query: str, limit: int, result: Dict):
+        """缓存解析结果；没有推荐项目的结果（AI 响应解析失败）不缓存"""
+        if not self.enabled or not result.get('recommendations'):
+            return
+        key = self.key(query, limit)
+        self._remember(key, result, self.ttl)
+        self.writes += 1
+        if self.store is not None:
+            await asyncio.to_thread(self.store.save, AI_RESPONSE, key, result)
+            if self.writes % self.trim_interval == 0:
+                await asyncio.to_thread(self._trim)
+
+    def _trim(self):
+        self.store.trim(AI_RESPONSE, self.max_entries)
+        self.trims += 1
+
+    def _remember(self, key: Hashable, result: Dict, ttl: float):
+        self._entries[key] = (result, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        """返回条数、命中（内存 / 持久化存储）、未命中、写入次数和持久化存储的清理次数"""
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl': self.ttl,
+            'model': self.model,
+            'prompt_hash': self.prompt_hash,
+            'hits': self.hits,
+            'store_hits': self.store_hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'trim_interval': self.trim_interval,
+            'trims': self.trims
+        }
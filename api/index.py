@@ -2,7 +2,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from main import app
+from main import app, create_services
+
+# 不保证执行 ASGI lifespan 的运行环境中，在导入时创建共享组件
+create_services()
 
 # Vercel需要这个handler函数
 handler = app
\ No newline at end of file
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+链接分类基准测试 - 对比逐平台子串匹配（原实现）与按域名后缀索引的 LinkClassifier
+
+    python benchmarks/bench_links.py
+    python benchmarks/bench_links.py --links 60 --pages 2000
+
+每个合成页面包含若干社交平台、Mastodon 实例、邮箱和个人网站链接，
+主机名在页面之间重复出现，与真实的用户主页相近。
+
+两项测量都是请求中实际执行的路径：
+- 分类器：逐链接分类函数与 LinkClassifier.classify_many
+- 提取器：ProfileExtractor._classify_links 对页面中的 <a> 元素分类并整理联系信息（含取 href、文本等开销）
+"""
+
+import sys
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from link_classifier import LinkClassifier, extract_username  # noqa: E402
+from profile_extractor import ProfileExtractor  # noqa: E402
+
+SAMPLE_LINKS = [
+    'https://twitter.com/{u}', 'https://x.com/{u}', 'https://www.linkedin.com/in/{u}/',
+    'https://fosstodon.org/@{u}', 'https://hachyderm.io/@{u}', 'https://social.example.net/@{u}',
+    'https://www.instagram.com/{u}', 'https://youtube.com/@{u}', 'https://stackoverflow.com/users/1/{u}',
+    'https://dev.to/{u}', 'https://medium.com/@{u}', 'https://{u}.hashnode.dev',
+    'https://github.com/{u}', 'mailto:{u}@example.com', 'https://{u}.dev', 'https://blog.{u}.io/about',
+    'https://docs.python.org/3/', 'https://www.dropbox.com/s/{u}'
+]
+
+LEGACY_PLATFORMS = {
+    'twitter': ['twitter.com', 'x.com'],
+    'linkedin': ['linkedin.com'],
+    'mastodon': ['mastodon', 'mas.to', 'fosstodon', 'mstdn'],
+    'instagram': ['instagram.com'],
+    'facebook': ['facebook.com', 'fb.com'],
+    'youtube': ['youtube.com', 'youtu.be'],
+    'tiktok': ['tiktok.com'],
+    'github': ['github.com'],
+    'stackoverflow': ['stackoverflow.com', 'stackexchange.com'],
+    'devto': ['dev.to'],
+    'medium': ['medium.com'],
+    'hashnode': ['hashnode.com', 'hashnode.dev']
+}
+LEGACY_EXCLUDED = ['github.com', 'twitter.com', 'x.com', 'linkedin.com', 'instagram.com', 'facebook.com',
+                   'youtube.com', 'tiktok.com', 'stackoverflow.com', 'medium.com', 'dev.to', 'mastodon']
+
+
+def legacy_classify(href: str) -> Optional[Dict]:
+    """原 GitHubCrawler._classify_link：对每个平台的每个域名做子串匹配"""
+    href_lower = href.lower()
+    for platform, domains in LEGACY_PLATFORMS.items():
+        if any(domain in href_lower for domain in domains):
+            return {'platform': platform, 'type': 'social', 'username': extract_username(href, platform)}
+    if 'mailto:' in href_lower:
+        return {'platform': 'email', 'type': 'contact', 'value': href.replace('mailto:', '')}
+    if 'tel:' in href_lower:
+        return {'platform': 'phone', 'type': 'contact', 'value': href.replace('tel:', '')}
+    if any(domain in href_lower for domain in ['.dev', '.io', '.com', '.org', '.net', '.me', '.co', '.blog', '.site']):
+        if not any(excluded in href_lower for excluded in LEGACY_EXCLUDED):
+            return {'platform': 'website', 'type': 'contact', 'value': href}
+    return None
+
+
+def make_pages(count: int, links: int, seed: int = 0) -> List[List[str]]:
+    rng = random.Random(seed)
+    users = [f'user{index}' for index in range(200)]
+    return [[rng.choice(SAMPLE_LINKS).format(u=rng.choice(users)) for _ in range(links)] for _ in range(count)]
+
+
+def empty_contact_info() -> Dict:
+    return {'social_accounts': [], 'contact_methods': [], 'additional_links': [], 'all_links': []}
+
+
+def link_tags(pages: List[List[str]]) -> List[list]:
+    """把每个页面的链接构造成侧栏中的 <a> 元素"""
+    result = []
+    for page in pages:
+        html = ''.join(f'<a href="{href}">{href}</a>' for href in page)
+        result.append(BeautifulSoup(f'<div class="Layout-sidebar">{html}</div>', 'html.parser').find_all('a'))
+    return result
+
+
+def time_pages(classify_page, pages: List[list], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            classify_page(page)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="链接分类基准测试：子串匹配与域名后缀索引")
+    parser.add_argument('--pages', type=int, default=1000, help="合成页面数")
+    parser.add_argument('--links', type=int, default=40, help="每个页面的链接数")
+    parser.add_argument('--repeat', type=int, default=5, help="重复轮数")
+    args = parser.parse_args(argv)
+
+    pages = make_pages(args.pages, args.links)
+    classifier = LinkClassifier()
+    legacy_extractor = ProfileExtractor(int, lambda hrefs: [legacy_classify(href) for href in hrefs])
+    extractor = ProfileExtractor(int, LinkClassifier().classify_many)
+    tags = link_tags(pages)
+    results = {
+        '分类器: 子串匹配（原实现）': time_pages(lambda page: [legacy_classify(href) for href in page], pages, args.repeat),
+        '分类器: 域名后缀索引': time_pages(classifier.classify_many, pages, args.repeat),
+        '提取器: 子串匹配（原实现）': time_pages(
+            lambda page: legacy_extractor._classify_links(page, empty_contact_info()), tags, args.repeat),
+        '提取器: 域名后缀索引': time_pages(
+            lambda page: extractor._classify_links(page, empty_contact_info()), tags, args.repeat),
+    }
+
+    total_links = args.pages * args.links
+    print(f"{'实现':<24}{'中位数(ms)':>12}{'每链接(us)':>12}")
+    for name, timings in results.items():
+        median = statistics.median(timings)
+        print(f"{name:<24}{median:>12.1f}{median * 1000 / total_links:>12.2f}")
+
+    changed = sum(
+        1 for page in pages for href in page
+        if (legacy_classify(href) or {}).get('platform') != (classifier.classify(href) or {}).get('platform')
+    )
+    print(f"\n分类结果不同的链接: {changed}/{total_links}（子串匹配的误判，如 dropbox.com 被识别为 x.com）")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+日志开销基准测试 - 对比调用线程中立即格式化并同步输出（原实现）与级别过滤 + 惰性格式化 + 采样 + 后台输出
+
+    python benchmarks/bench_logging.py
+    python benchmarks/bench_logging.py --profiles 50 --numbers 20000
+
+两项测量都只统计调用线程（即请求处理线程）的耗时，日志写入 /dev/null：
+- 逐个计数：_parse_count 每次解析数字时的日志（原先 3 条 INFO f-string）
+- 逐个用户主页：解析合成的用户主页，对比 DEBUG 同步输出（与原先 INFO 下的输出量相当）和各种管道配置
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import logging
+import argparse
+import statistics
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from log_config import configure_logging  # noqa: E402
+from github_crawler import GitHubCrawler  # noqa: E402
+import stub_server  # noqa: E402
+
+logger = logging.getLogger('github_crawler')
+
+
+def legacy_parse_count(text: str) -> int:
+    """原 _parse_count 的日志写法：每个数字 3 条立即格式化的 INFO 日志"""
+    text = text.strip().lower()
+    logger.info(f"原始文本: '{text}'")
+    match = re.search(r'([0-9]+(?:\.[0-9]+)?)\s*([kmb]?)(?:\s|$)', text)
+    if not match:
+        return 0
+    number_str, unit = match.group(1), match.group(2)
+    logger.info(f"匹配结果: 数字='{number_str}', 单位='{unit}'")
+    number = float(number_str)
+    multipliers = {'k': 1000, 'm': 1000000, 'b': 1000000000}
+    result = int(number * multipliers[unit]) if unit in multipliers else int(number)
+    logger.info(f"解析纯数字: {number} -> {result}")
+    return result
+
+
+def timed(func: Callable, items: List, repeat: int) -> float:
+    """返回每个条目在调用线程中的中位耗时（微秒）"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        timings.append((time.perf_counter() - start) * 1e6 / len(items))
+    return statistics.median(timings)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="日志开销基准测试")
+    parser.add_argument('--numbers', type=int, default=5000, help="解析的计数字符串数")
+    parser.add_argument('--profiles', type=int, default=20, help="解析的用户主页数")
+    parser.add_argument('--repeat', type=int, default=5, help="重复轮数")
+    parser.add_argument('--pad-kb', type=int, default=50, help="合成用户主页的填充大小（KB）")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    numbers = [rng.choice(['{}', '{}.{}k', '{} ']).format(rng.randint(1, 999), rng.randint(0, 9)) for _ in range(args.numbers)]
+    pages = [stub_server._synthetic_github([f'user{index}'], {}, args.pad_kb)['body'].encode('utf-8') for index in range(args.profiles)]
+    crawler = GitHubCrawler()
+    devnull = open(os.devnull, 'w')
+
+    configs = [
+        ('同步输出 DEBUG（原实现的输出量）', dict(level='DEBUG', async_output=False, sample_every=1)),
+        ('INFO + 后台输出 + 采样', dict(level='INFO', async_output=True, sample_every=10)),
+        ('DEBUG + 后台输出 + 采样', dict(level='DEBUG', async_output=True, sample_every=10)),
+        ('WARNING', dict(level='WARNING', async_output=True, sample_every=10)),
+    ]
+
+    print(f"{'场景':<36}{'每次调用(us)':>14}")
+    pipeline = configure_logging(level='INFO', async_output=False, sample_every=1, stream=devnull)
+    print(f"{'逐个计数: 原实现（INFO 同步，立即格式化）':<36}{timed(legacy_parse_count, numbers, args.repeat):>14.2f}")
+    pipeline.stop()
+    pipeline = configure_logging(level='INFO', async_output=True, sample_every=10, stream=devnull)
+    print(f"{'逐个计数: INFO + 后台输出 + 采样':<36}{timed(crawler._parse_count, numbers, args.repeat):>14.2f}")
+    pipeline.stop()
+
+    for name, config in configs:
+        pipeline = configure_logging(stream=devnull, **config)
+        per_page = timed(lambda page: crawler._parse_user_profile_page(page, 'octo'), pages, args.repeat)
+        pipeline.stop()
+        print(f"{'逐个主页: ' + name:<36}{per_page:>14.0f}  {pipeline.stats()}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+HTML解析后端基准测试 - 对比各后端的单页解析耗时和峰值内存
+
+    python benchmarks/bench_parsers.py                       # 使用合成的大页面
+    python benchmarks/bench_parsers.py page1.html stub_fixtures/github
+    python benchmarks/bench_parsers.py --backends lxml html.parser --repeat 20
+    python benchmarks/bench_parsers.py --regions profile user.html    # 同时测量按区域的部分解析
+
+每个后端在独立子进程中运行，峰值常驻内存(maxrss)互不影响；
+tracemalloc 只统计Python对象，lxml 在C层分配的临时内存体现在 maxrss 中。
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import statistics
+import subprocess
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from html_parser import ParseRegions, available_backends, make_soup  # noqa: E402
+from github_crawler import REPOSITORY_REGIONS  # noqa: E402
+from profile_extractor import PROFILE_REGIONS  # noqa: E402
+
+REGIONS = {'profile': PROFILE_REGIONS, 'repository': REPOSITORY_REGIONS}
+
+
+def load_pages(paths: List[str], pad_kb: int) -> List[Tuple[str, bytes]]:
+    """读取待解析页面：HTML文件、替身服务器的录制文件（JSON）或目录；未指定时生成合成页面"""
+    pages = []
+    for raw in paths:
+        path = Path(raw)
+        files = sorted(path.rglob('*')) if path.is_dir() else [path]
+        for file in files:
+            if file.suffix == '.json':
+                record = json.loads(file.read_text(encoding='utf-8'))
+                if 'html' not in record.get('headers', {}).get('Content-Type', ''):
+                    continue
+                pages.append((file.name, record['body'].encode('utf-8')))
+            elif file.suffix in ('.html', '.htm'):
+                pages.append((file.name, file.read_bytes()))
+    if pages or paths:
+        return pages
+
+    import stub_server
+    return [
+        ('profile.html', stub_server._synthetic_github(['octocat'], {}, pad_kb)['body'].encode('utf-8')),
+        ('repository.html', stub_server._synthetic_github(['octocat', 'hello'], {}, pad_kb)['body'].encode('utf-8')),
+        ('commits.html', stub_server._synthetic_github(['octocat', 'hello', 'commits'], {}, pad_kb)['body'].encode('utf-8')),
+    ]
+
+
+def page_regions(name: str, regions: Optional[str]) -> Optional[ParseRegions]:
+    """页面对应的部分解析区域：命令行指定时用于所有页面，否则按合成页面的名称判断"""
+    if regions:
+        return REGIONS[regions]
+    return REGIONS.get(name.split('.')[0])
+
+
+def time_parse(content: bytes, backend: str, repeat: int, regions: Optional[ParseRegions] = None) -> Tuple[List[float], int]:
+    """重复解析同一页面，返回每次的耗时和单次解析的 tracemalloc 峰值"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        soup = make_soup(content, backend, regions)
+        timings.append(time.perf_counter() - started)
+        del soup
+    tracemalloc.start()
+    soup = make_soup(content, backend, regions)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del soup
+    return timings, peak
+
+
+def measure(backend: str, pages: List[Tuple[str, bytes]], repeat: int, regions: Optional[str] = None) -> Dict:
+    """在当前进程中测量单个后端：每页的中位解析耗时和 tracemalloc 峰值，有区域定义的页面同时测量部分解析"""
+    make_soup(pages[0][1], backend)  # 预热
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results = []
+    for name, content in pages:
+        timings, peak = time_parse(content, backend, repeat)
+        result = {
+            'page': name,
+            'size_kb': len(content) / 1024,
+            'median_ms': statistics.median(timings) * 1000,
+            'min_ms': min(timings) * 1000,
+            'python_peak_kb': peak / 1024
+        }
+        page_region = page_regions(name, regions)
+        if page_region is not None:
+            partial_timings, partial_peak = time_parse(content, backend, repeat, page_region)
+            result['partial_median_ms'] = statistics.median(partial_timings) * 1000
+            result['partial_peak_kb'] = partial_peak / 1024
+        results.append(result)
+    # Linux 上 ru_maxrss 单位为KB
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {'backend': backend, 'pages': results, 'maxrss_growth_kb': rss_after - rss_before}
+
+
+def run_isolated(backend: str, args) -> Optional[Dict]:
+    """在子进程中测量一个后端，避免不同后端的内存峰值互相干扰"""
+    command = [sys.executable, __file__, '--worker', backend, '--repeat', str(args.repeat),
+               '--pad-kb', str(args.pad_kb)] + (['--regions', args.regions] if args.regions else []) + args.pages
+    completed = subprocess.run(command, capture_output=True, text=True, env=dict(os.environ, PYTHONWARNINGS='ignore'))
+    if completed.returncode != 0:
+        print(f"后端 {backend} 测试失败: {completed.stderr.strip()[-500:]}")
+        return None
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_report(reports: List[Dict]):
+    header = (f"{'后端':<14}{'页面':<22}{'大小(KB)':>10}{'中位(ms)':>10}{'最快(ms)':>10}{'Python峰值(KB)':>16}"
+              f"{'部分解析(ms)':>14}{'部分峰值(KB)':>14}")
+    print(header)
+    print('-' * len(header))
+    for report in reports:
+        for page in report['pages']:
+            partial = ''
+            if 'partial_median_ms' in page:
+                partial = f"{page['partial_median_ms']:>14.1f}{page['partial_peak_kb']:>14.0f}"
+            print(f"{report['backend']:<14}{page['page'][:20]:<22}{page['size_kb']:>10.0f}{page['median_ms']:>10.1f}"
+                  f"{page['min_ms']:>10.1f}{page['python_peak_kb']:>16.0f}{partial}")
+    print()
+    for report in reports:
+        total = sum(page['median_ms'] for page in report['pages'])
+        print(f"{report['backend']}: 合计 {total:.1f} ms/轮，进程峰值内存增长 {report['maxrss_growth_kb']} KB")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="HTML解析后端基准测试：单页解析耗时和峰值内存")
+    parser.add_argument('pages', nargs='*', help="HTML文件、录制的JSON文件或目录")
+    parser.add_argument('--backends', nargs='+', default=None, help="默认测试所有已安装的后端")
+    parser.add_argument('--repeat', type=int, default=10, help="每页重复解析次数")
+    parser.add_argument('--pad-kb', type=int, default=400, help="合成页面的大小（KB）")
+    parser.add_argument('--regions', choices=sorted(REGIONS), help="按该页面类型的区域测量部分解析（合成页面自动判断）")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.pages, args.pad_kb)
+    if not pages:
+        parser.error("没有找到可解析的HTML页面")
+
+    if args.worker:
+        print(json.dumps(measure(args.worker, pages, args.repeat, args.regions)))
+        return
+
+    installed = available_backends()
+    backends = args.backends or installed
+    missing = [backend for backend in backends if backend not in installed]
+    if missing:
+        print(f"未安装的后端将被跳过: {', '.join(missing)}")
+    reports = [report for report in (run_isolated(backend, args) for backend in backends if backend in installed) if report]
+    print_report(reports)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
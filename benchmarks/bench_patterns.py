@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+正则表达式基准测试 - 对比调用时编译/查缓存的写法（原实现）与 patterns.py 中预编译、合并后的模式
+
+    python benchmarks/bench_patterns.py
+    python benchmarks/bench_patterns.py --contributors 200 --profiles 500
+
+逐个贡献者：提取用户名（三个 href/alt 模式）和提交次数（原先依次尝试三个模式）；
+逐个用户主页：关注数、加入时间的文本回退和计数解析。
+"""
+
+import re
+import sys
+import time
+import random
+import logging
+import argparse
+import statistics
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from patterns import (  # noqa: E402
+    COUNT_PATTERN, NUMBER_PATTERN, COMMIT_COUNT_PATTERN, GROUPED_NUMBER_PATTERN, USER_PATH_PATTERN,
+    COMMITS_AUTHOR_PATTERN, AT_MENTION_PATTERN, FOLLOWERS_PATTERN, FOLLOWING_PATTERN, JOIN_DATE_KEYWORDS,
+    JOIN_DATE_PATTERN
+)
+
+LEGACY_FOLLOWERS = [r'(\d+(?:\.\d+)?[kKmMbB]?)\s*[Ff]ollowers?', r'[Ff]ollowers?[^\d]*(\d+(?:\.\d+)?[kKmMbB]?)',
+                    r'(\d+(?:\.\d+)?[kKmMbB]?)\s*关注者']
+LEGACY_FOLLOWING = [r'(\d+(?:\.\d+)?[kKmMbB]?)\s*[Ff]ollowing', r'[Ff]ollowing[^\d]*(\d+(?:\.\d+)?[kKmMbB]?)',
+                    r'(\d+(?:\.\d+)?[kKmMbB]?)\s*关注中']
+LEGACY_JOIN_DATE = [r'Joined GitHub on ([A-Za-z]+ \d{1,2}, \d{4})', r'Joined on ([A-Za-z]+ \d{1,2}, \d{4})',
+                    r'Member since ([A-Za-z]+ \d{4})']
+
+
+def contributors_page(count: int, rng: random.Random) -> str:
+    rows = []
+    for index in range(count):
+        label = rng.choice(['{n} commits', '{n} 次提交', '{n}'])
+        rows.append(f'<li class="contrib-person"><img alt="@user{index}" src="/a{index}.png">'
+                    f'<a href="/user{index}">user{index}</a> <span>{label.format(n=rng.randint(1, 5000))}</span></li>')
+    return f"<ol>{''.join(rows)}</ol>"
+
+
+def profile_text(rng: random.Random) -> str:
+    filler = ' '.join(rng.choice(['Rust', 'Python', 'Pinned', 'repositories', 'Overview', 'Stars']) for _ in range(400))
+    return (f"{filler} {rng.randint(1, 900)}.{rng.randint(0, 9)}k followers · {rng.randint(1, 300)} following "
+            f"{filler} Joined on March {rng.randint(1, 28)}, 2015")
+
+
+def legacy_contributor(element) -> tuple:
+    username = None
+    for method in (lambda el: el.find('a', href=re.compile(r'^/[^/]+$')),
+                   lambda el: el.find('a', href=re.compile(r'/commits\?author=')),
+                   lambda el: el.find('img', alt=re.compile(r'^@'))):
+        if method(element):
+            username = True
+            break
+    text = element.get_text()
+    for pattern in (r'(\d+(?:,\d+)*)\s*commit', r'(\d+(?:,\d+)*)\s*次提交', r'(\d+(?:,\d+)*)'):
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return username, int(match.group(1).replace(',', ''))
+    return username, 0
+
+
+def compiled_contributor(element) -> tuple:
+    username = None
+    for method in (lambda el: el.find('a', href=USER_PATH_PATTERN),
+                   lambda el: el.find('a', href=COMMITS_AUTHOR_PATTERN),
+                   lambda el: el.find('img', alt=AT_MENTION_PATTERN)):
+        if method(element):
+            username = True
+            break
+    text = element.get_text()
+    match = COMMIT_COUNT_PATTERN.search(text) or GROUPED_NUMBER_PATTERN.search(text)
+    return username, int(match.group(match.lastindex or 0).replace(',', '')) if match else 0
+
+
+def legacy_profile(text: str) -> list:
+    found = []
+    for patterns in (LEGACY_FOLLOWERS, LEGACY_FOLLOWING, LEGACY_JOIN_DATE):
+        for pattern in patterns:
+            match = re.search(pattern, text)
+            if match:
+                found.append(match.group(1))
+                break
+    for count in ('1.2k', '45', '3 m', 'n/a'):
+        match = re.search(r'([0-9]+(?:\.[0-9]+)?)\s*([kmb]?)(?:\s|$)', count) or re.search(r'([0-9]+(?:\.[0-9]+)?)', count)
+        found.append(match.group(1) if match else None)
+    return found
+
+
+def compiled_profile(text: str) -> list:
+    found = []
+    for pattern in (FOLLOWERS_PATTERN, FOLLOWING_PATTERN):
+        match = pattern.search(text)
+        if match:
+            found.append(match.group(match.lastgroup))
+    # 与 ProfileExtractor._join_date 相同：从最早出现的关键字开始匹配
+    starts = [start for start in map(text.find, JOIN_DATE_KEYWORDS) if start >= 0]
+    match = JOIN_DATE_PATTERN.search(text, min(starts)) if starts else None
+    if match:
+        found.append(match.group(match.lastgroup))
+    for count in ('1.2k', '45', '3 m', 'n/a'):
+        match = COUNT_PATTERN.search(count) or NUMBER_PATTERN.search(count)
+        found.append(match.group(1) if match else None)
+    return found
+
+
+def time_calls(func: Callable, items: List, repeat: int) -> float:
+    """返回每个条目的中位耗时（微秒）"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        timings.append((time.perf_counter() - start) * 1e6 / len(items))
+    return statistics.median(timings)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="正则表达式基准测试：调用时编译与预编译")
+    parser.add_argument('--contributors', type=int, default=100, help="贡献者条目数")
+    parser.add_argument('--profiles', type=int, default=200, help="用户主页文本数")
+    parser.add_argument('--repeat', type=int, default=20, help="重复轮数")
+    args = parser.parse_args(argv)
+    logging.disable(logging.CRITICAL)
+
+    rng = random.Random(0)
+    elements = BeautifulSoup(contributors_page(args.contributors, rng), 'html.parser').find_all('li')
+    texts = [profile_text(rng) for _ in range(args.profiles)]
+
+    rows = [
+        ('逐个贡献者', time_calls(legacy_contributor, elements, args.repeat), time_calls(compiled_contributor, elements, args.repeat)),
+        ('逐个用户主页', time_calls(legacy_profile, texts, args.repeat), time_calls(compiled_profile, texts, args.repeat)),
+    ]
+    print(f"{'场景':<12}{'原实现(us)':>12}{'预编译(us)':>12}{'节省':>8}")
+    for name, legacy, compiled in rows:
+        print(f"{name:<12}{legacy:>12.2f}{compiled:>12.2f}{(1 - compiled / legacy) * 100:>7.0f}%")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
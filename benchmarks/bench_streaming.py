@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+流式读取提前结束的基准测试 - 对比读到所需字段后关闭连接与读完剩余内容复用 keep-alive 连接
+
+    python benchmarks/bench_streaming.py
+    python benchmarks/bench_streaming.py --rtt-ms 80 --bandwidth-mbps 50 --remaining-kb 64 256 1024
+
+本地启动 HTTPS 服务器（openssl 生成的自签名证书）和一个模拟网络延迟与带宽的 TCP 代理，
+依次请求仓库页面，经由 AsyncGitHubCrawler._fetch 流式读取：
+- 关闭连接：stream_drain_bytes=0，每个页面都要重新建立 TCP+TLS 连接
+- 读完剩余：剩余内容全部读完丢弃，连接归还连接池
+- 默认阈值：剩余内容不超过 STREAM_DRAIN_BYTES 时读完，否则关闭连接（服务实际使用的方式）
+- 完整下载：不提前结束，作为参照
+"""
+
+import os
+import ssl
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from github_crawler import AsyncGitHubCrawler, STREAM_DRAIN_BYTES  # noqa: E402
+from http_pool import HTTPClientPool, GITHUB_WEB  # noqa: E402
+import stub_server  # noqa: E402
+
+OWNER, REPO = 'octocat', 'hello'
+
+
+def make_certificate(directory: str) -> Tuple[str, str]:
+    """生成 127.0.0.1 的自签名证书"""
+    cert, key = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-keyout', key, '-out', cert,
+         '-subj', '/CN=127.0.0.1', '-addext', 'subjectAltName=IP:127.0.0.1'],
+        check=True, capture_output=True
+    )
+    return cert, key
+
+
+async def start_server(cert: str, key: str, remaining_kb: int) -> Tuple[web.AppRunner, int]:
+    """仓库页：页头和侧栏在最前面，之后是 remaining_kb 的 README 等内容"""
+    page = stub_server._synthetic_github([OWNER, REPO], {}, remaining_kb)['body'].encode('utf-8')
+
+    async def handle(request: web.Request) -> web.Response:
+        return web.Response(body=page, content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/{owner}/{repo}', handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    site = web.TCPSite(runner, '127.0.0.1', 0, ssl_context=context)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+async def start_proxy(target_port: int, rtt_ms: float, bandwidth_mbps: float) -> Tuple[asyncio.AbstractServer, int]:
+    """TCP 代理：每个方向的数据延迟 rtt/2 送达，并按带宽限速"""
+    one_way = rtt_ms / 2000
+    bytes_per_second = bandwidth_mbps * 1e6 / 8
+
+    async def pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def deliver():
+            ready_at = 0.0
+            while True:
+                arrival, data = await queue.get()
+                if data is None:
+                    break
+                ready_at = max(ready_at, arrival) + len(data) / bytes_per_second
+                await asyncio.sleep(max(0.0, ready_at - time.monotonic()))
+                writer.write(data)
+                await writer.drain()
+            writer.close()
+
+        task = asyncio.ensure_future(deliver())
+        try:
+            while True:
+                data = await reader.read(64 * 1024)
+                if not data:
+                    break
+                queue.put_nowait((time.monotonic() + one_way, data))
+        except ConnectionError:
+            pass
+        queue.put_nowait((0.0, None))
+        await task
+
+    async def handle(client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter):
+        upstream_reader, upstream_writer = await asyncio.open_connection('127.0.0.1', target_port)
+        try:
+            await asyncio.gather(pipe(client_reader, upstream_writer), pipe(upstream_reader, client_writer),
+                                 return_exceptions=True)
+        except asyncio.CancelledError:
+            # 测量结束时仍保持的 keep-alive 连接
+            client_writer.close()
+            upstream_writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def run_mode(port: int, cert: str, pages: int, drain_bytes: int, early_exit: bool) -> Dict:
+    pool = HTTPClientPool()
+    pool._ssl_context.load_verify_locations(cert)
+    crawler = AsyncGitHubCrawler(http_pool=pool, web_base=f"https://127.0.0.1:{port}", stream_drain_bytes=drain_bytes)
+    url = f"{crawler.web_base}/{OWNER}/{REPO}"
+    timings = []
+    try:
+        for _ in range(pages):
+            tracker = crawler._repository_header_tracker(OWNER, REPO) if early_exit else None
+            start = time.perf_counter()
+            await crawler._fetch(url, timeout=30, stop_when=tracker)
+            timings.append((time.perf_counter() - start) * 1000)
+        connections = pool.stats()[GITHUB_WEB]
+    finally:
+        await pool.close()
+    return {'timings': timings, 'connections': connections, 'streaming': crawler.streaming_stats()}
+
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        print(f"往返延迟 {args.rtt_ms} ms，带宽 {args.bandwidth_mbps} Mbps，每种方式顺序请求 {args.pages} 个页面\n")
+        print(f"{'剩余内容(KB)':<14}{'方式':<12}{'中位(ms)':>10}{'平均(ms)':>10}{'新建连接':>10}{'复用连接':>10}")
+        for remaining_kb in args.remaining_kb:
+            runner, server_port = await start_server(cert, key, remaining_kb)
+            proxy, proxy_port = await start_proxy(server_port, args.rtt_ms, args.bandwidth_mbps)
+            modes = [
+                ('关闭连接', 0, True),
+                ('读完剩余', 1 << 40, True),
+                ('默认阈值', STREAM_DRAIN_BYTES, True),
+                ('完整下载', 0, False),
+            ]
+            for name, drain_bytes, early_exit in modes:
+                result = await run_mode(proxy_port, cert, args.pages, drain_bytes, early_exit)
+                timings, connections = result['timings'], result['connections']
+                print(f"{remaining_kb:<14}{name:<12}{statistics.median(timings):>10.1f}{statistics.mean(timings):>10.1f}"
+                      f"{connections['new_connections']:>10}{connections['reused_connections']:>10}")
+            proxy.close()
+            await proxy.wait_closed()
+            await runner.cleanup()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="流式读取基准测试：提前结束后关闭连接与复用连接")
+    parser.add_argument('--pages', type=int, default=30, help="每种方式请求的页面数")
+    parser.add_argument('--rtt-ms', type=float, default=40, help="模拟的往返延迟（毫秒）")
+    parser.add_argument('--bandwidth-mbps', type=float, default=100, help="模拟的下行带宽（Mbps）")
+    parser.add_argument('--remaining-kb', type=int, nargs='+', default=[64, 256, 1024],
+                        help="所需字段之后的剩余内容大小（KB）")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+后端接口压测脚本 - 统计各接口的吞吐量和尾延迟
+配合 stub_server.py 使用即可在无网络的环境下压测：
+
+    python stub_server.py --latency 50 --latency deepseek=1500
+    GITHUB_WEB_BASE=http://127.0.0.1:9100/github \\
+    GITHUB_API_BASE=http://127.0.0.1:9100/api \\
+    DEEPSEEK_API_BASE=http://127.0.0.1:9100/deepseek/v1/chat/completions \\
+    DEEPSEEK_API_KEY=stub python main.py
+    python benchmarks/load_test.py --target http://127.0.0.1:8000 --concurrency 50 --requests 500
+"""
+
+import sys
+import time
+import random
+import asyncio
+import argparse
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+# 压测使用的仓库和用户；使用替身服务器时任意名称都会得到合成数据
+REPOSITORIES = [
+    "microsoft/vscode", "facebook/react", "tensorflow/tensorflow", "torvalds/linux",
+    "python/cpython", "golang/go", "rust-lang/rust", "nodejs/node", "django/django", "pallets/flask",
+]
+USERNAMES = ["torvalds", "gvanrossum", "yyx990803", "tj", "sindresorhus", "gaearon", "kennethreitz", "mitsuhiko"]
+QUERIES = ["web framework", "machine learning", "http client", "static site", "orm", "task queue"]
+
+ENDPOINTS = ('contributors', 'profile', 'suggestions', 'recommendations', 'health')
+
+
+def build_request(endpoint: str, rng: random.Random, distinct: int) -> Tuple[str, str, Optional[Dict]]:
+    """生成一个请求 (方法, 路径, JSON请求体)；distinct 控制不同实体的数量，用于观察缓存和合并效果"""
+    index = rng.randrange(distinct)
+    if endpoint == 'contributors':
+        owner, repo = REPOSITORIES[index % len(REPOSITORIES)].split('/')
+        suffix = f"-{index // len(REPOSITORIES)}" if index >= len(REPOSITORIES) else ''
+        return 'GET', f"/api/contributors/{owner}/{repo}{suffix}?limit=10", None
+    if endpoint == 'profile':
+        username = USERNAMES[index % len(USERNAMES)]
+        suffix = f"-{index // len(USERNAMES)}" if index >= len(USERNAMES) else ''
+        return 'GET', f"/api/profile/{username}{suffix}", None
+    if endpoint == 'suggestions':
+        query = QUERIES[index % len(QUERIES)]
+        return 'GET', f"/api/suggestions?q={query.replace(' ', '+')}+{index}&limit=5", None
+    if endpoint == 'recommendations':
+        query = QUERIES[index % len(QUERIES)]
+        return 'POST', "/api/recommendations", {'query': f"我需要一个{query}项目 #{index}", 'limit': 5}
+    return 'GET', "/api/health", None
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class EndpointResult:
+    """单个接口的压测结果"""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.started = 0.0
+        self.finished = 0.0
+
+    def report(self) -> Dict:
+        latencies = sorted(self.latencies)
+        elapsed = max(self.finished - self.started, 1e-9)
+        return {
+            'endpoint': self.endpoint,
+            'requests': len(latencies),
+            'ok': sum(count for status, count in self.statuses.items() if isinstance(status, int) and status < 400),
+            'statuses': dict(self.statuses),
+            'throughput': len(latencies) / elapsed,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p90_ms': percentile(latencies, 90) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'max_ms': (latencies[-1] if latencies else 0) * 1000
+        }
+
+
+async def run_endpoint(session: aiohttp.ClientSession, target: str, endpoint: str, total: int,
+                       concurrency: int, distinct: int, timeout: float, seed: int) -> EndpointResult:
+    """以固定并发对单个接口发送 total 个请求"""
+    result = EndpointResult(endpoint)
+    rng = random.Random(seed)
+    requests = [build_request(endpoint, rng, distinct) for _ in range(total)]
+    queue: asyncio.Queue = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+
+    async def worker():
+        while True:
+            try:
+                method, path, body = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            try:
+                async with session.request(method, f"{target}{path}", json=body,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    await response.read()
+                    result.statuses[response.status] += 1
+            except asyncio.TimeoutError:
+                result.statuses['timeout'] += 1
+            except aiohttp.ClientError as e:
+                result.statuses[type(e).__name__] += 1
+            result.latencies.append(time.perf_counter() - started)
+
+    result.started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.finished = time.perf_counter()
+    return result
+
+
+def print_report(reports: List[Dict]):
+    header = f"{'接口':<16}{'请求数':>8}{'成功':>8}{'吞吐(req/s)':>14}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}"
+    print(header)
+    print('-' * len(header))
+    for report in reports:
+        print(f"{report['endpoint']:<16}{report['requests']:>8}{report['ok']:>8}{report['throughput']:>14.1f}"
+              f"{report['p50_ms']:>10.1f}{report['p90_ms']:>10.1f}{report['p99_ms']:>10.1f}{report['max_ms']:>10.1f}")
+    for report in reports:
+        print(f"{report['endpoint']} 状态码分布: {report['statuses']}")
+
+
+async def main_async(args) -> List[Dict]:
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        reports = []
+        for index, endpoint in enumerate(args.endpoints):
+            result = await run_endpoint(session, args.target.rstrip('/'), endpoint, args.requests,
+                                        args.concurrency, args.distinct, args.timeout, args.seed + index)
+            reports.append(result.report())
+        return reports
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="后端接口压测：吞吐量和尾延迟")
+    parser.add_argument('--target', default='http://127.0.0.1:8000', help="后端服务地址")
+    parser.add_argument('--endpoints', nargs='+', default=list(ENDPOINTS), choices=ENDPOINTS)
+    parser.add_argument('--requests', type=int, default=200, help="每个接口的请求数")
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--distinct', type=int, default=50, help="不同仓库/用户/查询的数量")
+    parser.add_argument('--timeout', type=float, default=150, help="单个请求的客户端超时（秒）")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    print(f"压测 {args.target}: 每个接口 {args.requests} 个请求，并发 {args.concurrency}")
+    reports = asyncio.run(main_async(args))
+    print_report(reports)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from deadline import DeadlineExceeded
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 连续失败多少次后熔断，熔断多少秒后进入半开状态试探
+DEFAULT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+DEFAULT_RECOVERY_TIMEOUT = float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "30"))
+DEFAULT_HALF_OPEN_MAX_CALLS = int(os.getenv("CIRCUIT_HALF_OPEN_MAX_CALLS", "1"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """熔断器处于打开状态，请求被直接拒绝"""
+
+    def __init__(self, name: str):
+        super().__init__(f"熔断器 {name} 已打开，跳过请求")
+        self.name = name
+
+
+class CircuitBreaker:
+    """单个上游或单个策略的熔断器
+
+    连续失败达到阈值后打开，打开期间的调用立即失败；经过恢复时间后进入半开状态，
+    只放行少量试探请求，试探成功则关闭，失败则重新打开。
+    """
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+                 half_open_max_calls: int = DEFAULT_HALF_OPEN_MAX_CALLS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """判断是否放行本次调用；放行半开试探时占用一个试探名额"""
+        if self.state == OPEN:
+            if time.time() - self.opened_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self.state = HALF_OPEN
+            self.half_open_calls = 0
+            logger.info("熔断器 %s 进入半开状态，开始试探", self.name)
+        if self.state == HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                self.rejected += 1
+                return False
+            self.half_open_calls += 1
+        return True
+
+    def on_success(self):
+        if self.state == HALF_OPEN:
+            logger.info("熔断器 %s 试探成功，恢复关闭状态", self.name)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.half_open_calls = 0
+
+    def on_failure(self):
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning("熔断器 %s 打开: 连续失败 %s 次", self.name, self.consecutive_failures)
+            self.state = OPEN
+            self.opened_at = time.time()
+            self.half_open_calls = 0
+
+    def on_cancel(self):
+        """调用被取消或请求时限用完时不计成败，只归还半开试探名额"""
+        if self.state == HALF_OPEN and self.half_open_calls > 0:
+            self.half_open_calls -= 1
+
+    async def call(self, factory: Callable[[], Awaitable[Any]],
+                   is_failure: Optional[Callable[[Any], bool]] = None) -> Any:
+        """在熔断器保护下执行调用；打开时抛出 CircuitOpenError
+
+        is_failure 用于把"正常返回但结果无效"（如5xx状态码、空结果）也计为失败。
+        """
+        if not self.allow():
+            raise CircuitOpenError(self.name)
+        try:
+            result = await factory()
+        except (asyncio.CancelledError, DeadlineExceeded):
+            # 调用方取消或请求时限用完不代表上游故障
+            self.on_cancel()
+            raise
+        except Exception:
+            self.on_failure()
+            raise
+        if is_failure is not None and is_failure(result):
+            self.on_failure()
+        else:
+            self.on_success()
+        return result
+
+    def snapshot(self) -> Dict:
+        retry_in = 0
+        if self.state == OPEN:
+            retry_in = max(0, int(self.opened_at + self.recovery_timeout - time.time()))
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'rejected': self.rejected,
+            'retry_in': retry_in
+        }
+
+
+class CircuitBreakerRegistry:
+    """按名称管理熔断器：上游（github_api / github_web / deepseek）和策略（如 contributors.api）"""
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+                 half_open_max_calls: int = DEFAULT_HALF_OPEN_MAX_CALLS):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, self.failure_threshold, self.recovery_timeout, self.half_open_max_calls)
+            self._breakers[name] = breaker
+        return breaker
+
+    def any_open(self) -> bool:
+        return any(breaker.state == OPEN for breaker in self._breakers.values())
+
+    def snapshot(self) -> Dict:
+        return {name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())}
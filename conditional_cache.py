@@ -0,0 +1,96 @@
+import os
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+from yarl import URL
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 缓存的响应条数上限和单条响应体大小上限（字节）
+DEFAULT_MAX_ENTRIES = int(os.getenv("GITHUB_ETAG_CACHE_SIZE", "2048"))
+DEFAULT_MAX_BODY_BYTES = int(os.getenv("GITHUB_ETAG_CACHE_MAX_BODY", str(512 * 1024)))
+
+
+class CachedResponse:
+    """带校验器的已缓存响应"""
+
+    __slots__ = ('etag', 'last_modified', 'body')
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+
+
+class ConditionalRequestCache:
+    """api.github.com 条件请求缓存（ETag / Last-Modified）
+
+    为每个响应保存校验器和响应体，再次请求时发送 If-None-Match / If-Modified-Since，
+    收到304时直接返回已保存的响应体。GitHub 不把304计入限流额度，
+    因此变化缓慢的仓库信息、贡献者列表和搜索结果几乎不再消耗 API 额度。
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_body_bytes: int = DEFAULT_MAX_BODY_BYTES):
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self.not_modified = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict], headers: Dict) -> str:
+        full_url = URL(url).update_query(params) if params else URL(url)
+        return f"{headers.get('Accept', '')} {full_url}"
+
+    def _validators(self, key: str) -> Dict[str, str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        validators = {}
+        if entry.etag:
+            validators['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            validators['If-Modified-Since'] = entry.last_modified
+        return validators
+
+    def _store(self, key: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        if not (etag or last_modified) or len(body) > self.max_body_bytes:
+            return
+        self._entries[key] = CachedResponse(etag, last_modified, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None,
+                  headers: Optional[Dict] = None,
+                  timeout: Optional[aiohttp.ClientTimeout] = None) -> Tuple[int, bytes]:
+        """发起条件GET请求，返回 (状态码, 响应体)；304时返回 (200, 已缓存的响应体)"""
+        headers = dict(headers or {})
+        key = self._key(url, params, headers)
+        headers.update(self._validators(key))
+
+        async with session.get(url, params=params, headers=headers, timeout=timeout) as response:
+            # 始终读完响应体，使连接可以归还连接池复用
+            body = await response.read()
+            if response.status == 304:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.not_modified += 1
+                    logger.info("条件请求命中(304)，使用缓存响应: %s", url)
+                    return 200, entry.body
+            if response.status == 200:
+                self.misses += 1
+                self._store(key, response.headers.get('ETag'), response.headers.get('Last-Modified'), body)
+            return response.status, body
+
+    def stats(self) -> Dict:
+        """返回304命中次数、完整下载次数和缓存条数"""
+        return {
+            'entries': len(self._entries),
+            'not_modified': self.not_modified,
+            'full_responses': self.misses
+        }
@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 是否启用持久化存储
+CRAWL_STORE_ENABLED = os.getenv("CRAWL_STORE_ENABLED", "true").lower() == "true"
+# SQLite 数据库文件路径；部署在 Railway 等平台时应挂载持久卷到该目录，否则重新部署后仍会丢失
+DEFAULT_CRAWL_STORE_PATH = os.getenv("CRAWL_STORE_PATH", "data/crawl_store.sqlite3")
+# 超过该时长（秒）的记录在启动时删除，默认7天
+DEFAULT_CRAWL_STORE_RETENTION = float(os.getenv("CRAWL_STORE_RETENTION", str(7 * 24 * 3600)))
+# 多个进程同时写入时等待锁的时间（毫秒）
+BUSY_TIMEOUT_MS = 5000
+
+# 数据库结构版本（PRAGMA user_version）；结构变化时增加版本号并在 MIGRATIONS 中追加升级语句
+SCHEMA_VERSION = 1
+MIGRATIONS = {
+    1: [
+        """CREATE TABLE IF NOT EXISTS results (
+            key TEXT PRIMARY KEY,
+            entity TEXT NOT NULL,
+            value TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS results_entity_fetched_at ON results (entity, fetched_at)",
+    ],
+}
+
+
+def encode_key(key: Hashable) -> str:
+    """把结果缓存的键（方法名和参数组成的元组）编码为字符串主键"""
+    return json.dumps(list(key) if isinstance(key, tuple) else key, ensure_ascii=False, default=str)
+
+
+def decode_key(raw: str) -> Hashable:
+    """encode_key 的逆操作；参数中的 (name, value) 关键字参数对还原为元组"""
+    value = json.loads(raw)
+    if isinstance(value, list):
+        return tuple(tuple(item) if isinstance(item, list) else item for item in value)
+    return value
+
+
+class CrawlStore:
+    """SQLite 持久化存储：保存仓库信息、贡献者列表、用户资料和 AI 推荐结果，服务重启或重新部署后仍可读取
+
+    每条记录保存实体类型、JSON 编码的结果和抓取时间（Unix 时间戳），由结果缓存决定记录是否仍然有效。
+    使用 WAL 日志模式，多个 worker 进程可以同时读取，写入不阻塞读取；
+    数据库结构版本记录在 PRAGMA user_version 中，打开时按版本依次执行升级语句。
+    所有数据库错误只记录日志，不影响请求处理（退化为没有持久化存储）。
+    """
+
+    def __init__(self, path: str = DEFAULT_CRAWL_STORE_PATH, enabled: bool = CRAWL_STORE_ENABLED,
+                 retention: float = DEFAULT_CRAWL_STORE_RETENTION):
+        self.path = path
+        self.retention = retention
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.reads = 0
+        self.hits = 0
+        self.writes = 0
+        self.errors = 0
+        if enabled:
+            try:
+                self._conn = self._open()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("无法打开持久化存储 %s，不再持久化抓取结果: %s", path, e)
+                self.enabled = False
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        # WAL 模式下 NORMAL 只在检查点时同步磁盘，进程崩溃不会损坏数据库，最多丢失最近的写入
+        conn.execute("PRAGMA synchronous = NORMAL")
+        self._migrate(conn)
+        if self.retention > 0:
+            deleted = conn.execute("DELETE FROM results WHERE fetched_at < ?", (time.time() - self.retention,)).rowcount
+            if deleted:
+                logger.info("持久化存储删除 %s 条过期记录", deleted)
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise sqlite3.DatabaseError(f"数据库结构版本 {version} 高于当前支持的版本 {SCHEMA_VERSION}")
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            with conn:
+                conn.execute("BEGIN")
+                for statement in MIGRATIONS[target]:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {target}")
+            logger.info("持久化存储结构升级到版本 %s", target)
+
+    def load(self, key: Hashable, max_age: float) -> Optional[Tuple[Any, float]]:
+        """读取不超过 max_age 秒的记录，返回 (结果, 抓取时间)；没有时返回 None"""
+        if not self.enabled:
+            return None
+        self.reads += 1
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, fetched_at FROM results WHERE key = ? AND fetched_at >= ?",
+                    (encode_key(key), time.time() - max_age)
+                ).fetchone()
+            if row is None:
+                return None
+            self.hits += 1
+            return json.loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError) as e:
+            self.errors += 1
+            logger.warning("读取持久化存储失败: %s", e)
+            return None
+
+    def save(self, entity: str, key: Hashable, value: Any, fetched_at: Optional[float] = None):
+        """写入（或覆盖）一条记录"""
+        if not self.enabled:
+            return
+        try:
+            encoded = json.dumps(value, ensure_ascii=False, default=str)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (key, entity, value, fetched_at) VALUES (?, ?, ?, ?)",
+                    (encode_key(key), entity, encoded, fetched_at or time.time())
+                )
+            self.writes += 1
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.errors += 1
+            logger.warning("写入持久化存储失败: %s", e)
+
+    def delete(self, key: Hashable):
+        """删除一条记录（不存在时忽略）"""
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM results WHERE key = ?", (encode_key(key),))
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("删除持久化存储记录失败: %s", e)
+
+    def trim(self, entity: str, max_entries: int):
+        """某类实体只保留最近抓取的 max_entries 条记录"""
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM results WHERE entity = ? AND key NOT IN "
+                    "(SELECT key FROM results WHERE entity = ? ORDER BY fetched_at DESC LIMIT ?)",
+                    (entity, entity, max_entries)
+                )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("清理持久化存储失败: %s", e)
+
+    def recent(self, entity: str, max_age: float, limit: int) -> Iterator[Tuple[Hashable, Any, float]]:
+        """按抓取时间从新到旧返回某类实体不超过 max_age 秒的记录 (键, 结果, 抓取时间)，用于启动时预热"""
+        if not self.enabled:
+            return iter(())
+        try:
+            with self._lock:
+                rows: List[Tuple[str, str, float]] = self._conn.execute(
+                    "SELECT key, value, fetched_at FROM results WHERE entity = ? AND fetched_at >= ? "
+                    "ORDER BY fetched_at DESC LIMIT ?",
+                    (entity, time.time() - max_age, limit)
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("读取持久化存储失败: %s", e)
+            return iter(())
+        return ((decode_key(key), json.loads(value), fetched_at) for key, value, fetched_at in rows)
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+            self.enabled = False
+
+    def stats(self) -> Dict:
+        """返回存储路径、记录数、读取/命中/写入次数和错误次数"""
+        entries = 0
+        if self.enabled:
+            try:
+                with self._lock:
+                    entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            except sqlite3.Error:
+                pass
+        return {
+            'enabled': self.enabled,
+            'path': self.path,
+            'schema_version': SCHEMA_VERSION,
+            'entries': entries,
+            'reads': self.reads,
+            'hits': self.hits,
+            'writes': self.writes,
+            'errors': self.errors
+        }
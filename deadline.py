@@ -0,0 +1,85 @@
+import os
+import time
+import functools
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 各接口的默认处理时限（秒）；推荐接口包含一次 AI 调用，时限更长
+DEFAULT_REQUEST_DEADLINE = float(os.getenv("REQUEST_DEADLINE_SECONDS", "30"))
+DEFAULT_RECOMMENDATION_DEADLINE = float(os.getenv("RECOMMENDATION_DEADLINE_SECONDS", "120"))
+
+# 当前请求的截止时间（time.monotonic() 时刻），None 表示不限时
+_deadline: ContextVar[Optional[float]] = ContextVar('request_deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """请求的处理时限已用完，后续的上游请求直接放弃"""
+
+    def __init__(self, operation: str = ""):
+        super().__init__(f"请求处理时限已用完，放弃: {operation}" if operation else "请求处理时限已用完")
+        self.operation = operation
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """在当前上下文中设置截止时间；已存在更早的截止时间时保留更早的那个
+
+    截止时间保存在 contextvars 中，由 asyncio 任务自动继承，
+    因此对冲策略、在途请求合并启动的任务都会沿用同一个截止时间。
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def with_deadline(seconds: float) -> Callable:
+    """接口装饰器：每次请求从接口入口开始计时，整条调用链共享同一个截止时间"""
+
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            with deadline_scope(seconds):
+                return await endpoint(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def remaining() -> Optional[float]:
+    """当前请求剩余的时间（秒）；未设置截止时间时返回 None"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """当前请求的截止时间是否已过"""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def budget(timeout: float, operation: str = "") -> float:
+    """返回本跳可用的超时时间：取固定超时和剩余时间中较小的一个
+
+    截止时间已过时抛出 DeadlineExceeded，调用方不应再发起请求。
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        logger.info("请求处理时限已用完，放弃: %s", operation)
+        raise DeadlineExceeded(operation)
+    return min(timeout, left)
@@ -1,134 +1,216 @@
 import requests
 import re
 import json
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
-import time
+from typing import List, Dict, Optional, Tuple, Callable, Awaitable, Any
 import logging
-import urllib.parse
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import aiohttp
+
+from http_pool import HTTPClientPool, GITHUB_WEB, GITHUB_API
+from html_parser import ParseRegions, make_soup, resolve_backend
+from profile_extractor import ProfileExtractor, PROFILE_REGIONS, JOIN_DATE_TEXT_MARKERS
+from selector_stats import SelectorStats
+from parse_pool import ParsePool
+import page_data
+from stream_scan import ElementTracker
+from link_classifier import LinkClassifier
+from patterns import (
+    COUNT_PATTERN, NUMBER_PATTERN, GROUPED_NUMBER_PATTERN, COMMIT_COUNT_PATTERN, USER_PATH_PATTERN,
+    COMMITS_AUTHOR_PATTERN, AT_MENTION_PATTERN, COMMIT_ITEM_CLASS_PATTERN, STARGAZERS_HREF_PATTERN,
+    FORKS_HREF_PATTERN
+)
+from rate_limit import RateLimitScheduler, CORE, SEARCH
+from token_pool import GitHubTokenPool
+from conditional_cache import ConditionalRequestCache
+from singleflight import SingleFlight, coalesced
+from result_cache import ResultCache, Missing, cached, REPOSITORY, CONTRIBUTORS, PROFILE, SEARCH as SEARCH_RESULTS
+from circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+import deadline
+from deadline import DeadlineExceeded
 
 # 设置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 上游地址，可指向本地替身服务器进行离线压测（见 stub_server.py）；
+# 返回给前端的链接（头像、主页等）始终使用 github.com
+GITHUB_WEB_BASE = os.getenv("GITHUB_WEB_BASE", "https://github.com").rstrip('/')
+GITHUB_API_BASE = os.getenv("GITHUB_API_BASE", "https://api.github.com").rstrip('/')
+
+# 视为上游异常、计入熔断失败的状态码（404等说明上游正常）
+UPSTREAM_FAILURE_STATUSES = {403, 429, 500, 502, 503, 504}
+
+# 仓库页的描述、star、fork和语言都在页头和侧栏中，只解析这两个区域
+REPOSITORY_REGIONS = ParseRegions(
+    classes=['Layout-sidebar'],
+    ids=['repository-container-header'],
+    anchor='.Layout-sidebar'
+)
+
+# 流式读取页面时每次读取的块大小
+STREAM_CHUNK_SIZE = 16 * 1024
+# 所需字段读到后，剩余响应体不超过该字节数时读完丢弃，使 keep-alive 连接可以复用；超过时关闭连接。
+# 0 表示总是关闭连接；基准见 benchmarks/bench_streaming.py
+STREAM_DRAIN_BYTES = int(os.getenv("STREAM_DRAIN_BYTES", str(512 * 1024)))
+
+
+class GitHubHTTPError(Exception):
+    """GitHub 返回了错误状态码"""
+    
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+
 
 class GitHubCrawler:
     """GitHub爬虫类，用于获取仓库和用户信息"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+    def __init__(self, web_base: Optional[str] = None, api_base: Optional[str] = None,
+                 html_parser: Optional[str] = None, selector_stats: Optional[SelectorStats] = None):
+        self.web_base = (web_base or GITHUB_WEB_BASE).rstrip('/')
+        self.api_base = (api_base or GITHUB_API_BASE).rstrip('/')
+        # HTML解析后端（lxml / html5lib / html.parser），默认由环境变量 HTML_PARSER 决定
+        self.html_parser = resolve_backend(html_parser)
+        # 各提取点的选择器命中统计，优先尝试近期命中的选择器
+        self.selector_stats = selector_stats or SelectorStats()
+        # 链接分类器：平台域名预先编成后缀索引，按主机名记住分类结果
+        self.link_classifier = LinkClassifier()
+        # 用户主页提取器：选择器预先编译，每个页面只遍历一次DOM
+        self.profile_extractor = ProfileExtractor(self._parse_count, self.link_classifier.classify_many,
+                                                  self.selector_stats)
+        self.default_headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.default_headers)
     
     def get_repository_info(self, owner: str, repo: str) -> Dict:
         """获取仓库基本信息"""
-        url = f"https://github.com/{owner}/{repo}"
+        url = f"{self.web_base}/{owner}/{repo}"
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 获取仓库描述
-            description_elem = soup.find('p', class_='f4 my-3')
-            description = description_elem.text.strip() if description_elem else None
-            
-            # 获取star数量 - 使用多种选择器策略
-            stars = 0
-            # 策略1: 通过href属性查找
-            stars_elem = soup.find('a', {'href': f'/{owner}/{repo}/stargazers'})
-            if stars_elem:
-                stars_text = stars_elem.text.strip()
-                stars = self._parse_count(stars_text)
-            else:
-                # 策略2: 通过id属性查找
-                stars_elem = soup.find('a', {'id': 'repo-stars-counter-star'})
-                if stars_elem:
-                    stars_text = stars_elem.text.strip()
-                    stars = self._parse_count(stars_text)
-                else:
-                    # 策略3: 通过包含stargazers的链接查找
-                    stars_elem = soup.find('a', href=re.compile(r'/stargazers$'))
-                    if stars_elem:
-                        stars_text = stars_elem.text.strip()
-                        stars = self._parse_count(stars_text)
-            
-            # 获取fork数量 - 使用多种选择器策略
-            forks = 0
-            # 策略1: 通过href属性查找
-            forks_elem = soup.find('a', {'href': f'/{owner}/{repo}/forks'})
-            if forks_elem:
-                forks_text = forks_elem.text.strip()
-                forks = self._parse_count(forks_text)
-            else:
-                # 策略2: 通过id属性查找
-                forks_elem = soup.find('a', {'id': 'repo-network-counter'})
-                if forks_elem:
-                    forks_text = forks_elem.text.strip()
-                    forks = self._parse_count(forks_text)
-                else:
-                    # 策略3: 通过包含forks的链接查找
-                    forks_elem = soup.find('a', href=re.compile(r'/forks$'))
-                    if forks_elem:
-                        forks_text = forks_elem.text.strip()
-                        forks = self._parse_count(forks_text)
-            
-            # 获取主要语言
-            language_elem = soup.find('span', class_='color-fg-default text-bold mr-1')
-            language = language_elem.text.strip() if language_elem else None
-            
-            return {
-                'owner': owner,
-                'name': repo,
-                'full_name': f"{owner}/{repo}",
-                'description': description,
-                'stars': stars,
-                'forks': forks,
-                'language': language
-            }
+            # 流式读取，所需字段都已出现后不再下载页面剩余部分（README等）
+            with self.session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                tracker = self._repository_header_tracker(owner, repo)
+                chunks = []
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    tracker.feed_bytes(chunk)
+                    if tracker.done:
+                        break
+            return self._parse_repository_page(b''.join(chunks), owner, repo)
         
         except Exception as e:
-            logger.error(f"获取仓库信息失败: {e}")
-            return {
-                'owner': owner,
-                'name': repo,
-                'full_name': f"{owner}/{repo}",
-                'description': None,
-                'stars': 0,
-                'forks': 0,
-                'language': None
-            }
+            logger.error("获取仓库信息失败: %s", e)
+            return self._default_repository_info(owner, repo)
+    
+    def _parse_repository_page(self, content: bytes, owner: str, repo: str) -> Dict:
+        """解析仓库页面HTML，提取描述、star、fork和主要语言"""
+        # 优先使用页面内嵌的JSON数据，无需构建DOM
+        info = page_data.repository(page_data.embedded_json(content), owner, repo)
+        if info:
+            logger.info("从内嵌数据获取仓库信息: %s/%s", owner, repo)
+            return info
+        
+        soup = make_soup(content, self.html_parser, REPOSITORY_REGIONS)
+        
+        # 获取仓库描述
+        description_elem = soup.find('p', class_='f4 my-3')
+        description = description_elem.text.strip() if description_elem else None
+        
+        # 获取star和fork数量 - 使用多种选择器策略
+        stars = self._parse_counter_link(soup, 'stars', f'/{owner}/{repo}/stargazers', 'repo-stars-counter-star', STARGAZERS_HREF_PATTERN)
+        forks = self._parse_counter_link(soup, 'forks', f'/{owner}/{repo}/forks', 'repo-network-counter', FORKS_HREF_PATTERN)
+        
+        # 获取主要语言
+        language_elem = soup.find('span', class_='color-fg-default text-bold mr-1')
+        language = language_elem.text.strip() if language_elem else None
+        
+        return {
+            'owner': owner,
+            'name': repo,
+            'full_name': f"{owner}/{repo}",
+            'description': description,
+            'stars': stars,
+            'forks': forks,
+            'language': language
+        }
+    
+    def _repository_header_tracker(self, owner: str, repo: str) -> ElementTracker:
+        """仓库页所需字段的目标元素，与 _parse_repository_page 的首选策略一致
+        
+        描述、star、fork、语言都已读到，或者页头和侧栏（部分解析的全部区域）都已读完，即可停止下载。
+        """
+        return ElementTracker(
+            {
+                'description': lambda tag, attrs: tag == 'p' and attrs.get('class') == 'f4 my-3',
+                'stars': lambda tag, attrs: tag == 'a' and attrs.get('href') == f'/{owner}/{repo}/stargazers',
+                'forks': lambda tag, attrs: tag == 'a' and attrs.get('href') == f'/{owner}/{repo}/forks',
+                'language': lambda tag, attrs: tag == 'span' and attrs.get('class') == 'color-fg-default text-bold mr-1',
+                'header': lambda tag, attrs: attrs.get('id') == 'repository-container-header',
+                'sidebar': lambda tag, attrs: 'Layout-sidebar' in (attrs.get('class') or '').split()
+            },
+            groups=[('description', 'stars', 'forks', 'language'), ('header', 'sidebar')]
+        )
+    
+    def _parse_counter_link(self, soup, field: str, href: str, element_id: str, href_pattern: re.Pattern) -> int:
+        """查找仓库页的计数链接（star/fork）并解析数值，优先尝试近期命中的策略"""
+        strategies = {
+            # 策略1: 通过href属性查找
+            'href': lambda: soup.find('a', {'href': href}),
+            # 策略2: 通过id属性查找
+            'id': lambda: soup.find('a', {'id': element_id}),
+            # 策略3: 通过href后缀查找
+            'href_suffix': lambda: soup.find('a', href=href_pattern)
+        }
+        plan = self.selector_stats.plan(f'repository.{field}', strategies)
+        _, elem = plan.first(lambda name: strategies[name]())
+        return self._parse_count(elem.text.strip()) if elem else 0
+    
+    def _default_repository_info(self, owner: str, repo: str) -> Dict:
+        """获取失败时返回的仓库基本信息"""
+        return {
+            'owner': owner,
+            'name': repo,
+            'full_name': f"{owner}/{repo}",
+            'description': None,
+            'stars': 0,
+            'forks': 0,
+            'language': None
+        }
     
     def get_contributors(self, owner: str, repo: str, limit: int = 10) -> List[Dict]:
         """获取仓库贡献者列表"""
-        logger.info(f"开始获取 {owner}/{repo} 的贡献者信息")
+        logger.info("开始获取 %s/%s 的贡献者信息", owner, repo)
         
         # 方法 1: 尝试使用 GitHub API (无需认证的公开API)
         contributors = self._try_github_api(owner, repo, limit)
         if contributors:
-            logger.info(f"通过 GitHub API 成功获取 {len(contributors)} 个贡献者")
+            logger.info("通过 GitHub API 成功获取 %s 个贡献者", len(contributors))
             return contributors
         
         # 方法 2: 解析 Contributors 页面
         contributors = self._parse_contributors_page(owner, repo, limit)
         if contributors:
-            logger.info(f"通过页面解析成功获取 {len(contributors)} 个贡献者")
+            logger.info("通过页面解析成功获取 %s 个贡献者", len(contributors))
             return contributors
         
         # 方法 3: 从 Commits 页面提取贡献者
         contributors = self._extract_from_commits(owner, repo, limit)
         if contributors:
-            logger.info(f"通过 Commits 页面成功获取 {len(contributors)} 个贡献者")
+            logger.info("通过 Commits 页面成功获取 %s 个贡献者", len(contributors))
             return contributors
         
-        logger.warning(f"所有方法都失败，返回空列表")
+        logger.warning("所有方法都失败，返回空列表")
         return []
     
     def _try_github_api(self, owner: str, repo: str, limit: int) -> List[Dict]:
         """尝试使用 GitHub 公开 API 获取贡献者"""
         try:
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/contributors?per_page={limit}"
+            api_url = f"{self.api_base}/repos/{owner}/{repo}/contributors?per_page={limit}"
             headers = {
                 'Accept': 'application/vnd.github.v3+json',
                 'User-Agent': 'GitHub-Crawler/1.0'
@@ -137,62 +219,69 @@ class GitHubCrawler:
             response = self.session.get(api_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                contributors = []
-                
-                for contributor in data:
-                    contributors.append({
-                        'username': contributor['login'],
-                        'avatar_url': contributor['avatar_url'],
-                        'contributions': contributor['contributions'],
-                        'profile_url': contributor['html_url']
-                    })
-                
-                return contributors
+                return self._parse_contributors_api(response.json())
             
         except Exception as e:
-            logger.warning(f"GitHub API 请求失败: {e}")
+            logger.warning("GitHub API 请求失败: %s", e)
         
         return []
     
+    def _parse_contributors_api(self, data: List[Dict]) -> List[Dict]:
+        """将 GitHub API 返回的贡献者列表转换为统一结构"""
+        contributors = []
+        
+        for contributor in data:
+            contributors.append({
+                'username': contributor['login'],
+                'avatar_url': contributor['avatar_url'],
+                'contributions': contributor['contributions'],
+                'profile_url': contributor['html_url']
+            })
+        
+        return contributors
+    
     def _parse_contributors_page(self, owner: str, repo: str, limit: int) -> List[Dict]:
         """解析 GitHub Contributors 页面"""
         try:
-            url = f"https://github.com/{owner}/{repo}/graphs/contributors"
+            url = f"{self.web_base}/{owner}/{repo}/graphs/contributors"
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            contributors = []
-            
-            # 多种选择器尝试
-            selectors = [
-                'li.contrib-person',
-                'div.contrib-person', 
-                'div[data-test-selector="contrib-person"]',
-                'a[href*="/commits?author="]',
-                '.js-navigation-item',
-                '[data-hovercard-type="user"]'
-            ]
-            
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    logger.info(f"使用选择器 '{selector}' 找到 {len(elements)} 个元素")
-                    contributors = self._extract_contributors_from_elements(elements, limit)
-                    if contributors:
-                        return contributors
-            
-            # 如果上面都没有成功，尝试查找 JavaScript数据
-            contributors = self._extract_from_page_data(soup, limit)
-            if contributors:
-                return contributors
+            return self._parse_contributors_html(response.content, limit)
                 
         except Exception as e:
-            logger.error(f"解析 Contributors 页面失败: {e}")
+            logger.error("解析 Contributors 页面失败: %s", e)
         
         return []
     
+    def _parse_contributors_html(self, content: bytes, limit: int) -> List[Dict]:
+        """解析 Contributors 页面HTML"""
+        # 优先查找页面内嵌的JSON数据
+        contributors = self._extract_from_page_data(content, limit)
+        if contributors:
+            return contributors
+        
+        soup = make_soup(content, self.html_parser)
+        
+        # 多种选择器尝试，优先尝试近期命中的选择器
+        selectors = [
+            'li.contrib-person',
+            'div.contrib-person', 
+            'div[data-test-selector="contrib-person"]',
+            'a[href*="/commits?author="]',
+            '.js-navigation-item',
+            '[data-hovercard-type="user"]'
+        ]
+        
+        def probe(selector: str) -> List[Dict]:
+            elements = soup.select(selector)
+            if not elements:
+                return []
+            logger.debug("使用选择器 '%s' 找到 %s 个元素", selector, len(elements))
+            return self._extract_contributors_from_elements(elements, limit)
+        
+        _, contributors = self.selector_stats.plan('contributors', selectors).first(probe)
+        return contributors or []
+    
     def _extract_contributors_from_elements(self, elements, limit: int) -> List[Dict]:
         """从 HTML元素中提取贡献者信息"""
         contributors = []
@@ -218,7 +307,7 @@ class GitHubCrawler:
                 })
                 
             except Exception as e:
-                logger.warning(f"解析第 {i} 个贡献者时出错: {e}")
+                logger.warning("解析第 %s 个贡献者时出错: %s", i, e)
                 continue
         
         return contributors
@@ -228,9 +317,9 @@ class GitHubCrawler:
         # 多种方式尝试提取用户名
         methods = [
             lambda el: el.get('data-login'),
-            lambda el: el.find('a', href=re.compile(r'^/[^/]+$')),
-            lambda el: el.find('a', href=re.compile(r'/commits\?author=')),
-            lambda el: el.find('img', alt=re.compile(r'^@')),
+            lambda el: el.find('a', href=USER_PATH_PATTERN),
+            lambda el: el.find('a', href=COMMITS_AUTHOR_PATTERN),
+            lambda el: el.find('img', alt=AT_MENTION_PATTERN),
             lambda el: el.find('[data-hovercard-type="user"]'),
         ]
         
@@ -271,727 +360,143 @@ class GitHubCrawler:
     def _extract_contributions(self, element, index: int) -> int:
         """提取贡献次数"""
         try:
-            # 多种方式查找贡献数
-            patterns = [
-                r'(\d+(?:,\d+)*)\s*commit',
-                r'(\d+(?:,\d+)*)\s*次提交',
-                r'(\d+(?:,\d+)*)',
-            ]
-            
+            # 优先取 "N commits" / "N 次提交"，没有时取第一个数字
             text = element.get_text()
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return int(match.group(1).replace(',', ''))
+            match = COMMIT_COUNT_PATTERN.search(text)
+            if match:
+                return int(match.group(1).replace(',', ''))
+            match = GROUPED_NUMBER_PATTERN.search(text)
+            if match:
+                return int(match.group(0).replace(',', ''))
         except:
             pass
         
         # 如果无法获取具体数字，根据排名给出估算值
         return max(1000 - index * 50, 10)
     
-    def _extract_from_page_data(self, soup, limit: int) -> List[Dict]:
-        """从页面数据中提取贡献者信息"""
+    def _extract_from_page_data(self, content: bytes, limit: int) -> List[Dict]:
+        """从页面内嵌的JSON数据中提取贡献者信息"""
         try:
-            # 查找可能包含贡献者数据的script标签
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string and 'contributors' in script.string.lower():
-                    # 这里可以解析JavaScript中的数据
-                    # 由于复杂性，这里简化处理
-                    pass
-        except:
-            pass
+            contributors = page_data.contributors(page_data.embedded_json(content), limit)
+            if contributors:
+                logger.info("从内嵌数据找到 %s 个贡献者", len(contributors))
+            return contributors
+        except Exception as e:
+            logger.warning("解析内嵌贡献者数据失败: %s", e)
         
         return []
     
     def _extract_from_commits(self, owner: str, repo: str, limit: int) -> List[Dict]:
         """从 Commits 页面提取贡献者信息"""
         try:
-            url = f"https://github.com/{owner}/{repo}/commits"
+            url = f"{self.web_base}/{owner}/{repo}/commits"
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            contributors_dict = {}
-            
-            # 查找提交记录
-            commit_items = soup.find_all(['div', 'li'], class_=re.compile(r'commit.*item|Box-row'))
-            
-            for commit in commit_items[:50]:  # 查看最近50个提交
-                try:
-                    # 查找作者信息
-                    author_link = commit.find('a', href=re.compile(r'^/[^/]+$'))
-                    if author_link:
-                        username = author_link.get('href').strip('/')
-                        if username and username not in contributors_dict:
-                            avatar_elem = commit.find('img', alt=re.compile(r'^@'))
-                            avatar_url = avatar_elem.get('src') if avatar_elem else f'https://github.com/{username}.png'
-                            
-                            contributors_dict[username] = {
-                                'username': username,
-                                'avatar_url': avatar_url,
-                                'contributions': 0,
-                                'profile_url': f"https://github.com/{username}"
-                            }
-                        
-                        if username in contributors_dict:
-                            contributors_dict[username]['contributions'] += 1
-                
-                except Exception as e:
-                    continue
-            
-            # 按贡献次数排序
-            contributors_list = sorted(
-                contributors_dict.values(), 
-                key=lambda x: x['contributions'], 
-                reverse=True
-            )
-            
-            return contributors_list[:limit]
+            return self._parse_commits_html(response.content, limit)
             
         except Exception as e:
-            logger.error(f"从 Commits 页面提取失败: {e}")
+            logger.error("从 Commits 页面提取失败: %s", e)
         
         return []
     
-    def _get_contributors_fallback(self, owner: str, repo: str, limit: int) -> List[Dict]:
-        """备用方法获取贡献者 - 不再使用"""
-        logger.warning("所有方法都失败，请检查仓库是否存在或是否为公开仓库")
-        return []
+    def _parse_commits_html(self, content: bytes, limit: int) -> List[Dict]:
+        """解析 Commits 页面HTML，按作者聚合提交次数"""
+        soup = make_soup(content, self.html_parser)
+        contributors_dict = {}
+        
+        # 查找提交记录
+        commit_items = soup.find_all(['div', 'li'], class_=COMMIT_ITEM_CLASS_PATTERN)
+        
+        for commit in commit_items[:50]:  # 查看最近50个提交
+            try:
+                # 查找作者信息
+                author_link = commit.find('a', href=USER_PATH_PATTERN)
+                if author_link:
+                    username = author_link.get('href').strip('/')
+                    if username and username not in contributors_dict:
+                        avatar_elem = commit.find('img', alt=AT_MENTION_PATTERN)
+                        avatar_url = avatar_elem.get('src') if avatar_elem else f'https://github.com/{username}.png'
+                        
+                        contributors_dict[username] = {
+                            'username': username,
+                            'avatar_url': avatar_url,
+                            'contributions': 0,
+                            'profile_url': f"https://github.com/{username}"
+                        }
+                    
+                    if username in contributors_dict:
+                        contributors_dict[username]['contributions'] += 1
+            
+            except Exception:
+                continue
+        
+        # 按贡献次数排序
+        contributors_list = sorted(
+            contributors_dict.values(), 
+            key=lambda x: x['contributions'], 
+            reverse=True
+        )
+        
+        return contributors_list[:limit]
     
     def get_user_profile(self, username: str) -> Dict:
         """获取用户个人资料详细信息"""
-        url = f"https://github.com/{username}"
-        logger.info(f"开始获取用户 {username} 的详细资料")
+        url = f"{self.web_base}/{username}"
+        logger.info("开始获取用户 %s 的详细资料", username)
         
         try:
             response = self.session.get(url, timeout=15)  # 增加超时时间
             response.raise_for_status()
+            logger.info("成功获取 %s 的页面内容", username)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            logger.info(f"成功获取 {username} 的页面内容")
-            
-            # 初始化用户资料结构
-            profile = self._initialize_profile_structure(username)
-            
-            # 获取基本信息
-            self._extract_basic_info(soup, profile)
-            
-            # 获取统计信息
-            self._extract_user_stats(soup, profile)
-            
-            # 获取详细联系信息和社交链接
-            contact_info = self._extract_comprehensive_contact_info(soup)
-            
-            # 将联系信息整合到主资料中
-            self._merge_contact_info_to_profile(profile, contact_info)
-            
-            # 获取额外信息
-            self._extract_additional_profile_data(soup, profile)
-            
-            logger.info(f"成功获取 {username} 的完整资料")
+            profile = self._parse_user_profile_page(response.content, username)
+            logger.info("成功获取 %s 的完整资料", username)
             return profile
         
         except Exception as e:
-            logger.error(f"获取用户资料失败: {e}")
+            logger.error("获取用户资料失败: %s", e)
             return self._get_fallback_profile(username)
     
-    def _get_contact_info(self, soup: BeautifulSoup) -> Dict:
-        """获取详细的联系信息和社交链接"""
-        contact_info = {
-            'company': None,
-            'location': None,
-            'email': None,
-            'blog': None,
-            'twitter': None,
-            'linkedin': None,
-            'mastodon': None,
-            'github_username': None,
-            'website': None,
-            'social_links': {},
-            'contact_links': {},
-            'all_links': [],
-            'raw_profile_text': ''
-        }
+    def _parse_user_profile_page(self, content: bytes, username: str) -> Dict:
+        """解析用户主页HTML，生成完整的用户资料"""
+        soup = make_soup(content, self.html_parser, PROFILE_REGIONS)
         
-        try:
-            # 多种方式查找个人资料区域
-            profile_selectors = [
-                'div.js-profile-editable-area',
-                'div[data-test-selector="profile-bio"]',
-                '.vcard-details',
-                '.js-profile-editable-replace',
-                '.user-profile-nav',
-                '.Layout-sidebar .BorderGrid-cell',
-                '.js-sticky .BorderGrid-cell'
-            ]
-            
-            profile_details = None
-            for selector in profile_selectors:
-                profile_details = soup.select_one(selector)
-                if profile_details:
-                    logger.info(f"找到个人资料区域，使用选择器: {selector}")
-                    break
-            
-            # 如果没找到特定区域，使用整个页面
-            if not profile_details:
-                profile_details = soup
-                logger.info("使用整个页面作为个人资料区域")
-            
-            # 保存原始文本用于调试
-            contact_info['raw_profile_text'] = profile_details.get_text()[:500] if profile_details else ''
-            
-            # 获取所有链接并分类
-            all_links = profile_details.find_all('a', href=True) if profile_details else []
-            logger.info(f"找到 {len(all_links)} 个链接")
-            
-            for link in all_links:
-                href = link.get('href', '').strip()
-                text = link.get_text().strip()
-                
-                # 跳过空链接和相对链接
-                if not href or href.startswith('#') or href.startswith('/'):
-                    continue
-                
-                # 记录所有链接
-                contact_info['all_links'].append({
-                    'url': href,
-                    'text': text,
-                    'title': link.get('title', '')
-                })
-                
-                # 分类不同类型的链接
-                href_lower = href.lower()
-                
-                # 社交媒体平台识别
-                if 'twitter.com' in href_lower or 'x.com' in href_lower:
-                    contact_info['twitter'] = href
-                    contact_info['social_links']['twitter'] = href
-                    # 提取用户名
-                    username = href.split('/')[-1] if '/' in href else ''
-                    if username:
-                        contact_info['social_links']['twitter_username'] = username
-                    logger.info(f"找到 Twitter 链接: {href} (用户名: {username})")
-                    
-                elif 'linkedin.com' in href_lower:
-                    contact_info['linkedin'] = href
-                    contact_info['social_links']['linkedin'] = href
-                    # 提取LinkedIn用户名或公司名
-                    if '/in/' in href_lower:
-                        username = href.split('/in/')[-1].split('/')[0] if '/in/' in href else ''
-                        contact_info['social_links']['linkedin_username'] = username
-                    elif '/company/' in href_lower:
-                        company = href.split('/company/')[-1].split('/')[0] if '/company/' in href else ''
-                        contact_info['social_links']['linkedin_company'] = company
-                    logger.info(f"找到 LinkedIn 链接: {href}")
-                    
-                elif any(platform in href_lower for platform in ['mastodon', 'mas.to', 'fosstodon', 'mstdn']):
-                    contact_info['mastodon'] = href
-                    contact_info['social_links']['mastodon'] = href
-                    # 提取Mastodon用户名和实例
-                    if '@' in href:
-                        parts = href.split('@')
-                        if len(parts) >= 2:
-                            contact_info['social_links']['mastodon_username'] = parts[-2]
-                            contact_info['social_links']['mastodon_instance'] = parts[-1]
-                    logger.info(f"找到 Mastodon 链接: {href}")
-                    
-                # 其他社交平台
-                elif 'github.com' in href_lower and '/github.com/' in href:
-                    # GitHub个人页面
-                    username = href.split('github.com/')[-1].split('/')[0] if 'github.com/' in href else ''
-                    if username and username not in ['orgs', 'organizations']:
-                        contact_info['github_username'] = username
-                        contact_info['social_links']['github'] = href
-                        logger.info(f"找到 GitHub 用户: {username}")
-                        
-                elif any(platform in href_lower for platform in ['instagram.com', 'facebook.com', 'youtube.com', 'tiktok.com']):
-                    platform_name = None
-                    if 'instagram.com' in href_lower:
-                        platform_name = 'instagram'
-                    elif 'facebook.com' in href_lower:
-                        platform_name = 'facebook'
-                    elif 'youtube.com' in href_lower:
-                        platform_name = 'youtube'
-                    elif 'tiktok.com' in href_lower:
-                        platform_name = 'tiktok'
-                    
-                    if platform_name:
-                        contact_info['social_links'][platform_name] = href
-                        logger.info(f"找到 {platform_name.title()} 链接: {href}")
-                        
-                # 专业平台
-                elif any(platform in href_lower for platform in ['stackoverflow.com', 'dev.to', 'medium.com', 'hashnode']):
-                    platform_name = None
-                    if 'stackoverflow.com' in href_lower:
-                        platform_name = 'stackoverflow'
-                    elif 'dev.to' in href_lower:
-                        platform_name = 'devto'
-                    elif 'medium.com' in href_lower:
-                        platform_name = 'medium'
-                    elif 'hashnode' in href_lower:
-                        platform_name = 'hashnode'
-                    
-                    if platform_name:
-                        contact_info['social_links'][platform_name] = href
-                        logger.info(f"找到 {platform_name.title()} 链接: {href}")
-                        
-                # 邮箱
-                elif 'mailto:' in href_lower:
-                    email = href.replace('mailto:', '')
-                    contact_info['email'] = email
-                    contact_info['contact_links']['email'] = href
-                    logger.info(f"找到邮箱: {email}")
-                    
-                # 个人网站/博客
-                elif any(domain in href_lower for domain in ['.dev', '.io', '.com', '.org', '.net', '.me', '.co', '.blog']):
-                    # 排除已知的社交平台
-                    excluded_domains = [
-                        'github.com', 'twitter.com', 'x.com', 'linkedin.com', 'instagram.com', 
-                        'facebook.com', 'youtube.com', 'tiktok.com', 'stackoverflow.com',
-                        'medium.com', 'dev.to', 'mastodon', 'fosstodon'
-                    ]
-                    
-                    if not any(excluded in href_lower for excluded in excluded_domains):
-                        if not contact_info['blog']:
-                            contact_info['blog'] = href
-                            contact_info['website'] = href
-                            contact_info['contact_links']['website'] = href
-                            logger.info(f"找到个人网站: {href}")
-                        else:
-                            # 如果已有主网站，添加为额外链接
-                            contact_info['social_links']['additional_website'] = href
-                            logger.info(f"找到额外网站: {href}")
-            
-            # 使用多种选择器查找带有图标的信息项
-            info_selectors = [
-                'li.vcard-detail',
-                '.vcard-detail',
-                'li[itemprop]',
-                '.js-profile-editable-area li',
-                '.BorderGrid-cell li',
-                '[data-test-selector="profile-bio"] li'
-            ]
-            
-            info_items = []
-            for selector in info_selectors:
-                items = profile_details.select(selector) if profile_details else []
-                info_items.extend(items)
-                if items:
-                    logger.info(f"使用选择器 {selector} 找到 {len(items)} 个信息项")
-            
-            # 去重
-            seen_items = set()
-            unique_items = []
-            for item in info_items:
-                item_text = item.get_text().strip()
-                if item_text and item_text not in seen_items:
-                    unique_items.append(item)
-                    seen_items.add(item_text)
-            
-            logger.info(f"处理 {len(unique_items)} 个唯一信息项")
-            
-            for item in unique_items:
-                item_text = item.get_text().strip()
-                logger.info(f"处理信息项: {item_text}")
-                
-                # 检查SVG图标类型
-                svg_elem = item.find('svg')
-                if svg_elem:
-                    # 通过SVG的class或aria-label判断类型
-                    svg_classes = ' '.join(svg_elem.get('class', []))
-                    aria_label = svg_elem.get('aria-label', '').lower()
-                    
-                    # 公司信息
-                    if any(keyword in svg_classes.lower() for keyword in ['organization', 'building']) or 'organization' in aria_label:
-                        if item_text and not contact_info['company']:
-                            contact_info['company'] = item_text
-                            logger.info(f"找到公司信息: {item_text}")
-                    
-                    # 位置信息
-                    elif any(keyword in svg_classes.lower() for keyword in ['location', 'geo']) or 'location' in aria_label:
-                        if item_text and not contact_info['location']:
-                            contact_info['location'] = item_text
-                            logger.info(f"找到位置信息: {item_text}")
-                    
-                    # 邮箱信息
-                    elif any(keyword in svg_classes.lower() for keyword in ['mail', 'email']) or 'mail' in aria_label:
-                        email_link = item.find('a', href=lambda x: x and 'mailto:' in x)
-                        if email_link:
-                            email = email_link.get('href').replace('mailto:', '')
-                            contact_info['email'] = email
-                            contact_info['contact_links']['email'] = email_link.get('href')
-                            logger.info(f"找到邮箱信息: {email}")
-                    
-                    # 网站/博客
-                    elif any(keyword in svg_classes.lower() for keyword in ['link', 'globe']) or 'link' in aria_label:
-                        website_link = item.find('a', href=True)
-                        if website_link and not contact_info['blog']:
-                            url = website_link.get('href')
-                            contact_info['blog'] = url
-                            contact_info['website'] = url
-                            contact_info['contact_links']['website'] = url
-                            logger.info(f"找到网站信息: {url}")
-                
-                # 备用方法：通过文本内容判断
-                if not any([contact_info.get('company'), contact_info.get('location')]):
-                    # 如果包含@符号且不是邮箱，可能是公司
-                    if '@' in item_text and 'mailto:' not in str(item):
-                        if not contact_info['company']:
-                            contact_info['company'] = item_text
-                            logger.info(f"通过@符号识别公司: {item_text}")
-                    # 如果包含地理位置关键词
-                    elif any(geo_word in item_text.lower() for geo_word in ['university', '大学', 'city', '市', 'country', '国']):
-                        if not contact_info['location']:
-                            contact_info['location'] = item_text
-                            logger.info(f"通过关键词识别位置: {item_text}")
-            
-            # 额外的备用解析策略
-            self._apply_fallback_strategies(soup, contact_info)
-        
-        except Exception as e:
-            logger.warning(f"解析联系信息时出错: {e}")
+        # 初始化用户资料结构
+        profile = self._initialize_profile_structure(username)
         
-        # 记录最终结果
-        logger.info(f"联系信息解析完成: company={contact_info.get('company')}, location={contact_info.get('location')}, email={contact_info.get('email')}, social_links={len(contact_info.get('social_links', {}))}")
-        
-        return contact_info
-    
-    def _apply_fallback_strategies(self, soup: BeautifulSoup, contact_info: Dict):
-        """应用备用解析策略"""
-        try:
-            # 策略1: 通过aria-label属性查找信息
-            aria_elements = soup.find_all(attrs={'aria-label': True})
-            for elem in aria_elements:
-                aria_label = elem.get('aria-label', '').lower()
-                elem_text = elem.get_text().strip()
-                
-                if 'location' in aria_label and elem_text and not contact_info.get('location'):
-                    contact_info['location'] = elem_text
-                    logger.info(f"通过aria-label找到位置: {elem_text}")
-                elif 'organization' in aria_label and elem_text and not contact_info.get('company'):
-                    contact_info['company'] = elem_text
-                    logger.info(f"通过aria-label找到公司: {elem_text}")
-                elif 'email' in aria_label or 'mail' in aria_label:
-                    email_link = elem.find('a', href=lambda x: x and 'mailto:' in x)
-                    if email_link and not contact_info.get('email'):
-                        email = email_link.get('href').replace('mailto:', '')
-                        contact_info['email'] = email
-                        logger.info(f"通过aria-label找到邮箱: {email}")
-            
-            # 策略2: 查找包含特定文本模式的元素
-            all_text = soup.get_text()
-            
-            # 查找邮箱模式
-            if not contact_info.get('email'):
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                email_matches = re.findall(email_pattern, all_text)
-                if email_matches:
-                    # 过滤掉常见的无效邮箱
-                    valid_emails = [email for email in email_matches 
-                                  if not any(invalid in email.lower() for invalid in 
-                                           ['example.com', 'test.com', 'noreply', 'no-reply'])]
-                    if valid_emails:
-                        contact_info['email'] = valid_emails[0]
-                        logger.info(f"通过正则表达式找到邮箱: {valid_emails[0]}")
-            
-            # 策略3: 查找特定的CSS类名
-            css_class_mappings = {
-                'location': ['user-location', 'profile-location', 'vcard-location'],
-                'company': ['user-company', 'profile-company', 'vcard-organization'],
-                'email': ['user-email', 'profile-email', 'vcard-email'],
-                'website': ['user-website', 'profile-website', 'vcard-url']
-            }
-            
-            for info_type, class_names in css_class_mappings.items():
-                if contact_info.get(info_type):
-                    continue
-                    
-                for class_name in class_names:
-                    elements = soup.find_all(class_=lambda x: x and class_name in str(x))
-                    for elem in elements:
-                        elem_text = elem.get_text().strip()
-                        if elem_text:
-                            if info_type == 'email' and '@' in elem_text:
-                                contact_info['email'] = elem_text
-                                logger.info(f"通过CSS类名找到邮箱: {elem_text}")
-                                break
-                            elif info_type in ['location', 'company'] and len(elem_text) > 2:
-                                contact_info[info_type] = elem_text
-                                logger.info(f"通过CSS类名找到{info_type}: {elem_text}")
-                                break
-                            elif info_type == 'website':
-                                link = elem.find('a', href=True)
-                                if link and not contact_info.get('blog'):
-                                    url = link.get('href')
-                                    contact_info['blog'] = url
-                                    contact_info['website'] = url
-                                    logger.info(f"通过CSS类名找到网站: {url}")
-                                    break
-            
-            # 策略4: 查找data属性
-            data_elements = soup.find_all(attrs=lambda x: any(attr.startswith('data-') for attr in x.keys()) if x else False)
-            for elem in data_elements:
-                for attr, value in elem.attrs.items():
-                    if attr.startswith('data-') and isinstance(value, str):
-                        attr_lower = attr.lower()
-                        value_lower = value.lower()
-                        
-                        if 'location' in attr_lower or 'location' in value_lower:
-                            elem_text = elem.get_text().strip()
-                            if elem_text and not contact_info.get('location'):
-                                contact_info['location'] = elem_text
-                                logger.info(f"通过data属性找到位置: {elem_text}")
-                        elif 'company' in attr_lower or 'organization' in attr_lower:
-                            elem_text = elem.get_text().strip()
-                            if elem_text and not contact_info.get('company'):
-                                contact_info['company'] = elem_text
-                                logger.info(f"通过data属性找到公司: {elem_text}")
-            
-            # 策略5: 查找微格式数据
-            microformat_selectors = {
-                'location': ['[itemprop="address"]', '[itemprop="location"]', '.p-locality', '.h-adr'],
-                'company': ['[itemprop="worksFor"]', '[itemprop="affiliation"]', '.p-org', '.h-card .p-org'],
-                'email': ['[itemprop="email"]', '.u-email'],
-                'website': ['[itemprop="url"]', '.u-url']
-            }
-            
-            for info_type, selectors in microformat_selectors.items():
-                if contact_info.get(info_type):
-                    continue
-                    
-                for selector in selectors:
-                    elements = soup.select(selector)
-                    for elem in elements:
-                        if info_type == 'email':
-                            if elem.name == 'a' and elem.get('href', '').startswith('mailto:'):
-                                email = elem.get('href').replace('mailto:', '')
-                                contact_info['email'] = email
-                                logger.info(f"通过微格式找到邮箱: {email}")
-                                break
-                        elif info_type == 'website':
-                            if elem.name == 'a' and elem.get('href'):
-                                url = elem.get('href')
-                                if not contact_info.get('blog'):
-                                    contact_info['blog'] = url
-                                    contact_info['website'] = url
-                                    logger.info(f"通过微格式找到网站: {url}")
-                                    break
-                        else:
-                            elem_text = elem.get_text().strip()
-                            if elem_text:
-                                contact_info[info_type] = elem_text
-                                logger.info(f"通过微格式找到{info_type}: {elem_text}")
-                                break
+        # 单次遍历DOM，获取基本信息、统计信息、额外信息以及联系信息和社交链接
+        contact_info = self.profile_extractor.extract(soup, profile)
         
-        except Exception as e:
-            logger.warning(f"备用解析策略执行失败: {e}")
-    
-    def _get_user_stats(self, soup: BeautifulSoup) -> Dict:
-        """获取用户统计信息"""
-        stats = {
-            'followers': 0,
-            'following': 0,
-            'public_repos': 0
-        }
+        # 部分解析时解析区域之外的 "Joined …" 文本不在DOM中，页面含有该文本却没找到加入日期时完整解析一次
+        if (soup.parse_only is not None and 'join_date' not in profile['additional_info']
+                and any(marker in content for marker in JOIN_DATE_TEXT_MARKERS)):
+            self.profile_extractor.fill_join_date(make_soup(content, self.html_parser), profile)
         
-        try:
-            # 多种方式查找 followers
-            followers_selectors = [
-                'a[href*="?tab=followers"]',
-                'a[href*="followers"]',
-                '[data-tab-item="followers"]',
-                '.js-profile-tab[data-tab-item="followers"]'
-            ]
-            
-            for selector in followers_selectors:
-                followers_elem = soup.select_one(selector)
-                if followers_elem:
-                    followers_text = followers_elem.get_text().strip()
-                    logger.info(f"找到 followers 元素，原始文本: '{followers_text}'")
-                    stats['followers'] = self._parse_count(followers_text)
-                    logger.info(f"followers 解析结果: {stats['followers']}")
-                    break
-            
-            # 多种方式查找 following
-            following_selectors = [
-                'a[href*="?tab=following"]',
-                'a[href*="following"]',
-                '[data-tab-item="following"]',
-                '.js-profile-tab[data-tab-item="following"]'
-            ]
-            
-            for selector in following_selectors:
-                following_elem = soup.select_one(selector)
-                if following_elem:
-                    following_text = following_elem.get_text().strip()
-                    logger.info(f"找到 following 元素，原始文本: '{following_text}'")
-                    stats['following'] = self._parse_count(following_text)
-                    logger.info(f"following 解析结果: {stats['following']}")
-                    break
-            
-            # 多种方式查找 repositories
-            repos_selectors = [
-                'a[href*="?tab=repositories"]',
-                'a[href*="repositories"]',
-                '[data-tab-item="repositories"]',
-                '.js-profile-tab[data-tab-item="repositories"]'
-            ]
-            
-            for selector in repos_selectors:
-                repos_elem = soup.select_one(selector)
-                if repos_elem:
-                    repos_text = repos_elem.get_text().strip()
-                    logger.info(f"找到 repositories 元素，原始文本: '{repos_text}'")
-                    stats['public_repos'] = self._parse_count(repos_text)
-                    logger.info(f"repositories 解析结果: {stats['public_repos']}")
-                    break
-            
-            # 备用方法：查找数字文本
-            if stats['followers'] == 0 or stats['following'] == 0 or stats['public_repos'] == 0:
-                self._parse_stats_from_text(soup, stats)
+        # 将联系信息整合到主资料中
+        self._merge_contact_info_to_profile(profile, contact_info)
         
-        except Exception as e:
-            logger.warning(f"解析用户统计信息时出错: {e}")
+        # 主页的社交链接等只在HTML中，内嵌数据中的用户对象只用于补全缺失的字段
+        embedded_user = page_data.user(page_data.embedded_json(content), username)
+        if embedded_user:
+            self._merge_embedded_user(profile, embedded_user)
         
-        logger.info(f"最终统计信息: {stats}")
-        return stats
+        return profile
     
-    def _parse_stats_from_text(self, soup: BeautifulSoup, stats: Dict):
-        """备用方法：从文本中解析统计信息"""
-        try:
-            # 查找包含数字的所有文本
-            all_text = soup.get_text()
-            
-            # 查找 followers 模式
-            followers_patterns = [
-                r'(\d+(?:\.\d+)?[kKmMbB]?)\s*[Ff]ollowers?',
-                r'[Ff]ollowers?[^\d]*(\d+(?:\.\d+)?[kKmMbB]?)',
-                r'(\d+(?:\.\d+)?[kKmMbB]?)\s*关注者'
-            ]
-            
-            for pattern in followers_patterns:
-                match = re.search(pattern, all_text)
-                if match and stats['followers'] == 0:
-                    followers_text = match.group(1)
-                    stats['followers'] = self._parse_count(followers_text)
-                    logger.info(f"从文本中解析到 followers: '{followers_text}' -> {stats['followers']}")
-                    break
-            
-            # 查找 following 模式
-            following_patterns = [
-                r'(\d+(?:\.\d+)?[kKmMbB]?)\s*[Ff]ollowing',
-                r'[Ff]ollowing[^\d]*(\d+(?:\.\d+)?[kKmMbB]?)',
-                r'(\d+(?:\.\d+)?[kKmMbB]?)\s*关注中'
-            ]
-            
-            for pattern in following_patterns:
-                match = re.search(pattern, all_text)
-                if match and stats['following'] == 0:
-                    following_text = match.group(1)
-                    stats['following'] = self._parse_count(following_text)
-                    logger.info(f"从文本中解析到 following: '{following_text}' -> {stats['following']}")
-                    break
-        
-        except Exception as e:
-            logger.warning(f"备用解析方法失败: {e}")
-    
-    def _parse_profile_elements(self, container) -> Dict:
-        """解析个人资料容器中的详细信息"""
-        elements = {
-            'raw_html': str(container),
-            'extracted_info': {},
-            'contact_methods': [],
-            'social_accounts': [],
-            'additional_links': []
-        }
-        
-        try:
-            # 获取所有有用的信息
-            for elem in container.find_all(['div', 'span', 'a', 'li'], recursive=True):
-                elem_text = elem.text.strip() if elem.text else ''
-                elem_class = ' '.join(elem.get('class', []))
-                
-                # 公司信息
-                if 'octicon-organization' in elem_class or 'organization' in elem_class:
-                    if elem_text and elem_text not in elements['extracted_info'].get('company', ''):
-                        elements['extracted_info']['company'] = elem_text
-                
-                # 位置信息
-                elif 'octicon-location' in elem_class or 'location' in elem_class:
-                    if elem_text and elem_text not in elements['extracted_info'].get('location', ''):
-                        elements['extracted_info']['location'] = elem_text
-                
-                # 邮箱信息
-                elif 'octicon-mail' in elem_class or 'mail' in elem_class:
-                    email_link = elem.find('a', href=lambda x: x and 'mailto:' in x)
-                    if email_link:
-                        email = email_link.get('href').replace('mailto:', '')
-                        elements['extracted_info']['email'] = email
-                        elements['contact_methods'].append({
-                            'type': 'email',
-                            'value': email,
-                            'display': email
-                        })
-                
-                # 博客/网站
-                elif 'octicon-link' in elem_class or 'link' in elem_class:
-                    website_link = elem.find('a', href=True)
-                    if website_link:
-                        url = website_link.get('href')
-                        elements['extracted_info']['website'] = url
-                        elements['additional_links'].append({
-                            'type': 'website',
-                            'url': url,
-                            'display': website_link.text.strip() or url
-                        })
-                
-                # Twitter/X 链接
-                elif elem.name == 'a' and elem.get('href'):
-                    href = elem.get('href')
-                    if 'twitter.com' in href or 'x.com' in href:
-                        elements['social_accounts'].append({
-                            'platform': 'twitter',
-                            'url': href,
-                            'username': href.split('/')[-1] if '/' in href else ''
-                        })
-                    elif 'linkedin.com' in href:
-                        elements['social_accounts'].append({
-                            'platform': 'linkedin',
-                            'url': href,
-                            'username': href.split('/')[-1] if '/' in href else ''
-                        })
-                    elif 'mastodon' in href or 'mas.to' in href:
-                        elements['social_accounts'].append({
-                            'platform': 'mastodon',
-                            'url': href,
-                            'username': href.split('/')[-1] if '/' in href else ''
-                        })
-            
-            # 查找所有的 vcard-detail 项目
-            vcard_items = container.find_all(['li', 'div'], class_=lambda x: x and 'vcard-detail' in str(x))
-            for item in vcard_items:
-                item_text = item.text.strip()
-                if item_text:
-                    # 检查是否包含链接
-                    link = item.find('a', href=True)
-                    if link:
-                        elements['additional_links'].append({
-                            'type': 'general',
-                            'url': link.get('href'),
-                            'display': item_text
-                        })
-                    else:
-                        # 纯文本信息
-                        if '公司' in item_text or 'Company' in item_text:
-                            elements['extracted_info']['company'] = item_text
-                        elif '位置' in item_text or 'Location' in item_text:
-                            elements['extracted_info']['location'] = item_text
-        
-        except Exception as e:
-            logger.warning(f"解析个人资料元素时出错: {e}")
-        
-        return elements
+    def _merge_embedded_user(self, profile: Dict, user: Dict):
+        """用内嵌数据中的用户对象补全资料中为空的字段"""
+        for field in ('name', 'bio', 'company', 'location', 'email', 'created_at'):
+            if user.get(field) and not profile.get(field):
+                profile[field] = user[field]
+        for field in ('followers', 'following', 'public_repos'):
+            if isinstance(user.get(field), int) and not profile.get(field):
+                profile[field] = user[field]
+        if user.get('blog') and not profile.get('website'):
+            profile['website'] = profile['blog'] = user['blog']
+        if user.get('twitter_username') and not profile.get('twitter'):
+            profile['twitter'] = f"https://twitter.com/{user['twitter_username']}"
+            profile['social_links']['twitter'] = profile['twitter']
+        if user.get('avatar_url') and profile.get('avatar_url') == f"https://github.com/{profile['username']}.png":
+            profile['avatar_url'] = user['avatar_url']
     
     def _parse_count(self, text: str) -> int:
         """解析计数字符串（如 1.2k, 45等）"""
@@ -1001,29 +506,29 @@ class GitHubCrawler:
         # 清理文本
         text = text.strip().lower()
         
-        logger.info(f"原始文本: '{text}'")
+        logger.debug("原始文本: '%s'", text)
         
         # 使用正则表达式匹配数字+可选单位的模式
         # 匹配: 数字(可包含小数点) + 可选的单位(k/m/b)
-        match = re.search(r'([0-9]+(?:\.[0-9]+)?)\s*([kmb]?)(?:\s|$)', text)
+        match = COUNT_PATTERN.search(text)
         
         if not match:
             # 如果没有匹配到，尝试提取纯数字
-            number_match = re.search(r'([0-9]+(?:\.[0-9]+)?)', text)
+            number_match = NUMBER_PATTERN.search(text)
             if number_match:
                 try:
                     result = int(float(number_match.group(1)))
-                    logger.info(f"解析纯数字: '{text}' -> {result}")
+                    logger.debug("解析纯数字: '%s' -> %s", text, result)
                     return result
                 except ValueError:
                     pass
-            logger.warning(f"无法解析数字: '{text}'")
+            logger.warning("无法解析数字: '%s'", text)
             return 0
         
         number_str = match.group(1)
         unit = match.group(2)
         
-        logger.info(f"匹配结果: 数字='{number_str}', 单位='{unit}'")
+        logger.debug("匹配结果: 数字='%s', 单位='%s'", number_str, unit)
         
         try:
             number = float(number_str)
@@ -1033,30 +538,25 @@ class GitHubCrawler:
             
             if unit and unit in multipliers:
                 result = int(number * multipliers[unit])
-                logger.info(f"解析带单位: {number} * {multipliers[unit]} = {result}")
+                logger.debug("解析带单位: %s * %s = %s", number, multipliers[unit], result)
                 return result
             else:
                 result = int(number)
-                logger.info(f"解析纯数字: {number} -> {result}")
+                logger.debug("解析纯数字: %s -> %s", number, result)
                 return result
                 
         except (ValueError, TypeError) as e:
-            logger.warning(f"解析数字失败: {e}")
+            logger.warning("解析数字失败: %s", e)
             return 0
     
     def search_repositories(self, query: str, limit: int = 10) -> List[Dict]:
         """搜索GitHub仓库"""
-        logger.info(f"搜索仓库: '{query}', 限制: {limit}")
+        logger.info("搜索仓库: '%s', 限制: %s", query, limit)
         
         try:
             # 使用 GitHub API 搜索仓库
-            search_url = "https://api.github.com/search/repositories"
-            params = {
-                'q': query,
-                'sort': 'stars',
-                'order': 'desc',
-                'per_page': min(limit, 30)  # GitHub API 最大限制
-            }
+            search_url = f"{self.api_base}/search/repositories"
+            params = self._search_api_params(query, limit)
             
             headers = {
                 'Accept': 'application/vnd.github.v3+json',
@@ -1066,124 +566,142 @@ class GitHubCrawler:
             response = self.session.get(search_url, params=params, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                repositories = []
-                
-                for repo in data.get('items', []):
-                    repositories.append({
-                        'owner': repo['owner']['login'],
-                        'name': repo['name'],
-                        'full_name': repo['full_name'],
-                        'description': repo.get('description'),
-                        'stars': repo.get('stargazers_count', 0),
-                        'forks': repo.get('forks_count', 0),
-                        'language': repo.get('language'),
-                        'url': repo['html_url'],
-                        'created_at': repo.get('created_at'),
-                        'updated_at': repo.get('updated_at')
-                    })
-                
-                logger.info(f"搜索到 {len(repositories)} 个仓库")
+                repositories = self._parse_search_api(response.json())
+                logger.info("搜索到 %s 个仓库", len(repositories))
                 return repositories
             
             elif response.status_code == 403:
-                logger.warning(f"GitHub API 限制，尝试网页搜索")
+                logger.warning("GitHub API 限制，尝试网页搜索")
                 return self._search_repositories_web(query, limit)
             
             else:
-                logger.warning(f"GitHub API 请求失败: {response.status_code}")
+                logger.warning("GitHub API 请求失败: %s", response.status_code)
                 return self._search_repositories_web(query, limit)
         
         except Exception as e:
-            logger.error(f"API 搜索失败: {e}，尝试网页搜索")
+            logger.error("API 搜索失败: %s，尝试网页搜索", e)
             return self._search_repositories_web(query, limit)
     
+    def _search_api_params(self, query: str, limit: int) -> Dict:
+        """构造 GitHub 搜索 API 的查询参数"""
+        return {
+            'q': query,
+            'sort': 'stars',
+            'order': 'desc',
+            'per_page': min(limit, 30)  # GitHub API 最大限制
+        }
+    
+    def _search_web_params(self, query: str) -> Dict:
+        """构造 GitHub 网页搜索的查询参数"""
+        return {
+            'q': query,
+            'type': 'repositories',
+            's': 'stars',
+            'o': 'desc'
+        }
+    
+    def _parse_search_api(self, data: Dict) -> List[Dict]:
+        """将搜索 API 返回的数据转换为统一的仓库结构"""
+        repositories = []
+        
+        for repo in data.get('items', []):
+            repositories.append({
+                'owner': repo['owner']['login'],
+                'name': repo['name'],
+                'full_name': repo['full_name'],
+                'description': repo.get('description'),
+                'stars': repo.get('stargazers_count', 0),
+                'forks': repo.get('forks_count', 0),
+                'language': repo.get('language'),
+                'url': repo['html_url'],
+                'created_at': repo.get('created_at'),
+                'updated_at': repo.get('updated_at')
+            })
+        
+        return repositories
+    
     def _search_repositories_web(self, query: str, limit: int) -> List[Dict]:
         """通过网页搜索GitHub仓库"""
         try:
             # 使用 GitHub 网页搜索
-            search_url = "https://github.com/search"
-            params = {
-                'q': query,
-                'type': 'repositories',
-                's': 'stars',
-                'o': 'desc'
-            }
+            search_url = f"{self.web_base}/search"
+            params = self._search_web_params(query)
             
             response = self.session.get(search_url, params=params, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            repositories = []
-            
-            # 查找搜索结果
-            repo_items = soup.find_all('div', class_=lambda x: x and 'repo-list-item' in str(x))[:limit]
-            
-            for item in repo_items:
-                try:
-                    # 获取仓库名称
-                    title_link = item.find('a', href=True)
-                    if not title_link:
-                        continue
-                    
-                    href = title_link.get('href')
-                    if not href.startswith('/'):
-                        continue
-                    
-                    parts = href.strip('/').split('/')
-                    if len(parts) < 2:
-                        continue
-                    
-                    owner = parts[0]
-                    name = parts[1]
-                    
-                    # 获取描述
-                    desc_elem = item.find('p', class_=lambda x: x and 'mb-1' in str(x))
-                    description = desc_elem.text.strip() if desc_elem else None
-                    
-                    # 获取 stars 数
-                    stars = 0
-                    star_elem = item.find('a', href=lambda x: x and 'stargazers' in str(x))
-                    if star_elem:
-                        star_text = star_elem.text.strip()
-                        stars = self._parse_count(star_text)
-                    
-                    # 获取语言
-                    lang_elem = item.find('span', {'itemprop': 'programmingLanguage'})
-                    language = lang_elem.text.strip() if lang_elem else None
-                    
-                    repositories.append({
-                        'owner': owner,
-                        'name': name,
-                        'full_name': f"{owner}/{name}",
-                        'description': description,
-                        'stars': stars,
-                        'forks': 0,  # 网页解析难以获取准确 forks 数
-                        'language': language,
-                        'url': f"https://github.com{href}",
-                        'created_at': None,
-                        'updated_at': None
-                    })
-                
-                except Exception as e:
-                    logger.warning(f"解析搜索结果项失败: {e}")
-                    continue
-            
-            logger.info(f"网页搜索到 {len(repositories)} 个仓库")
+            repositories = self._parse_search_html(response.content, limit)
+            logger.info("网页搜索到 %s 个仓库", len(repositories))
             return repositories
         
         except Exception as e:
-            logger.error(f"网页搜索失败: {e}")
+            logger.error("网页搜索失败: %s", e)
             return []
     
-    def _parse_contributions(self, text: str) -> int:
-        """解析贡献次数文本"""
-        # 提取数字
-        numbers = re.findall(r'\d+(?:,\d+)*', text)
-        if numbers:
-            # 移除逗号并转换为整数
-            return int(numbers[0].replace(',', ''))
-        return 0
+    def _parse_search_html(self, content: bytes, limit: int) -> List[Dict]:
+        """解析网页搜索结果HTML"""
+        # 新版搜索页的结果只存在于内嵌的JSON数据中
+        repositories = page_data.search_results(page_data.embedded_json(content), limit)
+        if repositories:
+            return repositories
+        
+        soup = make_soup(content, self.html_parser)
+        repositories = []
+        
+        # 查找搜索结果
+        repo_items = soup.find_all('div', class_=lambda x: x and 'repo-list-item' in str(x))[:limit]
+        
+        for item in repo_items:
+            try:
+                # 获取仓库名称
+                title_link = item.find('a', href=True)
+                if not title_link:
+                    continue
+                
+                href = title_link.get('href')
+                if not href.startswith('/'):
+                    continue
+                
+                parts = href.strip('/').split('/')
+                if len(parts) < 2:
+                    continue
+                
+                owner = parts[0]
+                name = parts[1]
+                
+                # 获取描述
+                desc_elem = item.find('p', class_=lambda x: x and 'mb-1' in str(x))
+                description = desc_elem.text.strip() if desc_elem else None
+                
+                # 获取 stars 数
+                stars = 0
+                star_elem = item.find('a', href=lambda x: x and 'stargazers' in str(x))
+                if star_elem:
+                    star_text = star_elem.text.strip()
+                    stars = self._parse_count(star_text)
+                
+                # 获取语言
+                lang_elem = item.find('span', {'itemprop': 'programmingLanguage'})
+                language = lang_elem.text.strip() if lang_elem else None
+                
+                repositories.append({
+                    'owner': owner,
+                    'name': name,
+                    'full_name': f"{owner}/{name}",
+                    'description': description,
+                    'stars': stars,
+                    'forks': 0,  # 网页解析难以获取准确 forks 数
+                    'language': language,
+                    'url': f"https://github.com{href}",
+                    'created_at': None,
+                    'updated_at': None
+                })
+            
+            except Exception as e:
+                logger.warning("解析搜索结果项失败: %s", e)
+                continue
+        
+        return repositories
     
     def _initialize_profile_structure(self, username: str) -> Dict:
         """初始化用户资料结构"""
@@ -1219,497 +737,6 @@ class GitHubCrawler:
             'additional_info': {}
         }
     
-    def _extract_basic_info(self, soup: BeautifulSoup, profile: Dict):
-        """提取基本信息"""
-        username = profile['username']
-        
-        # 获取头像 - 多种方式尝试
-        avatar_selectors = [
-            f'img[alt="@{username}"]',
-            'img.avatar-user',
-            'img[src*="avatars"]',
-            '.avatar img'
-        ]
-        
-        for selector in avatar_selectors:
-            avatar_elem = soup.select_one(selector)
-            if avatar_elem and avatar_elem.get('src'):
-                profile['avatar_url'] = avatar_elem.get('src')
-                logger.info(f"找到头像: {profile['avatar_url']}")
-                break
-        
-        # 获取姓名 - 多种方式尝试
-        name_selectors = [
-            'span.p-name',
-            'h1.vcard-names',
-            '[itemprop="name"]',
-            '.h-card .p-name'
-        ]
-        
-        for selector in name_selectors:
-            name_elem = soup.select_one(selector)
-            if name_elem:
-                profile['name'] = name_elem.text.strip()
-                logger.info(f"找到姓名: {profile['name']}")
-                break
-        
-        # 获取代词 (pronouns)
-        pronouns_selectors = [
-            'span.user-profile-pronouns',
-            '[data-pronouns]',
-            '.pronouns'
-        ]
-        
-        for selector in pronouns_selectors:
-            pronouns_elem = soup.select_one(selector)
-            if pronouns_elem:
-                profile['pronouns'] = pronouns_elem.text.strip()
-                logger.info(f"找到代词: {profile['pronouns']}")
-                break
-        
-        # 获取简介 - 多种方式尝试
-        bio_selectors = [
-            'div.p-note.user-profile-bio',
-            'div[data-bio]',
-            '[itemprop="description"]',
-            '.user-profile-bio'
-        ]
-        
-        for selector in bio_selectors:
-            bio_elem = soup.select_one(selector)
-            if bio_elem:
-                bio_text = bio_elem.text.strip()
-                if bio_text:
-                    profile['bio'] = bio_text
-                    logger.info(f"找到简介: {profile['bio'][:50]}...")
-                    break
-        
-        # 获取工作信息
-        work_selectors = [
-            'div.user-profile-work',
-            '[data-work]',
-            '.work-info'
-        ]
-        
-        for selector in work_selectors:
-            work_elem = soup.select_one(selector)
-            if work_elem:
-                work_text = work_elem.text.strip()
-                if work_text:
-                    profile['work_info'] = work_text
-                    logger.info(f"找到工作信息: {profile['work_info']}")
-                    break
-    
-    def _extract_user_stats(self, soup: BeautifulSoup, profile: Dict):
-        """提取用户统计信息"""
-        stats = self._get_user_stats(soup)
-        profile.update(stats)
-        logger.info(f"统计信息: followers={stats['followers']}, following={stats['following']}, repos={stats['public_repos']}")
-    
-    def _extract_comprehensive_contact_info(self, soup: BeautifulSoup) -> Dict:
-        """提取全面的联系信息和社交链接"""
-        contact_info = {
-            # 基本联系信息
-            'company': None,
-            'location': None,
-            'email': None,
-            'phone': None,
-            'website': None,
-            'blog': None,
-            
-            # 社交媒体平台
-            'twitter': None,
-            'linkedin': None,
-            'mastodon': None,
-            'instagram': None,
-            'facebook': None,
-            'youtube': None,
-            'tiktok': None,
-            
-            # 专业平台
-            'github': None,
-            'stackoverflow': None,
-            'devto': None,
-            'medium': None,
-            'hashnode': None,
-            
-            # 组织化数据
-            'social_accounts': [],
-            'contact_methods': [],
-            'additional_links': [],
-            'all_links': [],
-            'raw_data': {}
-        }
-        
-        try:
-            # 获取个人资料区域
-            profile_area = self._find_profile_area(soup)
-            
-            # 提取所有链接并分类
-            self._extract_and_classify_links(profile_area, contact_info)
-            
-            # 提取带有图标的信息项
-            self._extract_profile_info_items(profile_area, contact_info)
-            
-            # 应用备用解析策略
-            self._apply_comprehensive_fallback_strategies(soup, contact_info)
-            
-            logger.info(f"联系信息提取完成: 社交平台={len([k for k,v in contact_info.items() if v and k in ['twitter','linkedin','instagram','facebook','youtube']])}, 联系方式={len([k for k,v in contact_info.items() if v and k in ['email','phone','website','blog']])}")
-            
-        except Exception as e:
-            logger.warning(f"提取联系信息时出错: {e}")
-        
-        return contact_info
-    
-    def _find_profile_area(self, soup: BeautifulSoup):
-        """查找个人资料区域"""
-        profile_selectors = [
-            'div.js-profile-editable-area',
-            'div[data-test-selector="profile-bio"]',
-            '.vcard-details',
-            '.js-profile-editable-replace',
-            '.user-profile-nav',
-            '.Layout-sidebar .BorderGrid-cell',
-            '.js-sticky .BorderGrid-cell',
-            '.Layout-sidebar',
-            '.profile-sidebar'
-        ]
-        
-        for selector in profile_selectors:
-            profile_area = soup.select_one(selector)
-            if profile_area:
-                logger.info(f"找到个人资料区域，使用选择器: {selector}")
-                return profile_area
-        
-        # 如果没找到特定区域，使用整个页面
-        logger.info("使用整个页面作为个人资料区域")
-        return soup
-    
-    def _extract_and_classify_links(self, profile_area, contact_info: Dict):
-        """提取并分类所有链接"""
-        all_links = profile_area.find_all('a', href=True) if profile_area else []
-        logger.info(f"找到 {len(all_links)} 个链接")
-        
-        for link in all_links:
-            href = link.get('href', '').strip()
-            text = link.get_text().strip()
-            title = link.get('title', '')
-            
-            # 跳过空链接和相对链接
-            if not href or href.startswith('#'):
-                continue
-            
-            # 处理相对链接
-            if href.startswith('/'):
-                if href.startswith('//'):
-                    href = 'https:' + href
-                else:
-                    # GitHub 内部链接，跳过
-                    continue
-            
-            # 记录所有链接
-            link_info = {
-                'url': href,
-                'text': text,
-                'title': title,
-                'platform': None,
-                'type': None
-            }
-            
-            # 分类链接
-            platform_info = self._classify_link(href)
-            if platform_info:
-                link_info.update(platform_info)
-                
-                # 更新对应的联系信息字段
-                platform = platform_info['platform']
-                if platform in contact_info:
-                    contact_info[platform] = href
-                
-                # 添加到对应的列表中
-                if platform_info['type'] == 'social':
-                    contact_info['social_accounts'].append(link_info)
-                elif platform_info['type'] == 'contact':
-                    contact_info['contact_methods'].append(link_info)
-                else:
-                    contact_info['additional_links'].append(link_info)
-            
-            contact_info['all_links'].append(link_info)
-    
-    def _classify_link(self, href: str) -> Dict:
-        """分类链接类型"""
-        href_lower = href.lower()
-        
-        # 社交媒体平台映射
-        social_platforms = {
-            'twitter': ['twitter.com', 'x.com'],
-            'linkedin': ['linkedin.com'],
-            'mastodon': ['mastodon', 'mas.to', 'fosstodon', 'mstdn'],
-            'instagram': ['instagram.com'],
-            'facebook': ['facebook.com', 'fb.com'],
-            'youtube': ['youtube.com', 'youtu.be'],
-            'tiktok': ['tiktok.com'],
-            'github': ['github.com'],
-            'stackoverflow': ['stackoverflow.com', 'stackexchange.com'],
-            'devto': ['dev.to'],
-            'medium': ['medium.com'],
-            'hashnode': ['hashnode.com', 'hashnode.dev']
-        }
-        
-        # 检查社交平台
-        for platform, domains in social_platforms.items():
-            if any(domain in href_lower for domain in domains):
-                return {
-                    'platform': platform,
-                    'type': 'social',
-                    'username': self._extract_username_from_url(href, platform)
-                }
-        
-        # 邮箱链接
-        if 'mailto:' in href_lower:
-            return {
-                'platform': 'email',
-                'type': 'contact',
-                'value': href.replace('mailto:', '')
-            }
-        
-        # 电话链接
-        if 'tel:' in href_lower:
-            return {
-                'platform': 'phone',
-                'type': 'contact',
-                'value': href.replace('tel:', '')
-            }
-        
-        # 个人网站/博客
-        if any(domain in href_lower for domain in ['.dev', '.io', '.com', '.org', '.net', '.me', '.co', '.blog', '.site']):
-            # 排除已知的社交平台
-            excluded_domains = [
-                'github.com', 'twitter.com', 'x.com', 'linkedin.com', 'instagram.com',
-                'facebook.com', 'youtube.com', 'tiktok.com', 'stackoverflow.com',
-                'medium.com', 'dev.to', 'mastodon'
-            ]
-            
-            if not any(excluded in href_lower for excluded in excluded_domains):
-                return {
-                    'platform': 'website',
-                    'type': 'contact',
-                    'value': href
-                }
-        
-        return None
-    
-    def _extract_username_from_url(self, url: str, platform: str) -> str:
-        """从 URL 中提取用户名"""
-        try:
-            if platform == 'twitter':
-                return url.split('/')[-1] if '/' in url else ''
-            elif platform == 'linkedin':
-                if '/in/' in url:
-                    return url.split('/in/')[-1].split('/')[0]
-                elif '/company/' in url:
-                    return url.split('/company/')[-1].split('/')[0]
-            elif platform == 'github':
-                parts = url.split('github.com/')[-1].split('/')
-                return parts[0] if parts and parts[0] not in ['orgs', 'organizations'] else ''
-            elif platform in ['instagram', 'facebook', 'youtube', 'tiktok']:
-                return url.split('/')[-1] if '/' in url else ''
-            elif platform == 'mastodon':
-                if '@' in url:
-                    parts = url.split('@')
-                    return f"@{parts[-2]}@{parts[-1]}" if len(parts) >= 2 else ''
-            else:
-                return url.split('/')[-1] if '/' in url else ''
-        except Exception:
-            return ''
-    
-    def _extract_profile_info_items(self, profile_area, contact_info: Dict):
-        """提取带有图标的信息项"""
-        if not profile_area:
-            return
-            
-        info_selectors = [
-            'li.vcard-detail',
-            '.vcard-detail',
-            'li[itemprop]',
-            '.js-profile-editable-area li',
-            '.BorderGrid-cell li',
-            '[data-test-selector="profile-bio"] li',
-            '.user-profile-bio li'
-        ]
-        
-        info_items = []
-        for selector in info_selectors:
-            items = profile_area.select(selector)
-            info_items.extend(items)
-            if items:
-                logger.info(f"使用选择器 {selector} 找到 {len(items)} 个信息项")
-        
-        # 去重
-        seen_items = set()
-        unique_items = []
-        for item in info_items:
-            item_text = item.get_text().strip()
-            if item_text and item_text not in seen_items:
-                unique_items.append(item)
-                seen_items.add(item_text)
-        
-        for item in unique_items:
-            self._parse_profile_info_item(item, contact_info)
-    
-    def _parse_profile_info_item(self, item, contact_info: Dict):
-        """解析单个信息项"""
-        item_text = item.get_text().strip()
-        
-        # 检查 SVG 图标类型
-        svg_elem = item.find('svg')
-        if svg_elem:
-            svg_classes = ' '.join(svg_elem.get('class', []))
-            aria_label = svg_elem.get('aria-label', '').lower()
-            
-            # 公司信息
-            if any(keyword in svg_classes.lower() for keyword in ['organization', 'building']) or 'organization' in aria_label:
-                if item_text and not contact_info.get('company'):
-                    contact_info['company'] = item_text
-                    logger.info(f"找到公司信息: {item_text}")
-            
-            # 位置信息
-            elif any(keyword in svg_classes.lower() for keyword in ['location', 'geo']) or 'location' in aria_label:
-                if item_text and not contact_info.get('location'):
-                    contact_info['location'] = item_text
-                    logger.info(f"找到位置信息: {item_text}")
-            
-            # 邮箱信息
-            elif any(keyword in svg_classes.lower() for keyword in ['mail', 'email']) or 'mail' in aria_label:
-                email_link = item.find('a', href=lambda x: x and 'mailto:' in x)
-                if email_link and not contact_info.get('email'):
-                    email = email_link.get('href').replace('mailto:', '')
-                    contact_info['email'] = email
-                    logger.info(f"找到邮箱信息: {email}")
-            
-            # 网站/博客
-            elif any(keyword in svg_classes.lower() for keyword in ['link', 'globe', 'url']) or 'link' in aria_label:
-                website_link = item.find('a', href=True)
-                if website_link and not contact_info.get('website'):
-                    url = website_link.get('href')
-                    if not any(excluded in url.lower() for excluded in ['github.com', 'twitter.com', 'linkedin.com']):
-                        contact_info['website'] = url
-                        contact_info['blog'] = url
-                        logger.info(f"找到网站信息: {url}")
-    
-    def _apply_comprehensive_fallback_strategies(self, soup: BeautifulSoup, contact_info: Dict):
-        """应用全面的备用解析策略"""
-        try:
-            # 策略 1: 通过 aria-label 属性查找信息
-            self._extract_by_aria_labels(soup, contact_info)
-            
-            # 策略 2: 通过正则表达式查找邮箱
-            self._extract_email_by_regex(soup, contact_info)
-            
-            # 策略 3: 通过 CSS 类名查找信息
-            self._extract_by_css_classes(soup, contact_info)
-            
-            # 策略 4: 通过微格式数据查找
-            self._extract_by_microformats(soup, contact_info)
-            
-        except Exception as e:
-            logger.warning(f"备用解析策略执行失败: {e}")
-    
-    def _extract_by_aria_labels(self, soup: BeautifulSoup, contact_info: Dict):
-        """通过 aria-label 属性查找信息"""
-        aria_elements = soup.find_all(attrs={'aria-label': True})
-        for elem in aria_elements:
-            aria_label = elem.get('aria-label', '').lower()
-            elem_text = elem.get_text().strip()
-            
-            if 'location' in aria_label and elem_text and not contact_info.get('location'):
-                contact_info['location'] = elem_text
-            elif 'organization' in aria_label and elem_text and not contact_info.get('company'):
-                contact_info['company'] = elem_text
-            elif ('email' in aria_label or 'mail' in aria_label):
-                email_link = elem.find('a', href=lambda x: x and 'mailto:' in x)
-                if email_link and not contact_info.get('email'):
-                    contact_info['email'] = email_link.get('href').replace('mailto:', '')
-    
-    def _extract_email_by_regex(self, soup: BeautifulSoup, contact_info: Dict):
-        """通过正则表达式查找邮箱"""
-        if contact_info.get('email'):
-            return
-            
-        all_text = soup.get_text()
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_matches = re.findall(email_pattern, all_text)
-        
-        if email_matches:
-            # 过滤掉常见的无效邮箱
-            valid_emails = [email for email in email_matches 
-                          if not any(invalid in email.lower() for invalid in 
-                                   ['example.com', 'test.com', 'noreply', 'no-reply', 'placeholder'])]
-            if valid_emails:
-                contact_info['email'] = valid_emails[0]
-    
-    def _extract_by_css_classes(self, soup: BeautifulSoup, contact_info: Dict):
-        """通过 CSS 类名查找信息"""
-        css_mappings = {
-            'location': ['user-location', 'profile-location', 'vcard-location'],
-            'company': ['user-company', 'profile-company', 'vcard-organization'],
-            'email': ['user-email', 'profile-email', 'vcard-email'],
-            'website': ['user-website', 'profile-website', 'vcard-url']
-        }
-        
-        for info_type, class_names in css_mappings.items():
-            if contact_info.get(info_type):
-                continue
-                
-            for class_name in class_names:
-                elements = soup.find_all(class_=lambda x: x and class_name in str(x))
-                for elem in elements:
-                    elem_text = elem.get_text().strip()
-                    if elem_text:
-                        if info_type == 'email' and '@' in elem_text:
-                            contact_info['email'] = elem_text
-                            break
-                        elif info_type in ['location', 'company'] and len(elem_text) > 2:
-                            contact_info[info_type] = elem_text
-                            break
-                        elif info_type == 'website':
-                            link = elem.find('a', href=True)
-                            if link:
-                                contact_info['website'] = link.get('href')
-                                contact_info['blog'] = link.get('href')
-                                break
-    
-    def _extract_by_microformats(self, soup: BeautifulSoup, contact_info: Dict):
-        """通过微格式数据查找"""
-        microformat_selectors = {
-            'location': ['[itemprop="address"]', '[itemprop="location"]', '.p-locality', '.h-adr'],
-            'company': ['[itemprop="worksFor"]', '[itemprop="affiliation"]', '.p-org', '.h-card .p-org'],
-            'email': ['[itemprop="email"]', '.u-email'],
-            'website': ['[itemprop="url"]', '.u-url']
-        }
-        
-        for info_type, selectors in microformat_selectors.items():
-            if contact_info.get(info_type):
-                continue
-                
-            for selector in selectors:
-                elements = soup.select(selector)
-                for elem in elements:
-                    if info_type == 'email':
-                        if elem.name == 'a' and elem.get('href', '').startswith('mailto:'):
-                            contact_info['email'] = elem.get('href').replace('mailto:', '')
-                            break
-                    elif info_type == 'website':
-                        if elem.name == 'a' and elem.get('href'):
-                            contact_info['website'] = elem.get('href')
-                            contact_info['blog'] = elem.get('href')
-                            break
-                    else:
-                        elem_text = elem.get_text().strip()
-                        if elem_text:
-                            contact_info[info_type] = elem_text
-                            break
-    
     def _merge_contact_info_to_profile(self, profile: Dict, contact_info: Dict):
         """将联系信息整合到主资料中"""
         # 直接字段映射
@@ -1733,129 +760,6 @@ class GitHubCrawler:
             if contact_info.get(platform)
         }
     
-    def _extract_additional_profile_data(self, soup: BeautifulSoup, profile: Dict):
-        """提取额外的资料数据"""
-        additional_info = {}
-        
-        try:
-            # 查找加入日期
-            join_date = self._extract_join_date(soup)
-            if join_date:
-                additional_info['join_date'] = join_date
-                profile['created_at'] = join_date
-            
-            # 查找贡献历史
-            contribution_info = self._extract_contribution_info(soup)
-            if contribution_info:
-                additional_info['contributions'] = contribution_info
-            
-            # 查找组织信息
-            organizations = self._extract_organizations(soup)
-            if organizations:
-                additional_info['organizations'] = organizations
-            
-            # 查找置顶仓库
-            pinned_repos = self._extract_pinned_repositories(soup)
-            if pinned_repos:
-                additional_info['pinned_repositories'] = pinned_repos
-            
-        except Exception as e:
-            logger.warning(f"提取额外资料数据时出错: {e}")
-        
-        profile['additional_info'] = additional_info
-    
-    def _extract_join_date(self, soup: BeautifulSoup) -> str:
-        """提取加入 GitHub 的日期"""
-        join_selectors = [
-            'time[datetime]',
-            '[data-date]',
-            '.join-date'
-        ]
-        
-        for selector in join_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get('datetime') or elem.get('data-date') or elem.text.strip()
-        
-        # 备用：查找文本中的日期模式
-        text = soup.get_text()
-        date_patterns = [
-            r'Joined GitHub on ([A-Za-z]+ \d{1,2}, \d{4})',
-            r'Joined on ([A-Za-z]+ \d{1,2}, \d{4})',
-            r'Member since ([A-Za-z]+ \d{4})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        
-        return None
-    
-    def _extract_contribution_info(self, soup: BeautifulSoup) -> Dict:
-        """提取贡献信息"""
-        contribution_info = {}
-        
-        # 查找贡献图表
-        contribution_graph = soup.select_one('.js-yearly-contributions')
-        if contribution_graph:
-            # 提取贡献总数
-            total_text = contribution_graph.get_text()
-            total_match = re.search(r'(\d+(?:,\d+)*) contributions?', total_text)
-            if total_match:
-                contribution_info['total_contributions'] = int(total_match.group(1).replace(',', ''))
-        
-        return contribution_info
-    
-    def _extract_organizations(self, soup: BeautifulSoup) -> List[Dict]:
-        """提取组织信息"""
-        organizations = []
-        
-        org_elements = soup.select('.avatar-group-item, .org-avatar')
-        for org_elem in org_elements:
-            org_link = org_elem.find('a', href=True)
-            if org_link:
-                href = org_link.get('href')
-                if href.startswith('/'):
-                    org_name = href.strip('/').split('/')[0]
-                    img_elem = org_elem.find('img')
-                    avatar_url = img_elem.get('src') if img_elem else None
-                    
-                    organizations.append({
-                        'name': org_name,
-                        'url': f"https://github.com{href}",
-                        'avatar_url': avatar_url
-                    })
-        
-        return organizations
-    
-    def _extract_pinned_repositories(self, soup: BeautifulSoup) -> List[Dict]:
-        """提取置顶仓库信息"""
-        pinned_repos = []
-        
-        pinned_elements = soup.select('.pinned-item-list-item')
-        for pinned_elem in pinned_elements:
-            repo_link = pinned_elem.select_one('a[href*="/"]')
-            if repo_link:
-                href = repo_link.get('href')
-                repo_name = href.strip('/').split('/')[-1] if href else None
-                
-                desc_elem = pinned_elem.select_one('.pinned-item-desc')
-                description = desc_elem.text.strip() if desc_elem else None
-                
-                lang_elem = pinned_elem.select_one('[itemprop="programmingLanguage"]')
-                language = lang_elem.text.strip() if lang_elem else None
-                
-                if repo_name:
-                    pinned_repos.append({
-                        'name': repo_name,
-                        'url': f"https://github.com{href}" if href else None,
-                        'description': description,
-                        'language': language
-                    })
-        
-        return pinned_repos
-    
     def _get_fallback_profile(self, username: str) -> Dict:
         """获取备用资料结构"""
         return {
@@ -1888,4 +792,421 @@ class GitHubCrawler:
             'contact_info': {},
             'social_links': {},
             'additional_info': {}
-        }
\ No newline at end of file
+        }
+
+
+def _has_repository_data(info: Dict) -> bool:
+    # 获取失败时返回的默认仓库信息没有描述和计数
+    return bool(info.get('description') or info.get('stars') or info.get('forks'))
+
+
+def _has_profile_data(profile: Dict) -> bool:
+    # 获取失败时返回的备用资料没有联系信息
+    return bool(profile.get('contact_info'))
+
+
+class AsyncGitHubCrawler(GitHubCrawler):
+    """异步GitHub爬虫，公开接口与GitHubCrawler一致，基于共享的aiohttp连接池
+    
+    所有页面解析逻辑复用GitHubCrawler，只有网络请求改为异步，
+    因此单个worker可以同时保持大量查询在途而不会阻塞事件循环。
+    传入 parse_pool 时页面解析在子进程中进行，解析不再占用事件循环所在进程的GIL。
+    公开接口的结果按实体类型缓存一段时间，调用时传入 force_refresh=True 可跳过缓存。
+    """
+    
+    def __init__(self, http_pool: Optional[HTTPClientPool] = None, hedge_delay: float = 1.0,
+                 rate_limiter: Optional[RateLimitScheduler] = None,
+                 token_pool: Optional[GitHubTokenPool] = None,
+                 conditional_cache: Optional[ConditionalRequestCache] = None,
+                 singleflight: Optional[SingleFlight] = None,
+                 breakers: Optional[CircuitBreakerRegistry] = None,
+                 web_base: Optional[str] = None, api_base: Optional[str] = None,
+                 html_parser: Optional[str] = None, parse_pool: Optional[ParsePool] = None,
+                 result_cache: Optional[ResultCache] = None, stream_drain_bytes: int = STREAM_DRAIN_BYTES):
+        super().__init__(web_base=web_base, api_base=api_base, html_parser=html_parser)
+        # 未传入共享连接池时自行创建，并在 close() 时负责关闭
+        self._owns_pool = http_pool is None
+        self.http_pool = http_pool or HTTPClientPool()
+        # 未传入限流调度器时自行创建，并监听 api.github.com 的所有响应
+        if rate_limiter is None:
+            rate_limiter = RateLimitScheduler()
+            self.http_pool.add_response_listener(GITHUB_API, rate_limiter.observe)
+        self.rate_limiter = rate_limiter
+        # 与 MCP 集成共享的 token 池；未传入时只使用匿名请求
+        self.token_pool = token_pool or GitHubTokenPool([], rate_limiter)
+        # api.github.com 请求使用 ETag 条件请求缓存，304 不消耗限流额度
+        self.conditional_cache = conditional_cache or ConditionalRequestCache()
+        # 相同的并发查询只执行一次抓取和解析
+        self.singleflight = singleflight or SingleFlight()
+        # 按上游（github_web / github_api）和按策略的熔断器，已知故障的路径直接跳过
+        self.breakers = breakers or CircuitBreakerRegistry()
+        # 对冲请求间隔：前一个策略在该时间内未返回结果时启动下一个策略
+        self.hedge_delay = hedge_delay
+        # 页面解析进程池；未传入或进程数为0时在当前进程内解析
+        self.parse_pool = parse_pool
+        # 仓库信息、贡献者、用户资料和搜索结果的缓存，与 MCP 集成共享
+        self.result_cache = result_cache or ResultCache()
+        # 提前结束下载后最多读完丢弃的剩余字节数，用于保留 keep-alive 连接
+        self.stream_drain_bytes = stream_drain_bytes
+        # 流式读取统计：提前结束下载的次数（其中读完剩余内容、连接得以复用的次数）和读完整个页面的次数
+        self.stream_early_exits = 0
+        self.stream_drained = 0
+        self.stream_full_reads = 0
+    
+    async def close(self):
+        """关闭自行创建的连接池；共享连接池由应用生命周期负责关闭"""
+        if self._owns_pool:
+            await self.http_pool.close()
+    
+    async def _fetch(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                     timeout: float = 10, raise_for_status: bool = True,
+                     client: str = GITHUB_WEB, stop_when: Optional[ElementTracker] = None) -> Tuple[int, bytes]:
+        """发起GET请求并读取完整响应体，返回 (状态码, 内容)
+        
+        请求受上游熔断器保护，熔断打开时立即抛出 CircuitOpenError。
+        超时取固定超时和当前请求剩余时间中较小的一个，时限已用完时抛出 DeadlineExceeded。
+        传入 stop_when 时流式读取 github.com 页面，所需元素都已出现后只返回已读取的前缀；
+        剩余内容较少时读完丢弃以复用连接，否则关闭连接。
+        """
+        session = await self.http_pool.get(client)
+        request_headers = dict(self.default_headers)
+        request_headers.update(headers or {})
+        client_timeout = aiohttp.ClientTimeout(total=deadline.budget(timeout, url))
+        
+        async def do_request() -> Tuple[int, bytes]:
+            try:
+                if client == GITHUB_API:
+                    return await self.conditional_cache.get(session, url, params=params, headers=request_headers,
+                                                            timeout=client_timeout)
+                async with session.get(url, params=params, headers=request_headers, timeout=client_timeout) as response:
+                    if stop_when is not None and response.status == 200:
+                        return response.status, await self._read_until(response, stop_when, url)
+                    # 先读完响应体再检查状态，使错误响应的连接也能归还连接池
+                    return response.status, await response.read()
+            except asyncio.TimeoutError:
+                # 因请求时限被截短而超时，不计为上游故障
+                if deadline.expired():
+                    raise DeadlineExceeded(url) from None
+                raise
+        
+        status, content = await self.breakers.get(client).call(
+            do_request,
+            is_failure=lambda result: result[0] in UPSTREAM_FAILURE_STATUSES
+        )
+        if raise_for_status and status >= 400:
+            raise GitHubHTTPError(status, url)
+        return status, content
+    
+    async def _read_until(self, response: aiohttp.ClientResponse, tracker: ElementTracker, url: str) -> bytes:
+        """边下载边扫描，所需元素都已出现时结束读取；直到页面结束都没有出现时即为完整下载"""
+        chunks = []
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            tracker.feed_bytes(chunk)
+            if tracker.done:
+                # 剩余内容（README等）不再解析；较少时读完丢弃使连接归还连接池，否则关闭连接
+                self.stream_early_exits += 1
+                if await self._drain(response, tracker.bytes_read):
+                    self.stream_drained += 1
+                else:
+                    response.close()
+                logger.info("所需字段已读到，提前结束下载: %s（已读取 %s 字节）", url, tracker.bytes_read)
+                return b''.join(chunks)
+        self.stream_full_reads += 1
+        return b''.join(chunks)
+    
+    async def _drain(self, response: aiohttp.ClientResponse, bytes_read: int) -> bool:
+        """读完并丢弃剩余响应体，返回连接是否可以复用；剩余超过 stream_drain_bytes 时放弃"""
+        limit = self.stream_drain_bytes
+        if limit <= 0:
+            return False
+        # 未压缩的响应可按 Content-Length 预先判断；压缩或分块传输时边读边计数
+        if (response.content_length is not None and 'Content-Encoding' not in response.headers
+                and response.content_length - bytes_read > limit):
+            return False
+        drained = 0
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                drained += len(chunk)
+                if drained > limit:
+                    return False
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            return False
+        return True
+    
+    def streaming_stats(self) -> Dict:
+        """返回流式读取提前结束（其中复用连接）和完整下载的次数"""
+        return {
+            'early_exits': self.stream_early_exits,
+            'drained': self.stream_drained,
+            'full_reads': self.stream_full_reads,
+            'drain_bytes': self.stream_drain_bytes
+        }
+    
+    async def _parse(self, method: str, *args) -> Any:
+        """执行页面解析方法：有解析进程池时提交给子进程，子进程异常退出时改在当前进程内解析"""
+        if self.parse_pool is None or not self.parse_pool.enabled:
+            return getattr(self, method)(*args)
+        try:
+            result, selector_records = await self.parse_pool.run(method, *args)
+        except BrokenProcessPool:
+            logger.warning("解析进程不可用，在当前进程内执行 %s", method)
+            return getattr(self, method)(*args)
+        self.selector_stats.replay(selector_records)
+        return result
+    
+    async def _run_strategy(self, name: str, factory: Callable[[], Awaitable[Any]], default: Any = None,
+                            is_failure: Callable[[Any], bool] = lambda result: not result) -> Any:
+        """在策略熔断器保护下执行一个获取策略，默认空结果计为失败；熔断时直接返回默认值
+        
+        策略因请求时限用完而失败时不计入熔断器。
+        """
+        async def run() -> Any:
+            result = await factory()
+            if is_failure(result) and deadline.expired():
+                raise DeadlineExceeded(name)
+            return result
+        
+        try:
+            return await self.breakers.get(name).call(run, is_failure=is_failure)
+        except CircuitOpenError:
+            logger.info("策略 %s 处于熔断状态，直接跳过", name)
+            return default
+        except DeadlineExceeded:
+            return default
+    
+    @cached(REPOSITORY, _has_repository_data)
+    @coalesced
+    async def get_repository_info(self, owner: str, repo: str) -> Dict:
+        """获取仓库基本信息"""
+        url = f"{self.web_base}/{owner}/{repo}"
+        try:
+            # 流式读取，所需字段都已出现后不再下载页面剩余部分（README等）
+            _, content = await self._fetch(url, timeout=10, stop_when=self._repository_header_tracker(owner, repo))
+            return await self._parse('_parse_repository_page', content, owner, repo)
+        
+        except GitHubHTTPError as e:
+            logger.error("获取仓库信息失败: %s", e)
+            # 仓库不存在时做负缓存，短时间内相同的查询不再请求页面
+            default = self._default_repository_info(owner, repo)
+            return Missing(default) if e.status == 404 else default
+        except Exception as e:
+            logger.error("获取仓库信息失败: %s", e)
+            return self._default_repository_info(owner, repo)
+    
+    @cached(CONTRIBUTORS)
+    @coalesced
+    async def get_contributors(self, owner: str, repo: str, limit: int = 10) -> List[Dict]:
+        """获取仓库贡献者列表
+        
+        三种获取方式互相独立，以对冲请求的方式运行：按优先级依次启动，
+        前一个在 hedge_delay 内未返回或已失败时立即启动下一个，首个非空结果胜出。
+        """
+        logger.info("开始获取 %s/%s 的贡献者信息", owner, repo)
+        
+        strategies = [
+            ('页面解析', lambda: self._run_strategy(
+                'contributors.page', lambda: self._parse_contributors_page(owner, repo, limit), [])),
+            ('Commits 页面', lambda: self._run_strategy(
+                'contributors.commits', lambda: self._extract_from_commits(owner, repo, limit), [])),
+        ]
+        # API 额度充足时优先使用 API，否则直接从页面解析开始
+        if self.token_pool.has_budget(CORE):
+            strategies.insert(0, ('GitHub API', lambda: self._run_strategy(
+                'contributors.api', lambda: self._try_github_api(owner, repo, limit), [])))
+        else:
+            logger.info("GitHub API core 额度不足，直接使用页面解析获取 %s/%s 的贡献者", owner, repo)
+        
+        label, contributors = await self._hedged_first(strategies)
+        if contributors:
+            logger.info("通过 %s 成功获取 %s 个贡献者", label, len(contributors))
+            return contributors
+        
+        logger.warning("所有方法都失败，返回空列表")
+        return []
+    
+    async def _hedged_first(self, strategies: List[Tuple[str, Callable[[], Awaitable[Any]]]]) -> Tuple[Optional[str], Any]:
+        """对冲执行多个策略，返回 (策略名, 结果)；全部失败时返回 (None, None)"""
+        remaining = list(strategies)
+        labels: Dict[asyncio.Future, str] = {}
+        pending = set()
+        
+        def launch_next():
+            label, factory = remaining.pop(0)
+            task = asyncio.ensure_future(factory())
+            labels[task] = label
+            pending.add(task)
+        
+        launch_next()
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if not done:
+                    if deadline.expired():
+                        continue
+                    # 对冲计时到期，启动下一个策略
+                    logger.info("%s秒内未获得结果，启动对冲策略: %s", self.hedge_delay, remaining[0][0])
+                    launch_next()
+                    continue
+                
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    result = task.result()
+                    if result:
+                        return labels[task], result
+                
+                # 已完成的策略都失败了，不再等待对冲计时；请求时限已用完时不再启动新策略
+                if remaining and not deadline.expired():
+                    launch_next()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return None, None
+    
+    async def _try_github_api(self, owner: str, repo: str, limit: int) -> List[Dict]:
+        """尝试使用 GitHub 公开 API 获取贡献者"""
+        auth_headers = self.token_pool.acquire(CORE)
+        if auth_headers is None:
+            return []
+        
+        try:
+            api_url = f"{self.api_base}/repos/{owner}/{repo}/contributors?per_page={limit}"
+            headers = {
+                'Accept': 'application/vnd.github.v3+json',
+                'User-Agent': 'GitHub-Crawler/1.0',
+                **auth_headers
+            }
+            
+            status, content = await self._fetch(api_url, headers=headers, timeout=10, raise_for_status=False,
+                                                client=GITHUB_API)
+            
+            if status == 200:
+                return self._parse_contributors_api(json.loads(content))
+            
+        except Exception as e:
+            logger.warning("GitHub API 请求失败: %s", e)
+        
+        return []
+    
+    async def _parse_contributors_page(self, owner: str, repo: str, limit: int) -> List[Dict]:
+        """解析 GitHub Contributors 页面"""
+        try:
+            url = f"{self.web_base}/{owner}/{repo}/graphs/contributors"
+            _, content = await self._fetch(url, timeout=15)
+            return await self._parse('_parse_contributors_html', content, limit)
+        
+        except Exception as e:
+            logger.error("解析 Contributors 页面失败: %s", e)
+        
+        return []
+    
+    async def _extract_from_commits(self, owner: str, repo: str, limit: int) -> List[Dict]:
+        """从 Commits 页面提取贡献者信息"""
+        try:
+            url = f"{self.web_base}/{owner}/{repo}/commits"
+            _, content = await self._fetch(url, timeout=15)
+            return await self._parse('_parse_commits_html', content, limit)
+        
+        except Exception as e:
+            logger.error("从 Commits 页面提取失败: %s", e)
+        
+        return []
+    
+    @cached(PROFILE, _has_profile_data)
+    @coalesced
+    async def get_user_profile(self, username: str) -> Dict:
+        """获取用户个人资料详细信息"""
+        url = f"{self.web_base}/{username}"
+        logger.info("开始获取用户 %s 的详细资料", username)
+        
+        try:
+            _, content = await self._fetch(url, timeout=15)
+            logger.info("成功获取 %s 的页面内容", username)
+            
+            profile = await self._parse('_parse_user_profile_page', content, username)
+            logger.info("成功获取 %s 的完整资料", username)
+            return profile
+        
+        except GitHubHTTPError as e:
+            logger.error("获取用户资料失败: %s", e)
+            # 用户不存在时做负缓存，短时间内相同的查询不再请求页面
+            fallback = self._get_fallback_profile(username)
+            return Missing(fallback) if e.status == 404 else fallback
+        except Exception as e:
+            logger.error("获取用户资料失败: %s", e)
+            return self._get_fallback_profile(username)
+    
+    @cached(SEARCH_RESULTS)
+    @coalesced
+    async def search_repositories(self, query: str, limit: int = 10) -> List[Dict]:
+        """搜索GitHub仓库"""
+        logger.info("搜索仓库: '%s', 限制: %s", query, limit)
+        
+        # search 额度不足时不再浪费一次403往返，直接走网页搜索
+        auth_headers = self.token_pool.acquire(SEARCH)
+        if auth_headers is None:
+            logger.info("GitHub API search 额度不足，直接使用网页搜索")
+            return await self._search_repositories_web(query, limit)
+        
+        # API 搜索策略熔断时直接走网页搜索；API 正常返回空结果不算失败
+        repositories = await self._run_strategy(
+            'search.api',
+            lambda: self._search_repositories_api(query, limit, auth_headers),
+            is_failure=lambda result: result is None
+        )
+        if repositories is not None:
+            return repositories
+        return await self._search_repositories_web(query, limit)
+    
+    async def _search_repositories_api(self, query: str, limit: int, auth_headers: Dict[str, str]) -> Optional[List[Dict]]:
+        """通过 GitHub 搜索 API 搜索仓库，失败时返回 None"""
+        try:
+            # 使用 GitHub API 搜索仓库
+            search_url = f"{self.api_base}/search/repositories"
+            headers = {
+                'Accept': 'application/vnd.github.v3+json',
+                'User-Agent': 'GitHub-Crawler/1.0',
+                **auth_headers
+            }
+            
+            status, content = await self._fetch(search_url, params=self._search_api_params(query, limit),
+                                                headers=headers, timeout=10, raise_for_status=False,
+                                                client=GITHUB_API)
+            
+            if status == 200:
+                repositories = self._parse_search_api(json.loads(content))
+                logger.info("搜索到 %s 个仓库", len(repositories))
+                return repositories
+            
+            elif status == 403:
+                logger.warning("GitHub API 限制，尝试网页搜索")
+            
+            else:
+                logger.warning("GitHub API 请求失败: %s", status)
+        
+        except Exception as e:
+            logger.error("API 搜索失败: %s，尝试网页搜索", e)
+        
+        return None
+    
+    async def _search_repositories_web(self, query: str, limit: int) -> List[Dict]:
+        """通过网页搜索GitHub仓库"""
+        try:
+            # 使用 GitHub 网页搜索
+            search_url = f"{self.web_base}/search"
+            _, content = await self._fetch(search_url, params=self._search_web_params(query), timeout=15)
+            
+            repositories = await self._parse('_parse_search_html', content, limit)
+            logger.info("网页搜索到 %s 个仓库", len(repositories))
+            return repositories
+        
+        except Exception as e:
+            logger.error("网页搜索失败: %s", e)
+            return []
@@ -0,0 +1,96 @@
+import os
+import logging
+from typing import Dict, Iterable, List, Optional, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 可选的 BeautifulSoup 解析后端，按速度从快到慢排列；
+# lxml 基于 libxml2（C实现），html.parser 为纯Python实现但无需额外依赖，html5lib 最慢但容错与浏览器一致
+PARSER_BACKENDS = ('lxml', 'html.parser', 'html5lib')
+FALLBACK_BACKEND = 'html.parser'
+
+# 解析后端：auto 表示优先使用已安装的最快后端
+DEFAULT_BACKEND = os.getenv("HTML_PARSER", "auto")
+
+# 部分解析：只为提取器用到的页面区域构建节点，页面结构不符合预期时退回完整解析
+PARTIAL_PARSING = os.getenv("HTML_PARTIAL_PARSE", "true").lower() == "true"
+
+# html5lib 不支持 parse_only，使用该后端时总是完整解析
+PARTIAL_BACKENDS = ('lxml', 'html.parser')
+
+
+def available_backends() -> List[str]:
+    """返回当前环境中已安装的解析后端"""
+    backends = []
+    for name in PARSER_BACKENDS:
+        try:
+            BeautifulSoup('', name)
+        except FeatureNotFound:
+            continue
+        backends.append(name)
+    return backends
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """解析后端名称；未安装指定后端时退回 html.parser"""
+    name = (name or DEFAULT_BACKEND).strip()
+    installed = available_backends()
+    if name == 'auto':
+        return installed[0]
+    if name not in installed:
+        logger.warning("HTML解析后端 %s 不可用，使用 %s", name, FALLBACK_BACKEND)
+        return FALLBACK_BACKEND
+    return name
+
+
+class ParseRegions:
+    """部分解析的区域定义
+
+    按类名、id、标签名或属性名匹配区域的根节点，根节点的整棵子树会被保留，
+    区域之外的节点（脚本、贡献日历、动态列表等）不创建对象。
+    anchor 为页面结构的核心区域（CSS选择器），部分解析结果中找不到时说明页面改版，需要完整解析。
+    """
+
+    def __init__(self, classes: Iterable[str] = (), ids: Iterable[str] = (), tags: Iterable[str] = (),
+                 attrs: Iterable[str] = (), anchor: Optional[str] = None):
+        self.classes = frozenset(classes)
+        self.ids = frozenset(ids)
+        self.tags = frozenset(tags)
+        self.attrs = frozenset(attrs)
+        self.anchor = anchor
+        self.strainer = SoupStrainer(self.matches)
+
+    def matches(self, name: str, attrs: Dict) -> bool:
+        """判断一个开始标签是否为区域根节点；attrs 为解析器传入的原始属性（class 尚未拆分）"""
+        if name in self.tags:
+            return True
+        if not attrs:
+            return False
+        classes = attrs.get('class')
+        if classes:
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not self.classes.isdisjoint(classes):
+                return True
+        if attrs.get('id') in self.ids:
+            return True
+        return not self.attrs.isdisjoint(attrs)
+
+
+def make_soup(content: Union[bytes, str], backend: str = FALLBACK_BACKEND,
+              regions: Optional[ParseRegions] = None) -> BeautifulSoup:
+    """所有页面解析的统一入口，使用指定后端构建 BeautifulSoup 树
+
+    指定 regions 时只解析这些区域；找不到核心区域时退回完整解析，保证提取结果不因页面改版而丢失。
+    """
+    if regions is None or not PARTIAL_PARSING or backend not in PARTIAL_BACKENDS:
+        return BeautifulSoup(content, backend)
+
+    soup = BeautifulSoup(content, backend, parse_only=regions.strainer)
+    if regions.anchor is None or soup.select_one(regions.anchor) is not None:
+        return soup
+    logger.debug("部分解析未找到核心区域 %s，退回完整解析", regions.anchor)
+    return BeautifulSoup(content, backend)
@@ -0,0 +1,120 @@
+import os
+import ssl
+import logging
+from typing import Dict, Optional, Tuple, Callable, List, Mapping
+
+import aiohttp
+import certifi
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 默认连接池配置，可通过环境变量覆盖
+DEFAULT_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "100"))
+DEFAULT_POOL_PER_HOST = int(os.getenv("HTTP_POOL_PER_HOST", "30"))
+DEFAULT_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60"))
+
+# 各上游的独立连接池，互不抢占连接
+GITHUB_WEB = "github_web"
+GITHUB_API = "github_api"
+DEEPSEEK = "deepseek"
+
+
+class ConnectionStats:
+    """单个连接池的请求与连接复用统计"""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+
+    def to_dict(self) -> Dict:
+        acquired = self.new_connections + self.reused_connections
+        return {
+            'requests': self.requests,
+            'new_connections': self.new_connections,
+            'reused_connections': self.reused_connections,
+            'reuse_ratio': round(self.reused_connections / acquired, 3) if acquired else 0.0
+        }
+
+
+class HTTPClientPool:
+    """按上游命名的 aiohttp 会话集合，由应用生命周期统一创建和关闭
+
+    每个上游（github.com 页面、api.github.com、DeepSeek）拥有独立的 keep-alive 连接池，
+    所有接口共享同一组会话，避免每次请求重新进行 TCP+TLS 握手。
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, pool_per_host: int = DEFAULT_POOL_PER_HOST,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+                 limits: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self.keepalive_timeout = keepalive_timeout
+        # 针对单个上游覆盖 (总连接数, 单主机连接数)
+        self.limits = limits or {}
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._stats: Dict[str, ConnectionStats] = {}
+        # 每个连接池的响应监听器：callback(请求头, 状态码, 响应头)
+        self._response_listeners: Dict[str, List[Callable[[Mapping, int, Mapping], None]]] = {}
+        self._ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+    def add_response_listener(self, name: str, listener: Callable[[Mapping, int, Mapping], None]):
+        """注册响应监听器，该连接池收到的每个响应头都会交给监听器处理"""
+        self._response_listeners.setdefault(name, []).append(listener)
+
+    def _trace_config(self, name: str, stats: ConnectionStats) -> aiohttp.TraceConfig:
+        """创建用于统计连接复用情况并分发响应头的 TraceConfig"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            stats.requests += 1
+
+        async def on_connection_create_end(session, context, params):
+            stats.new_connections += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            stats.reused_connections += 1
+
+        async def on_request_end(session, context, params):
+            for listener in self._response_listeners.get(name, []):
+                try:
+                    listener(params.headers, params.response.status, params.response.headers)
+                except Exception as e:
+                    logger.warning("响应监听器处理失败 (%s): %s", name, e)
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    async def get(self, name: str) -> aiohttp.ClientSession:
+        """获取指定上游的共享会话，首次使用时在当前事件循环中创建"""
+        session = self._sessions.get(name)
+        if session is None or session.closed:
+            pool_size, pool_per_host = self.limits.get(name, (self.pool_size, self.pool_per_host))
+            stats = self._stats.setdefault(name, ConnectionStats())
+            connector = aiohttp.TCPConnector(
+                limit=pool_size,
+                limit_per_host=pool_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+                ssl=self._ssl_context
+            )
+            session = aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config(name, stats)])
+            self._sessions[name] = session
+            logger.info("创建HTTP连接池 %s: 总连接数=%s, 单主机连接数=%s", name, pool_size, pool_per_host)
+        return session
+
+    async def close(self):
+        """关闭所有会话及其连接池"""
+        for name, session in self._sessions.items():
+            if not session.closed:
+                await session.close()
+                logger.info("已关闭HTTP连接池 %s", name)
+        self._sessions.clear()
+
+    def stats(self) -> Dict:
+        """返回各连接池的请求数和连接复用统计"""
+        return {name: stats.to_dict() for name, stats in self._stats.items()}
@@ -0,0 +1,155 @@
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+# 平台 -> 域名；按主机名的域名后缀匹配（www.twitter.com、mobile.twitter.com 都归到 twitter）
+PLATFORM_DOMAINS = {
+    'twitter': ['twitter.com', 'x.com'],
+    'linkedin': ['linkedin.com'],
+    'mastodon': ['mastodon.social', 'mastodon.online', 'mastodon.world', 'mas.to', 'fosstodon.org',
+                 'mstdn.social', 'mstdn.jp', 'hachyderm.io', 'infosec.exchange', 'techhub.social',
+                 'chaos.social', 'social.coop', 'ruby.social', 'floss.social', 'sigmoid.social',
+                 'toot.community', 'indieweb.social'],
+    'instagram': ['instagram.com'],
+    'facebook': ['facebook.com', 'fb.com'],
+    'youtube': ['youtube.com', 'youtu.be'],
+    'tiktok': ['tiktok.com'],
+    'github': ['github.com'],
+    'stackoverflow': ['stackoverflow.com', 'stackexchange.com'],
+    'devto': ['dev.to'],
+    'medium': ['medium.com'],
+    'hashnode': ['hashnode.com', 'hashnode.dev']
+}
+# 额外的 Mastodon 实例域名，逗号分隔
+EXTRA_MASTODON_INSTANCES = [domain.strip().lower() for domain in os.getenv("MASTODON_INSTANCES", "").split(',') if domain.strip()]
+# 主机名中带有这些片段的视为 Mastodon 实例（mastodon.example.org、mstdn.example 等自建实例）
+MASTODON_HOST_MARKERS = ('mastodon', 'mstdn', 'fosstodon')
+# 个人网站/博客常见的顶级域名（或二级域名中的一段，如 .co.uk）
+WEBSITE_TLDS = frozenset({'dev', 'io', 'com', 'org', 'net', 'me', 'co', 'blog', 'site'})
+# 每个分类器最多记住的主机名数量，超出后清空重新记录
+DEFAULT_MAX_HOSTS = int(os.getenv("LINK_CLASSIFIER_MAX_HOSTS", "4096"))
+
+# 取出主机名：带协议、协议相对（//host）或省略协议（host/path）的链接
+HOST_PATTERN = re.compile(r'^(?:[a-z][a-z0-9+.-]*:)?//(?:[^/?#@]*@)?([^/?#:]+)|^([a-z0-9-]+(?:\.[a-z0-9-]+)+)(?=[/:?#]|$)', re.I)
+# Mastodon 风格的个人主页路径：/@user
+MASTODON_PATH_PATTERN = re.compile(r'^(?:[a-z][a-z0-9+.-]*:)?//[^/?#]+/@([\w.]+)/?$', re.I)
+
+
+def _domain_index() -> Dict[str, str]:
+    index = {}
+    for platform, domains in PLATFORM_DOMAINS.items():
+        for domain in domains:
+            index[domain] = platform
+    for domain in EXTRA_MASTODON_INSTANCES:
+        index.setdefault(domain, 'mastodon')
+    return index
+
+
+def extract_username(url: str, platform: str, host: str = '') -> str:
+    """从 URL 中提取用户名"""
+    try:
+        if platform == 'twitter':
+            return url.split('/')[-1] if '/' in url else ''
+        elif platform == 'linkedin':
+            if '/in/' in url:
+                return url.split('/in/')[-1].split('/')[0]
+            elif '/company/' in url:
+                return url.split('/company/')[-1].split('/')[0]
+        elif platform == 'github':
+            parts = url.split('github.com/')[-1].split('/')
+            return parts[0] if parts and parts[0] not in ['orgs', 'organizations'] else ''
+        elif platform in ['instagram', 'facebook', 'youtube', 'tiktok']:
+            return url.split('/')[-1] if '/' in url else ''
+        elif platform == 'mastodon':
+            # https://instance/@user -> @user@instance
+            match = MASTODON_PATH_PATTERN.match(url)
+            if match and host:
+                return f"@{match.group(1)}@{host}"
+            if '@' in url:
+                parts = url.split('@')
+                return f"@{parts[-2]}@{parts[-1]}" if len(parts) >= 2 else ''
+        else:
+            return url.split('/')[-1] if '/' in url else ''
+    except Exception:
+        return ''
+
+
+class LinkClassifier:
+    """按主机名的域名后缀识别链接所属平台
+
+    平台表预先编成 域名 -> 平台 的索引，每个链接只需取出主机名，再按 a.b.c、b.c 依次查表，
+    不必对每个平台的每个域名做子串匹配；同一主机名的判断结果会被记住，同一页面或后续页面中重复出现的主机直接命中。
+    """
+
+    def __init__(self, max_hosts: int = DEFAULT_MAX_HOSTS):
+        self._index = _domain_index()
+        self._hosts: Dict[str, Optional[str]] = {}
+        self.max_hosts = max_hosts
+
+    def host_platform(self, host: str) -> Optional[str]:
+        """主机名对应的平台；不是已知平台但像个人网站时返回 'website'，都不是时返回 None"""
+        try:
+            return self._hosts[host]
+        except KeyError:
+            pass
+        labels = host.split('.')
+        platform = None
+        for start in range(len(labels) - 1):
+            platform = self._index.get('.'.join(labels[start:]))
+            if platform:
+                break
+        if platform is None:
+            if any(marker in host for marker in MASTODON_HOST_MARKERS):
+                platform = 'mastodon'
+            elif not WEBSITE_TLDS.isdisjoint(labels[1:]):
+                platform = 'website'
+        if len(self._hosts) >= self.max_hosts:
+            self._hosts.clear()
+        self._hosts[host] = platform
+        return platform
+
+    def classify(self, href: str) -> Optional[Dict]:
+        """分类单个链接，返回 {'platform', 'type', 'username' | 'value'}；无法识别时返回 None"""
+        href_lower = href.lower()
+        if href_lower.startswith('mailto:'):
+            return {
+                'platform': 'email',
+                'type': 'contact',
+                'value': href[len('mailto:'):]
+            }
+        if href_lower.startswith('tel:'):
+            return {
+                'platform': 'phone',
+                'type': 'contact',
+                'value': href[len('tel:'):]
+            }
+
+        match = HOST_PATTERN.match(href_lower)
+        if not match:
+            return None
+        host = (match.group(1) or match.group(2)).rstrip('.')
+        if host.startswith('www.'):
+            host = host[4:]
+        platform = self.host_platform(host)
+
+        # 未知主机上的 /@user 路径视为 Mastodon 实例
+        if platform in (None, 'website') and MASTODON_PATH_PATTERN.match(href_lower):
+            platform = 'mastodon'
+        if platform is None:
+            return None
+        if platform == 'website':
+            return {
+                'platform': 'website',
+                'type': 'contact',
+                'value': href
+            }
+        return {
+            'platform': platform,
+            'type': 'social',
+            'username': extract_username(href, platform, host)
+        }
+
+    def classify_many(self, hrefs: Iterable[str]) -> List[Optional[Dict]]:
+        """批量分类一个页面的所有链接，结果与输入顺序一致"""
+        classify = self.classify
+        return [classify(href) for href in hrefs]
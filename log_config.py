@@ -0,0 +1,141 @@
+import os
+import sys
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, List, Optional, TextIO
+
+# 日志级别（debug / info / warning / error）
+DEFAULT_LOG_LEVEL = os.getenv("LOG_LEVEL", "info").upper()
+# 日志由后台线程输出，请求处理线程只把日志记录放入队列，不等待 stdout
+LOG_ASYNC = os.getenv("LOG_ASYNC", "true").lower() == "true"
+# 后台队列上限；队列满时丢弃新记录而不是阻塞请求
+DEFAULT_LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# 高频日志采样：同一条消息模板每 N 条只输出1条，WARNING 及以上不采样；1 表示不采样
+DEFAULT_LOG_SAMPLE_EVERY = int(os.getenv("LOG_SAMPLE_EVERY", "10"))
+# 参与采样的 logger：逐元素、逐链接输出日志的解析模块
+DEFAULT_SAMPLED_LOGGERS = [name.strip() for name in os.getenv("LOG_SAMPLED_LOGGERS", "github_crawler,profile_extractor").split(',') if name.strip()]
+
+LOG_FORMAT = logging.BASIC_FORMAT
+# 采样计数最多记录的消息模板数，超出后清空重新计数
+MAX_SAMPLED_TEMPLATES = 1024
+
+
+class SamplingFilter(logging.Filter):
+    """按消息模板采样高频日志
+
+    以格式化前的消息模板（record.msg）计数，同一模板第1条、第 every+1 条……输出，其余丢弃；
+    使用 logger.info("...%s", value) 的惰性写法时，同一处日志的模板相同，才能被归为一类。
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._counts: Dict[str, int] = {}
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.every == 1:
+            return True
+        key = record.msg if isinstance(record.msg, str) else repr(record.msg)
+        count = self._counts.get(key, 0)
+        if count == 0 and len(self._counts) >= MAX_SAMPLED_TEMPLATES:
+            self._counts.clear()
+        self._counts[key] = count + 1
+        if count % self.every == 0:
+            return True
+        self.suppressed += 1
+        return False
+
+
+class DeferredQueueHandler(QueueHandler):
+    """把日志记录原样放入进程内队列，格式化留给后台线程
+
+    标准 QueueHandler 会在调用线程中先格式化消息（为跨进程传递做准备），这里的队列只在进程内使用，
+    消息模板和参数原样交给后台线程；因此日志参数在记录后不应再被修改。
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """根 logger 的输出管道：级别过滤 -> 高频日志采样 -> 后台队列 -> 输出"""
+
+    def __init__(self, level: str = DEFAULT_LOG_LEVEL, async_output: bool = LOG_ASYNC,
+                 sample_every: int = DEFAULT_LOG_SAMPLE_EVERY,
+                 sampled_loggers: Iterable[str] = DEFAULT_SAMPLED_LOGGERS,
+                 queue_size: int = DEFAULT_LOG_QUEUE_SIZE, stream: Optional[TextIO] = None):
+        self.level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+        if not isinstance(self.level, int):
+            self.level = logging.INFO
+        self.output = logging.StreamHandler(stream or sys.stderr)
+        self.output.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.queue_handler: Optional[DeferredQueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+        if async_output:
+            log_queue = queue.Queue(queue_size)
+            self.queue_handler = DeferredQueueHandler(log_queue)
+            self.listener = QueueListener(log_queue, self.output, respect_handler_level=True)
+        self.running = False
+        self.filters: List[SamplingFilter] = []
+        self._sampled: List[logging.Logger] = []
+        if sample_every > 1:
+            for name in sampled_loggers:
+                sampling = SamplingFilter(sample_every)
+                self.filters.append(sampling)
+                self._sampled.append(logging.getLogger(name))
+
+    def start(self) -> 'LogPipeline':
+        """替换根 logger 的处理器（包括模块导入时 basicConfig 安装的处理器）并启动后台线程"""
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.setLevel(self.level)
+        for logger, sampling in zip(self._sampled, self.filters):
+            # 重新配置时替换之前的采样过滤器
+            for previous in [f for f in logger.filters if isinstance(f, SamplingFilter)]:
+                logger.removeFilter(previous)
+            logger.addFilter(sampling)
+        if self.listener is not None:
+            self.listener.start()
+            self.running = True
+            root.addHandler(self.queue_handler)
+        else:
+            root.addHandler(self.output)
+        return self
+
+    def stop(self):
+        """输出队列中剩余的记录并停止后台线程；之后的日志直接同步输出"""
+        if not self.running:
+            return
+        root = logging.getLogger()
+        root.removeHandler(self.queue_handler)
+        self.listener.stop()
+        self.running = False
+        root.addHandler(self.output)
+
+    def stats(self) -> Dict:
+        """返回日志级别、是否异步输出、队列积压、因队列满丢弃和被采样丢弃的记录数"""
+        return {
+            'level': logging.getLevelName(self.level),
+            'async': self.listener is not None,
+            'queued': self.queue_handler.queue.qsize() if self.queue_handler else 0,
+            'dropped': self.queue_handler.dropped if self.queue_handler else 0,
+            'sampled_out': sum(sampling.suppressed for sampling in self.filters)
+        }
+
+
+def configure_logging(**kwargs) -> LogPipeline:
+    """按环境变量配置并启动日志管道"""
+    return LogPipeline(**kwargs).start()
@@ -1,29 +1,62 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 import logging
 import requests
 from urllib.parse import quote
 import json
-import re
 import asyncio
 import ssl
 import certifi
 import os
 from dotenv import load_dotenv
 from pathlib import Path
+from contextlib import asynccontextmanager
+
+import aiohttp
+
+# 先加载 .env，使各模块在导入时读取的配置（连接池、限流、上游地址等）也能从 .env 设置
+load_dotenv(override=False)
 
 from models import ContributorsResponse, UserProfile, Contributor, RepositoryInfo, SearchResult
-from github_crawler import GitHubCrawler
+from github_crawler import AsyncGitHubCrawler, UPSTREAM_FAILURE_STATUSES, GITHUB_API_BASE
+from http_pool import HTTPClientPool, GITHUB_API, DEEPSEEK
+from rate_limit import RateLimitScheduler, CORE, SEARCH
+from token_pool import GitHubTokenPool
+from conditional_cache import ConditionalRequestCache
+from singleflight import SingleFlight, coalesced
+from result_cache import ResultCache, Missing, cached, track_freshness, REPOSITORY, SEARCH as SEARCH_RESULTS
+from crawl_store import CrawlStore
+from ai_response_cache import AIResponseCache
+from circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from html_parser import resolve_backend
+from parse_pool import ParsePool
+from patterns import AI_JSON_BLOCK_PATTERN
+from log_config import LogPipeline, configure_logging
+import deadline
+from deadline import DeadlineExceeded, with_deadline, DEFAULT_REQUEST_DEADLINE, DEFAULT_RECOMMENDATION_DEADLINE
 
-# 设置日志
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：启动时创建共享组件并从持久化存储预热结果缓存，退出时关闭共享的HTTP连接池、解析进程池和持久化存储"""
+    create_services()
+    await result_cache.warm()
+    yield
+    result_cache.cancel_refreshes()
+    await http_pool.close()
+    parse_pool.shutdown()
+    crawl_store.close()
+    log_pipeline.stop()
+
+
 app = FastAPI(
     title="GitHub 项目推荐系统",
     description="基于AI的GitHub项目智能推荐",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 配置 CORS - 添加Vercel域名
@@ -35,6 +68,8 @@ app.add_middleware(
     allow_credentials=False,  # 使用通配符时必须设为False
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    # 前端可读取结果缓存的来源和数据年龄
+    expose_headers=["X-Cache", "X-Data-Age"],
 )
 
 # Railway部署不需要静态文件服务
@@ -43,17 +78,38 @@ app.add_middleware(
 
 # 移除根路径的静态文件服务，Railway只提供API
 
-# 初始化爬虫
-crawler = GitHubCrawler()
+# 所有接口共享的组件由 create_services() 在应用启动时创建，导入本模块没有副作用：
+# 解析进程以 spawn 方式启动时会重新导入 __main__，python main.py 运行时每个子进程都会执行本模块的顶层代码
+log_pipeline: Optional[LogPipeline] = None
+http_pool: Optional[HTTPClientPool] = None
+rate_limiter: Optional[RateLimitScheduler] = None
+token_pool: Optional[GitHubTokenPool] = None
+conditional_cache: Optional[ConditionalRequestCache] = None
+singleflight: Optional[SingleFlight] = None
+breakers: Optional[CircuitBreakerRegistry] = None
+crawl_store: Optional[CrawlStore] = None
+result_cache: Optional[ResultCache] = None
+parse_pool: Optional[ParsePool] = None
+crawler: Optional[AsyncGitHubCrawler] = None
+ai_cache: Optional[AIResponseCache] = None
+mcp_github: Optional['MCPGitHubIntegration'] = None
+
+
+def ensure_parse_capacity():
+    """解析队列已满时直接返回503，让客户端稍后重试，而不是继续堆积请求"""
+    if parse_pool.busy():
+        raise HTTPException(
+            status_code=503,
+            detail="服务繁忙，请稍后重试",
+            headers={"Retry-After": "1"}
+        )
 
 # DeepSeek API 配置 - 优先 .env，然后环境变量
-load_dotenv(override=False)
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY", "your_deepseek_api_key_here")
-DEEPSEEK_API_BASE = "https://api.deepseek.com/v1/chat/completions"
-
-# MCP GitHub 配置 - 使用环境变量
-# 注意：默认不提供token，若未配置则使用匿名请求以避免401错误
-MCP_GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "").strip()
+# 可指向本地替身服务器进行离线压测（见 stub_server.py）
+DEEPSEEK_API_BASE = os.getenv("DEEPSEEK_API_BASE", "https://api.deepseek.com/v1/chat/completions")
+DEEPSEEK_MODEL = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
+DEEPSEEK_TEMPERATURE = float(os.getenv("DEEPSEEK_TEMPERATURE", "0.7"))
 
 # AI提示词 - 用户提供的专业提示词
 AI_PROMPT = """# Role: AI开源项目推荐专家
@@ -151,91 +207,139 @@ AI_PROMPT = """# Role: AI开源项目推荐专家
 class MCPGitHubIntegration:
     """MCP GitHub 集成类，用于获取项目详细信息"""
     
-    def __init__(self):
-        self.github_api_base = "https://api.github.com"
-        # 仅在提供有效token时附带Authorization头
+    def __init__(self, http_pool: HTTPClientPool, token_pool: GitHubTokenPool,
+                 conditional_cache: ConditionalRequestCache, singleflight: SingleFlight,
+                 breakers: CircuitBreakerRegistry, result_cache: ResultCache):
+        self.http_pool = http_pool
+        self.conditional_cache = conditional_cache
+        self.singleflight = singleflight
+        self.breakers = breakers
+        self.result_cache = result_cache
+        # token 由共享的 token 池按剩余额度逐次选择，没有可用 token 时使用匿名请求
+        self.token_pool = token_pool
+        self.github_api_base = GITHUB_API_BASE
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHub-Crawler-MCP/1.0"
         }
-        if MCP_GITHUB_TOKEN:
-            self.headers["Authorization"] = f"token {MCP_GITHUB_TOKEN}"
     
+    async def _get_json(self, url: str, auth_headers: Dict[str, str], timeout: float = 15):
+        """通过共享连接池请求GitHub API，返回 (状态码, JSON数据)"""
+        req_headers = dict(self.headers)
+        req_headers.update(auth_headers)
+        session = await self.http_pool.get(GITHUB_API)
+        # 通过条件请求缓存发送，数据未变化时GitHub返回304，直接使用已缓存的响应体；
+        # 受 api.github.com 熔断器保护，熔断期间直接抛出 CircuitOpenError
+        status, body = await self.breakers.get(GITHUB_API).call(
+            lambda: self.conditional_cache.get(
+                session, url, headers=req_headers,
+                timeout=aiohttp.ClientTimeout(total=deadline.budget(timeout, url))
+            ),
+            is_failure=lambda result: result[0] in UPSTREAM_FAILURE_STATUSES
+        )
+        if status != 200:
+            return status, None
+        return status, json.loads(body)
+    
+    def _basic_repo_info(self, owner: str, repo: str) -> Dict:
+        """API受限时返回的基本仓库信息（没有统计数据）"""
+        return {
+            'owner': owner,
+            'name': repo,
+            'full_name': f"{owner}/{repo}",
+            'description': None,
+            'stars': 0,
+            'forks': 0,
+            'language': None,
+            'url': f"https://github.com/{owner}/{repo}",
+            'created_at': None,
+            'updated_at': None,
+            'topics': [],
+            'license': None
+        }
+    
+    # 搜索无结果的名称做负缓存：AI 编造的仓库名常以不同的 owner 重复出现
+    @cached(SEARCH_RESULTS, keep_missing=True)
+    @coalesced
+    async def search_repo_by_name(self, query_name: str) -> Union[Dict, Missing, None]:
+        """当owner/repo无效时，使用GitHub搜索API按名称检索最匹配仓库
+
+        搜索确认没有结果时返回 Missing(None)；额度不足跳过搜索或请求失败时返回 None。
+        """
+        search_url = f"{self.github_api_base}/search/repositories?q={quote(query_name)}&sort=stars&order=desc&per_page=1"
+        auth_headers = self.token_pool.acquire(SEARCH)
+        if auth_headers is None:
+            logger.info("GitHub API search 额度不足，跳过搜索回退: %s", query_name)
+            return None
+        logger.info("回退搜索仓库: %s", search_url)
+        status, data = await self._get_json(search_url, auth_headers)
+        if status == 200 and data:
+            items = data.get('items', [])
+            return items[0] if items else Missing(None)
+        return None
+    
+    # 额度不足时的基本信息和失败时的 None 不缓存，只缓存API或搜索纠正得到的完整信息；
+    # 仓库不存在且搜索未能纠正时做负缓存
+    @cached(REPOSITORY, lambda info: bool(info and info.get('created_at')))
+    @coalesced
     async def get_repository_with_mcp(self, owner: str, repo: str) -> Optional[Dict]:
         """使用 MCP GitHub 获取仓库信息"""
+        # 之前经搜索纠正过的名称直接使用纠正后的仓库
+        alias = await self.result_cache.resolve_alias(REPOSITORY, f"{owner}/{repo}")
+        if alias:
+            logger.info("使用已纠正的仓库名: %s/%s -> %s", owner, repo, alias)
+            alias_owner, alias_repo = alias.split('/', 1)
+            return await self.get_repository_with_mcp(alias_owner, alias_repo)
+        
         try:
-            # 使用requests库（已验证SSL工作正常）
-            import requests
-            import asyncio
-            import concurrent.futures
+            url = f"{self.github_api_base}/repos/{owner}/{repo}"
             
-            def make_request():
-                url = f"{self.github_api_base}/repos/{owner}/{repo}"
-                logger.info(f"请求GitHub API: {url}")
-                
-                def do_get(use_auth: bool):
-                    req_headers = dict(self.headers)
-                    if not use_auth and 'Authorization' in req_headers:
-                        req_headers.pop('Authorization', None)
-                    return requests.get(url, headers=req_headers, timeout=15)
-
-                # 首次优先使用带token（若存在），失败401/403则回退为匿名请求
-                try:
-                    response = do_get(bool(MCP_GITHUB_TOKEN))
-                    if response.status_code in (401, 403) and MCP_GITHUB_TOKEN:
-                        logger.warning("授权访问失败或受限，尝试匿名方式请求GitHub API")
-                        response = do_get(False)
-                except Exception:
-                    # 网络错误时再尝试匿名一次
-                    logger.warning("带授权请求失败，尝试匿名请求")
-                    response = do_get(False)
-
-                # 检查响应状态
-                if response.status_code == 404:
-                    logger.warning(f"仓库 {owner}/{repo} 不存在或无法访问")
-                    return None
-                elif response.status_code == 403:
-                    logger.warning(f"GitHub API 访问限制，无法获取仓库 {owner}/{repo} 信息")
-                    # 返回基本信息，但没有统计数据
-                    return {
-                        'owner': owner,
-                        'name': repo,
-                        'full_name': f"{owner}/{repo}",
-                        'description': None,
-                        'stars': 0,
-                        'forks': 0,
-                        'language': None,
-                        'url': f"https://github.com/{owner}/{repo}",
-                        'created_at': None,
-                        'updated_at': None,
-                        'topics': [],
-                        'license': None
-                    }
-
-                response.raise_for_status()
-                return response.json()
+            # 所有身份的 core 额度都已耗尽时不发请求，直接返回基本信息交由页面抓取补全
+            auth_headers = self.token_pool.acquire(CORE)
+            if auth_headers is None:
+                logger.info("GitHub API core 额度不足，跳过API请求: %s/%s", owner, repo)
+                return self._basic_repo_info(owner, repo)
             
-            def search_repo_by_name(query_name: str) -> Optional[Dict]:
-                """当owner/repo无效时，使用GitHub搜索API按名称检索最匹配仓库"""
-                search_url = f"{self.github_api_base}/search/repositories?q={quote(query_name)}&sort=stars&order=desc&per_page=1"
-                logger.info(f"回退搜索仓库: {search_url}")
-                resp = requests.get(search_url, headers={k:v for k,v in self.headers.items() if k != 'Authorization' or MCP_GITHUB_TOKEN}, timeout=15)
-                if resp.status_code == 200:
-                    items = resp.json().get('items', [])
-                    return items[0] if items else None
-                return None
+            logger.info("请求GitHub API: %s", url)
+            
+            # token 返回401/403时已被隔离或标记为额度耗尽，重新从池中选择一次（其他token或匿名）
+            try:
+                status, data = await self._get_json(url, auth_headers)
+                if status in (401, 403) and auth_headers:
+                    retry_headers = self.token_pool.acquire(CORE)
+                    if retry_headers is not None:
+                        logger.warning("授权访问失败或受限，使用其他token或匿名方式请求GitHub API")
+                        status, data = await self._get_json(url, retry_headers)
+            except CircuitOpenError:
+                logger.info("api.github.com 熔断中，跳过API请求: %s/%s", owner, repo)
+                return self._basic_repo_info(owner, repo)
+            except DeadlineExceeded:
+                logger.info("请求处理时限已用完，跳过API请求: %s/%s", owner, repo)
+                return self._basic_repo_info(owner, repo)
+            except Exception:
+                # 网络错误时再尝试一次
+                logger.warning("GitHub API 请求失败，重新选择身份后重试")
+                retry_headers = self.token_pool.acquire(CORE)
+                if retry_headers is None:
+                    return self._basic_repo_info(owner, repo)
+                status, data = await self._get_json(url, retry_headers)
             
-            # 在线程池中执行请求以保持异步
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                data = await loop.run_in_executor(executor, make_request)
+            # 检查响应状态
+            if status == 404:
+                logger.warning("仓库 %s/%s 不存在或无法访问", owner, repo)
+                data = None
+            elif status == 403:
+                logger.warning("GitHub API 访问限制，无法获取仓库 %s/%s 信息", owner, repo)
+                # 返回基本信息，但没有统计数据
+                return self._basic_repo_info(owner, repo)
+            elif status != 200:
+                raise Exception(f"GitHub API 返回状态码 {status}")
             
             if data is None:
                 # 直接根据repo名进行搜索校正
                 try:
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        search_data = await loop.run_in_executor(executor, search_repo_by_name, repo)
-                    if search_data:
+                    search_data = await self.search_repo_by_name(repo)
+                    if search_data and not isinstance(search_data, Missing):
                         corrected = {
                             'owner': search_data.get('owner', {}).get('login'),
                             'name': search_data.get('name'),
@@ -250,11 +354,18 @@ class MCPGitHubIntegration:
                             'topics': search_data.get('topics', []),
                             'license': search_data.get('license', {}).get('name') if search_data.get('license') else None
                         }
-                        logger.info(f"基于搜索回退纠正仓库: {corrected['full_name']}")
+                        logger.info("基于搜索回退纠正仓库: %s", corrected['full_name'])
+                        if corrected['full_name']:
+                            await self.result_cache.put_alias(REPOSITORY, f"{owner}/{repo}", corrected['full_name'])
                         return corrected
                 except Exception as e:
-                    logger.warning(f"搜索回退失败: {e}")
-                return None
+                    logger.warning("搜索回退失败: %s", e)
+                    return None
+                if search_data is None:
+                    # 搜索被跳过或失败，无法确认仓库不存在，不做负缓存
+                    return None
+                # 仓库不存在且搜索确认没有纠正结果
+                return Missing(None)
                 
             result = {
                 'owner': data.get('owner', {}).get('login', owner),
@@ -271,15 +382,71 @@ class MCPGitHubIntegration:
                 'license': data.get('license', {}).get('name') if data.get('license') else None
             }
             
-            logger.info(f"成功获取仓库 {owner}/{repo} 信息: {result['stars']} stars, {result['forks']} forks")
+            logger.info("成功获取仓库 %s/%s 信息: %s stars, %s forks", owner, repo, result['stars'], result['forks'])
             return result
                     
         except Exception as e:
-            logger.error(f"MCP GitHub API 请求失败: {e}")
+            logger.error("MCP GitHub API 请求失败: %s", e)
             return None
 
-# 初始化 MCP GitHub 集成
-mcp_github = MCPGitHubIntegration()
+def create_services():
+    """创建所有接口共享的组件；应用启动时调用，已创建时直接返回"""
+    global log_pipeline, http_pool, rate_limiter, token_pool, conditional_cache, singleflight, breakers
+    global crawl_store, result_cache, parse_pool, crawler, ai_cache, mcp_github
+    if crawler is not None:
+        return
+
+    # 设置日志：级别由 LOG_LEVEL 决定，输出在后台线程中进行，解析模块的高频日志按模板采样
+    log_pipeline = configure_logging()
+
+    # 所有接口共享的HTTP连接池（按上游区分，随应用生命周期关闭）
+    http_pool = HTTPClientPool()
+
+    # GitHub API 限流预算调度器，读取每个 api.github.com 响应的限流头
+    rate_limiter = RateLimitScheduler()
+    http_pool.add_response_listener(GITHUB_API, rate_limiter.observe)
+
+    # GitHub token 池（GITHUB_TOKENS 逗号分隔 + GITHUB_TOKEN），爬虫与 MCP 集成共享
+    token_pool = GitHubTokenPool.from_env(rate_limiter)
+    http_pool.add_response_listener(GITHUB_API, token_pool.observe)
+
+    # api.github.com 条件请求缓存（ETag / Last-Modified），爬虫与 MCP 集成共享
+    conditional_cache = ConditionalRequestCache()
+
+    # 在途请求合并：并发的相同查询共享一次上游请求和解析
+    singleflight = SingleFlight()
+
+    # 按上游和按策略的熔断器，已知故障的路径直接跳过而不是等待超时
+    breakers = CircuitBreakerRegistry()
+
+    # 仓库信息、贡献者列表和用户资料的本地 SQLite 存储，服务重启后仍可读取
+    crawl_store = CrawlStore()
+
+    # 仓库信息、贡献者、用户资料和搜索结果的进程内缓存，按类型设置有效期，按近似内存占用淘汰；
+    # 未命中时读取持久化存储
+    result_cache = ResultCache(store=crawl_store)
+
+    # 页面解析进程池：解析在子进程中进行，可利用多个CPU核心（PARSE_WORKERS=0 时在当前进程内解析）
+    parse_pool = ParsePool(resolve_backend())
+
+    # 初始化异步爬虫（共享连接池，不阻塞事件循环）
+    crawler = AsyncGitHubCrawler(
+        http_pool=http_pool,
+        rate_limiter=rate_limiter,
+        token_pool=token_pool,
+        conditional_cache=conditional_cache,
+        singleflight=singleflight,
+        breakers=breakers,
+        parse_pool=parse_pool,
+        result_cache=result_cache
+    )
+
+    # AI 推荐结果的精确匹配缓存：相同的查询、数量、模型、temperature 和提示词直接使用已解析的结果
+    ai_cache = AIResponseCache(DEEPSEEK_MODEL, DEEPSEEK_TEMPERATURE, AI_PROMPT, store=crawl_store)
+
+    # 初始化 MCP GitHub 集成
+    mcp_github = MCPGitHubIntegration(http_pool, token_pool, conditional_cache, singleflight, breakers, result_cache)
+
 
 @app.get("/")
 async def root():
@@ -292,23 +459,60 @@ async def root():
 
 @app.get("/api/health")
 async def health_check():
-    """健康检查接口"""
-    return {"status": "healthy", "message": "API 服务正常运行"}
+    """健康检查接口，附带各上游和策略的熔断器状态"""
+    if breakers.any_open():
+        return {
+            "status": "degraded",
+            "message": "部分上游处于熔断状态，相关请求将使用备用路径",
+            "circuit_breakers": breakers.snapshot()
+        }
+    return {"status": "healthy", "message": "API 服务正常运行", "circuit_breakers": breakers.snapshot()}
+
+@app.get("/api/stats")
+async def get_runtime_stats():
+    """运行时统计：各上游连接池的请求数与连接复用情况、GitHub API 限流额度、选择器命中率"""
+    return {
+        "http_pools": http_pool.stats(),
+        "rate_limits": rate_limiter.snapshot(),
+        "github_tokens": token_pool.snapshot(),
+        "conditional_cache": conditional_cache.stats(),
+        "singleflight": singleflight.stats(),
+        "result_cache": result_cache.stats(),
+        # 统计记录数需要查询 SQLite，在线程中执行
+        "crawl_store": await asyncio.to_thread(crawl_store.stats),
+        "ai_cache": ai_cache.stats(),
+        "html_parser": crawler.html_parser,
+        "parse_pool": parse_pool.stats(),
+        "logging": log_pipeline.stats(),
+        "streaming": crawler.streaming_stats(),
+        "selectors": crawler.selector_stats.stats()
+    }
 
 @app.get("/api/contributors/{owner}/{repo}", response_model=ContributorsResponse)
+@with_deadline(DEFAULT_REQUEST_DEADLINE)
 async def get_contributors(
     owner: str,
     repo: str,
+    response: Response,
     limit: int = Query(default=10, ge=1, le=100, description="返回贡献者数量限制")
 ):
-    """获取指定仓库的贡献者列表"""
+    """获取指定仓库的贡献者列表；响应头 X-Cache / X-Data-Age 说明数据来源和年龄"""
+    ensure_parse_capacity()
+    freshness = track_freshness()
     try:
-        logger.info(f"获取仓库 {owner}/{repo} 的贡献者列表，限制: {limit}")
+        logger.info("获取仓库 %s/%s 的贡献者列表，限制: %s", owner, repo, limit)
         
-        # 使用爬虫获取数据
-        repo_info = crawler.get_repository_info(owner, repo)
-        contributors_data = crawler.get_contributors(owner, repo, limit)
+        # 使用爬虫并发获取仓库信息和贡献者
+        repo_info, contributors_data = await asyncio.gather(
+            crawler.get_repository_info(owner, repo),
+            crawler.get_contributors(owner, repo, limit)
+        )
         
+        if not contributors_data and deadline.expired():
+            raise HTTPException(
+                status_code=504,
+                detail=f"获取仓库 {owner}/{repo} 的贡献者信息超时，请稍后再试"
+            )
         if not contributors_data:
             raise HTTPException(
                 status_code=404,
@@ -339,6 +543,7 @@ async def get_contributors(
             updated_at=repo_info.get('updated_at')
         )
         
+        freshness.apply(response.headers)
         return ContributorsResponse(
             repository=repository,
             contributors=contributors,
@@ -349,23 +554,25 @@ async def get_contributors(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"获取贡献者列表时发生错误: {e}")
+        logger.error("获取贡献者列表时发生错误: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"获取贡献者信息时发生内部错误: {str(e)}"
         )
 
 @app.get("/api/suggestions")
+@with_deadline(DEFAULT_REQUEST_DEADLINE)
 async def get_search_suggestions(q: str = Query(..., description="搜索关键词"), limit: int = Query(default=5, ge=1, le=10)):
     """获取项目搜索建议"""
+    ensure_parse_capacity()
     try:
         if not q or len(q.strip()) < 2:
             return {"suggestions": []}
         
-        logger.info(f"获取搜索建议: '{q}', 限制: {limit}")
+        logger.info("获取搜索建议: '%s', 限制: %s", q, limit)
         
         # 使用GitHub爬虫搜索仓库
-        repositories = crawler.search_repositories(q, limit)
+        repositories = await crawler.search_repositories(q, limit)
         
         suggestions = []
         for repo in repositories:
@@ -380,17 +587,20 @@ async def get_search_suggestions(q: str = Query(..., description="搜索关键
         return {"suggestions": suggestions}
     
     except Exception as e:
-        logger.error(f"获取搜索建议时发生错误: {e}")
+        logger.error("获取搜索建议时发生错误: %s", e)
         return {"suggestions": []}
 
 @app.get("/api/profile/{username}", response_model=UserProfile)
-async def get_user_profile(username: str):
-    """获取用户详细资料"""
+@with_deadline(DEFAULT_REQUEST_DEADLINE)
+async def get_user_profile(username: str, response: Response):
+    """获取用户详细资料；响应头 X-Cache / X-Data-Age 说明数据来源和年龄"""
+    ensure_parse_capacity()
+    freshness = track_freshness()
     try:
-        logger.info(f"获取用户 {username} 的详细资料")
+        logger.info("获取用户 %s 的详细资料", username)
         
         # 使用爬虫获取用户资料
-        profile_data = crawler.get_user_profile(username)
+        profile_data = await crawler.get_user_profile(username)
         
         if not profile_data:
             raise HTTPException(
@@ -431,18 +641,20 @@ async def get_user_profile(username: str):
             additional_info=profile_data.get('additional_info')
         )
         
+        freshness.apply(response.headers)
         return profile
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"获取用户资料时发生错误: {e}")
+        logger.error("获取用户资料时发生错误: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"获取用户资料时发生内部错误: {str(e)}"
         )
 
 @app.post("/api/recommendations")
+@with_deadline(DEFAULT_RECOMMENDATION_DEADLINE)
 async def get_project_recommendations(request: dict):
     """基于自然语言描述获取GitHub项目推荐"""
     try:
@@ -452,13 +664,19 @@ async def get_project_recommendations(request: dict):
         
         limit = min(request.get('limit', 5), 10)
         
-        logger.info(f"收到项目推荐请求: {query[:50]}..., 限制: {limit}")
+        logger.info("收到项目推荐请求: %s..., 限制: %s", query[:50], limit)
         
-        # 使用DeepSeek API生成推荐结果
-        ai_response = await call_deepseek_api(query, limit)
-        
-        # 解析AI响应并提取项目信息
-        analysis_result = parse_ai_response(ai_response)
+        # 相同的需求直接使用缓存的解析结果，跳过AI调用
+        analysis_result = await ai_cache.get(query, limit)
+        if analysis_result is not None:
+            logger.info("使用缓存的AI推荐结果")
+        else:
+            # 使用DeepSeek API生成推荐结果
+            ai_response = await call_deepseek_api(query, limit)
+            
+            # 解析AI响应并提取项目信息
+            analysis_result = parse_ai_response(ai_response)
+            await ai_cache.put(query, limit, analysis_result)
         
         # 获取项目详细信息
         detailed_recommendations = await enrich_recommendations(analysis_result['recommendations'])
@@ -472,9 +690,21 @@ async def get_project_recommendations(request: dict):
         
     except HTTPException:
         raise
+    except CircuitOpenError as e:
+        logger.warning("生成项目推荐时AI服务熔断: %s", e)
+        raise HTTPException(
+            status_code=503,
+            detail="AI服务暂时不可用，请稍后再试。"
+        )
+    except DeadlineExceeded as e:
+        logger.warning("生成项目推荐超时: %s", e)
+        raise HTTPException(
+            status_code=504,
+            detail="AI服务响应超过处理时限，请稍后再试或简化您的查询内容。"
+        )
     except Exception as e:
         error_msg = str(e)
-        logger.error(f"生成项目推荐时发生错误: {e}")
+        logger.error("生成项目推荐时发生错误: %s", e)
         
         # 针对不同类型的错误提供不同的用户友好的错误信息
         if "多次尝试后仍然超时" in error_msg:
@@ -502,7 +732,7 @@ async def call_deepseek_api(query: str, limit: int = 5) -> str:
     
     # 使用用户提供的专业提示词
     payload = {
-        "model": "deepseek-chat",
+        "model": DEEPSEEK_MODEL,
         "messages": [
             {
                 "role": "system",
@@ -514,17 +744,29 @@ async def call_deepseek_api(query: str, limit: int = 5) -> str:
             }
         ],
         "max_tokens": 2000,
-        "temperature": 0.7
+        "temperature": DEEPSEEK_TEMPERATURE
     }
     
-    # 使用requests库（已验证SSL工作正常）
-    import requests
+    session = await http_pool.get(DEEPSEEK)
+    breaker = breakers.get(DEEPSEEK)
     
-    # 在线程池中执行同步请求
-    import asyncio
-    import concurrent.futures
+    async def post_once(timeout: float):
+        try:
+            async with session.post(
+                DEEPSEEK_API_BASE,
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=deadline.budget(timeout, "DeepSeek API"))
+            ) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except asyncio.TimeoutError:
+            # 因请求时限被截短而超时，不计为上游故障，也不再重试
+            if deadline.expired():
+                raise DeadlineExceeded("DeepSeek API") from None
+            raise
     
-    def make_request_with_retry():
+    async def make_request_with_retry():
         """带重试机制的请求函数"""
         max_retries = 2
         timeouts = [60, 90]  # 逐次增加超时时间
@@ -532,41 +774,35 @@ async def call_deepseek_api(query: str, limit: int = 5) -> str:
         for attempt in range(max_retries):
             try:
                 timeout = timeouts[attempt] if attempt < len(timeouts) else 90
-                logger.info(f"DeepSeek API调用尝试 {attempt + 1}/{max_retries}，超时时间: {timeout}秒")
+                logger.info("DeepSeek API调用尝试 %s/%s，超时时间: %s秒", attempt + 1, max_retries, timeout)
                 
-                response = requests.post(
-                    DEEPSEEK_API_BASE, 
-                    json=payload, 
-                    headers=headers, 
-                    timeout=timeout
-                )
-                response.raise_for_status()
-                return response.json()
+                # DeepSeek 熔断期间直接抛出 CircuitOpenError，不再重试
+                return await breaker.call(lambda: post_once(timeout))
                 
-            except requests.exceptions.Timeout as e:
-                logger.warning(f"DeepSeek API第{attempt + 1}次尝试超时: {e}")
+            except asyncio.TimeoutError as e:
+                logger.warning("DeepSeek API第%s次尝试超时: %s", attempt + 1, e)
                 if attempt == max_retries - 1:  # 最后一次尝试
                     raise Exception("多次尝试后仍然超时，请稍后再试或简化您的查询内容")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"DeepSeek API第{attempt + 1}次尝试失败: {e}")
+            except aiohttp.ClientError as e:
+                logger.error("DeepSeek API第%s次尝试失败: %s", attempt + 1, e)
                 if attempt == max_retries - 1:  # 最后一次尝试
                     raise
             
-            # 重试前等待一下
+            # 重试前等待一下；剩余时间不够退避时直接放弃
             if attempt < max_retries - 1:
-                import time
-                time.sleep(2 ** attempt)  # 指数退避：2秒, 4秒...
+                backoff = 2 ** attempt  # 指数退避：2秒, 4秒...
+                left = deadline.remaining()
+                if left is not None and left <= backoff:
+                    raise DeadlineExceeded("DeepSeek API")
+                await asyncio.sleep(backoff)
     
-    # 在线程池中执行请求以保持异步
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        data = await loop.run_in_executor(executor, make_request_with_retry)
+    data = await make_request_with_retry()
     
     if not data or 'choices' not in data or not data['choices']:
         raise Exception("DeepSeek API 返回数据格式异常")
     
     ai_response = data['choices'][0]['message']['content']
-    logger.info(f"DeepSeek API调用成功，返回内容长度: {len(ai_response)}")
+    logger.info("DeepSeek API调用成功，返回内容长度: %s", len(ai_response))
     return ai_response
 
 def parse_ai_response(ai_response: str) -> dict:
@@ -581,7 +817,7 @@ def parse_ai_response(ai_response: str) -> dict:
                 if isinstance(keywords, str):
                     keywords = [kw.strip() for kw in keywords.replace('、', ',').split(',') if kw.strip()]
                 
-                logger.info(f"直接JSON解析成功，推荐项目数量: {len(json_data['recommendations'])}")
+                logger.info("直接JSON解析成功，推荐项目数量: %s", len(json_data['recommendations']))
                 return {
                     'analysis': {
                         'summary': json_data['analysis'].get('summary', '基于您的需求进行了分析'),
@@ -593,7 +829,7 @@ def parse_ai_response(ai_response: str) -> dict:
             pass
         
         # 如果直接解析失败，尝试解析``json```代码块
-        json_match = re.search(r'```json\s*({[\s\S]*?})\s*```', ai_response)
+        json_match = AI_JSON_BLOCK_PATTERN.search(ai_response)
         if json_match:
             try:
                 json_data = json.loads(json_match.group(1))
@@ -605,7 +841,7 @@ def parse_ai_response(ai_response: str) -> dict:
                     if isinstance(keywords, str):
                         keywords = [kw.strip() for kw in keywords.replace('、', ',').split(',') if kw.strip()]
                     
-                    logger.info(f"代码块JSON解析成功，推荐项目数量: {len(json_data['recommendations'])}")
+                    logger.info("代码块JSON解析成功，推荐项目数量: %s", len(json_data['recommendations']))
                     return {
                         'analysis': {
                             'summary': json_data['analysis'].get('summary', '基于您的需求进行了分析'),
@@ -614,10 +850,10 @@ def parse_ai_response(ai_response: str) -> dict:
                         'recommendations': json_data['recommendations']
                     }
             except json.JSONDecodeError as e:
-                logger.warning(f"代码块JSON解析失败: {e}")
+                logger.warning("代码块JSON解析失败: %s", e)
         
         # 如果JSON解析失败，记录原始响应并使用备用解析
-        logger.warning(f"JSON解析失败，AI响应内容: {ai_response[:200]}...")
+        logger.warning("JSON解析失败，AI响应内容: %s...", ai_response[:200])
         return {
             'analysis': {
                 'summary': '基于您的需求进行了分析',
@@ -627,7 +863,7 @@ def parse_ai_response(ai_response: str) -> dict:
         }
         
     except Exception as e:
-        logger.error(f"解析AI响应失败: {e}")
+        logger.error("解析AI响应失败: %s", e)
         return {
             'analysis': {
                 'summary': '需求分析完成',
@@ -643,19 +879,25 @@ async def enrich_recommendations(recommendations: list) -> list:
     for rec in recommendations:
         repo_name = rec.get('repository', '')
         if not repo_name or '/' not in repo_name:
-            logger.warning(f"无效的仓库名称: {repo_name}")
+            logger.warning("无效的仓库名称: %s", repo_name)
             continue
             
         try:
             owner, repo = repo_name.split('/', 1)
-            logger.info(f"处理推荐项目: {owner}/{repo}")
+            logger.info("处理推荐项目: %s/%s", owner, repo)
             
-            # 尝试获取项目详细信息（优先GitHub API，其次网页爬取）
-            repo_info = await mcp_github.get_repository_with_mcp(owner, repo)
+            # 请求时限已用完时不再访问GitHub，直接使用AI提供的基本信息
+            repo_info = None
+            if deadline.expired():
+                logger.info("请求处理时限已用完，跳过仓库 %s/%s 的详细信息", owner, repo)
+            else:
+                # 尝试获取项目详细信息（优先GitHub API，其次网页爬取）
+                repo_info = await mcp_github.get_repository_with_mcp(owner, repo)
             # 如果API失败或返回的stars/forks为0，回退到爬虫抓取页面数据
-            if not repo_info or (isinstance(repo_info.get('stars', 0), int) and repo_info.get('stars', 0) == 0):
+            if not deadline.expired() and \
+                    (not repo_info or (isinstance(repo_info.get('stars', 0), int) and repo_info.get('stars', 0) == 0)):
                 try:
-                    scraped = crawler.get_repository_info(owner, repo)
+                    scraped = await crawler.get_repository_info(owner, repo)
                     if scraped and scraped.get('stars', 0) or scraped.get('forks', 0):
                         repo_info = {
                             'owner': scraped.get('owner', owner),
@@ -667,9 +909,9 @@ async def enrich_recommendations(recommendations: list) -> list:
                             'language': scraped.get('language'),
                             'url': scraped.get('url', f'https://github.com/{owner}/{repo}')
                         }
-                        logger.info(f"使用页面爬取补全仓库 {owner}/{repo} 的统计信息: {repo_info['stars']} stars")
+                        logger.info("使用页面爬取补全仓库 %s/%s 的统计信息: %s stars", owner, repo, repo_info['stars'])
                 except Exception as se:
-                    logger.warning(f"页面爬取仓库统计失败: {se}")
+                    logger.warning("页面爬取仓库统计失败: %s", se)
 
             if repo_info:
                 # 成功获取仓库信息
@@ -689,7 +931,7 @@ async def enrich_recommendations(recommendations: list) -> list:
                 }
             else:
                 # 获取失败，使用AI提供的基本信息
-                logger.warning(f"无法获取仓库 {repo_name} 的GitHub信息，使用基本信息")
+                logger.warning("无法获取仓库 %s 的GitHub信息，使用基本信息", repo_name)
                 enriched_item = {
                     'repository': repo_name,
                     'name': rec.get('name', repo),
@@ -706,10 +948,10 @@ async def enrich_recommendations(recommendations: list) -> list:
                 }
             
             enriched.append(enriched_item)
-            logger.info(f"成功添加推荐项目: {repo_name}")
+            logger.info("成功添加推荐项目: %s", repo_name)
                 
         except Exception as e:
-            logger.error(f"处理项目 {repo_name} 时发生错误: {e}")
+            logger.error("处理项目 %s 时发生错误: %s", repo_name, e)
             # 即使出错也要尝试提供基本信息
             try:
                 owner, repo = repo_name.split('/', 1)
@@ -724,10 +966,10 @@ async def enrich_recommendations(recommendations: list) -> list:
                     'match_reason': rec.get('match_reason', '推荐匹配')
                 })
             except:
-                logger.error(f"跳过无效项目: {repo_name}")
+                logger.error("跳过无效项目: %s", repo_name)
                 continue
     
-    logger.info(f"总共处理了 {len(enriched)} 个推荐项目")
+    logger.info("总共处理了 %s 个推荐项目", len(enriched))
     return enriched
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+import re
+import json
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# github.com 的 React 页面把数据放在 <script type="application/json"> 中
+# （react-app.embeddedData / react-partial.embeddedData 等），直接按字节扫描取出，不构建DOM
+JSON_SCRIPT_MARKER = b'application/json'
+JSON_SCRIPT_PATTERN = re.compile(rb'<script\b[^>]*\btype="application/json"[^>]*>(.*?)</script\s*>', re.S)
+HIGHLIGHT_TAG_PATTERN = re.compile(r'</?em>')
+
+# 不同接口/页面对同一字段使用的键名
+STAR_KEYS = ('stargazers_count', 'stargazerCount', 'stargazers', 'stars')
+FORK_KEYS = ('forks_count', 'forkCount', 'forks')
+CONTRIBUTION_KEYS = ('contributions', 'total', 'commits', 'count')
+USER_FIELDS = ('name', 'bio', 'company', 'location', 'email', 'blog', 'twitter_username',
+               'followers', 'following', 'public_repos', 'created_at', 'avatar_url')
+
+
+def embedded_json(content: bytes) -> List[Any]:
+    """取出页面中所有可解析的内嵌JSON数据块；没有或解析失败时返回空列表"""
+    if JSON_SCRIPT_MARKER not in content:
+        return []
+    payloads = []
+    for match in JSON_SCRIPT_PATTERN.finditer(content):
+        body = match.group(1).strip()
+        if not body:
+            continue
+        try:
+            payloads.append(json.loads(body))
+        except ValueError:
+            continue
+    return payloads
+
+
+def _walk(payloads: List[Any]) -> Iterator[Any]:
+    """按文档顺序遍历数据块中的所有字典和列表"""
+    stack = list(reversed(payloads))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            yield node
+            stack.extend(reversed(node))
+
+
+def _first_value(data: Dict, keys) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _count(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, dict):
+        # GraphQL 风格：{"totalCount": 123}
+        return _count(value.get('totalCount'))
+    return None
+
+
+def _contributor(item: Any) -> Optional[Dict]:
+    """贡献者条目：API 风格 {login, contributions} 或贡献图风格 {author: {login}, total}"""
+    if not isinstance(item, dict):
+        return None
+    author = item.get('author') if isinstance(item.get('author'), dict) else item
+    login = author.get('login')
+    contributions = _count(_first_value(item, CONTRIBUTION_KEYS))
+    if not isinstance(login, str) or not login or contributions is None:
+        return None
+    return {
+        'username': login,
+        'avatar_url': _first_value(author, ('avatar_url', 'avatarUrl', 'avatar')) or f'https://github.com/{login}.png',
+        'contributions': contributions,
+        'profile_url': f"https://github.com/{login}"
+    }
+
+
+def contributors(payloads: List[Any], limit: int) -> List[Dict]:
+    """从内嵌数据中找出贡献者列表，按贡献次数降序返回"""
+    for node in _walk(payloads):
+        if not isinstance(node, list) or not node:
+            continue
+        found = [_contributor(item) for item in node]
+        if all(found):
+            return sorted(found, key=lambda x: x['contributions'], reverse=True)[:limit]
+    return []
+
+
+def repository(payloads: List[Any], owner: str, repo: str) -> Optional[Dict]:
+    """从内嵌数据中找出仓库的描述、star、fork和主要语言；缺少star或fork数时返回 None"""
+    full_name = f"{owner}/{repo}".lower()
+    for node in _walk(payloads):
+        if not isinstance(node, dict):
+            continue
+        name = _first_value(node, ('full_name', 'nameWithOwner'))
+        if not (isinstance(name, str) and name.lower() == full_name):
+            owner_login = _first_value(node, ('ownerLogin', 'owner_login'))
+            if not (isinstance(owner_login, str) and owner_login.lower() == owner.lower()
+                    and str(node.get('name', '')).lower() == repo.lower()):
+                continue
+        stars = _count(_first_value(node, STAR_KEYS))
+        forks = _count(_first_value(node, FORK_KEYS))
+        if stars is None or forks is None:
+            continue
+        language = _first_value(node, ('language', 'primaryLanguage'))
+        if isinstance(language, dict):
+            language = language.get('name')
+        return {
+            'owner': owner,
+            'name': repo,
+            'full_name': f"{owner}/{repo}",
+            'description': node.get('description'),
+            'stars': stars,
+            'forks': forks,
+            'language': language if isinstance(language, str) else None
+        }
+    return None
+
+
+def _search_result(item: Any) -> Optional[Dict]:
+    """搜索结果条目：网页搜索的 {repo: {repository: {...}}, followers, hl_trunc_description} 或 API 风格"""
+    if not isinstance(item, dict):
+        return None
+    nested = item.get('repo', {}).get('repository') if isinstance(item.get('repo'), dict) else None
+    if isinstance(nested, dict):
+        owner, name = nested.get('owner_login'), nested.get('name')
+        stars = _count(item.get('followers'))
+        description = item.get('hl_trunc_description')
+        if isinstance(description, str):
+            description = HIGHLIGHT_TAG_PATTERN.sub('', description)
+        forks = 0
+        updated_at = nested.get('updated_at')
+    else:
+        full_name = item.get('full_name')
+        if not isinstance(full_name, str) or '/' not in full_name:
+            return None
+        owner, name = full_name.split('/', 1)
+        stars = _count(item.get('stargazers_count'))
+        description = item.get('description')
+        forks = _count(item.get('forks_count')) or 0
+        updated_at = item.get('updated_at')
+    if not isinstance(owner, str) or not isinstance(name, str) or stars is None:
+        return None
+    return {
+        'owner': owner,
+        'name': name,
+        'full_name': f"{owner}/{name}",
+        'description': description,
+        'stars': stars,
+        'forks': forks,
+        'language': item.get('language'),
+        'url': f"https://github.com/{owner}/{name}",
+        'created_at': item.get('created_at'),
+        'updated_at': updated_at
+    }
+
+
+def search_results(payloads: List[Any], limit: int) -> List[Dict]:
+    """从内嵌数据中找出仓库搜索结果"""
+    for node in _walk(payloads):
+        if not isinstance(node, list) or not node:
+            continue
+        found = [_search_result(item) for item in node]
+        if all(found):
+            return found[:limit]
+    return []
+
+
+def user(payloads: List[Any], username: str) -> Optional[Dict]:
+    """从内嵌数据中找出用户对象（login 与用户名一致且带有资料字段）"""
+    for node in _walk(payloads):
+        if not isinstance(node, dict):
+            continue
+        login = node.get('login')
+        if isinstance(login, str) and login.lower() == username.lower():
+            fields = {key: node[key] for key in USER_FIELDS if node.get(key) not in (None, '')}
+            if set(fields) - {'avatar_url'}:
+                return fields
+    return None
@@ -0,0 +1,176 @@
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+import deadline
+from deadline import DeadlineExceeded
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 解析进程数，0 表示在事件循环所在进程内直接解析
+DEFAULT_PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 同时提交给进程池的解析任务上限（排队 + 执行中）；达到上限时新的解析等待空位，接口层直接返回503
+DEFAULT_PARSE_QUEUE_SIZE = int(os.getenv("PARSE_QUEUE_SIZE", "32"))
+# 每个解析进程处理多少个页面后退出并由新进程替换，限制解析过程中泄漏或碎片化的内存
+DEFAULT_MAX_TASKS_PER_WORKER = int(os.getenv("PARSE_MAX_TASKS_PER_WORKER", "200"))
+
+# 允许在子进程中执行的解析方法：输入为原始响应字节和简单参数，输出为普通的 dict / list
+PARSE_METHODS = frozenset({
+    '_parse_repository_page',
+    '_parse_contributors_html',
+    '_parse_commits_html',
+    '_parse_user_profile_page',
+    '_parse_search_html',
+})
+
+# 子进程内的爬虫实例，只用于解析，不发起网络请求
+_worker_crawler = None
+
+
+def _init_worker(html_parser: str):
+    """子进程初始化：创建只用于解析的爬虫实例，开启选择器统计的 journal"""
+    global _worker_crawler
+    from github_crawler import GitHubCrawler
+    from selector_stats import SelectorStats
+    _worker_crawler = GitHubCrawler(html_parser=html_parser, selector_stats=SelectorStats(journal=True))
+
+
+def _run_in_worker(method: str, args: Tuple) -> Tuple[Any, List[Tuple]]:
+    """在子进程中执行解析，返回 (解析结果, 选择器查找记录)"""
+    result = getattr(_worker_crawler, method)(*args)
+    return result, _worker_crawler.selector_stats.drain()
+
+
+class ParsePool:
+    """页面解析进程池
+
+    BeautifulSoup 解析是CPU密集型操作并持有GIL，放在事件循环所在进程中会让并发请求在解析上排队。
+    解析任务以原始字节提交给子进程，返回普通的 dict / list，可以利用多个CPU核心。
+
+    - 队列有上限：排队和执行中的任务达到 max_queue 后，新的解析等待空位（受请求时限约束），
+      接口层通过 busy() 在入口直接拒绝新请求（503），而不是无限堆积
+    - 子进程处理 max_tasks_per_worker 个页面后被替换，回收解析过程中增长的内存
+    - 子进程异常退出时重建进程池，由调用方决定是否改在当前进程内解析
+    """
+
+    def __init__(self, html_parser: str, workers: int = DEFAULT_PARSE_WORKERS,
+                 max_queue: int = DEFAULT_PARSE_QUEUE_SIZE,
+                 max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER):
+        self.html_parser = html_parser
+        self.workers = workers
+        self.max_queue = max(1, max_queue)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.pending = 0
+        self.waiting = 0
+        self.completed = 0
+        self.waited = 0
+        self.restarts = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # max_tasks_per_child 要求 spawn 方式：子进程会重新导入 __main__（python main.py 时即 main.py），
+            # 因此 main.py 在导入时不创建任何组件，只在应用启动时创建（见 main.create_services）
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.html_parser,),
+                max_tasks_per_child=self.max_tasks_per_worker or None
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        # 信号量需要在事件循环中创建
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_queue)
+        return self._slots
+
+    def busy(self) -> bool:
+        """队列已满，新请求应被拒绝；正在等待空位的解析也计入，空位释放的间隙不会放入新的请求"""
+        return self.enabled and self.pending + self.waiting >= self.max_queue
+
+    async def run(self, method: str, *args) -> Tuple[Any, List[Tuple]]:
+        """在子进程中执行解析方法，返回 (解析结果, 选择器查找记录)
+
+        队列已满时等待空位，请求时限内没有等到时抛出 DeadlineExceeded；
+        子进程异常退出时抛出 BrokenProcessPool，进程池会在下一次调用时重建。
+        """
+        if method not in PARSE_METHODS:
+            raise ValueError(f"不支持在解析进程中执行: {method}")
+        slots = self._get_slots()
+        if slots.locked():
+            self.waited += 1
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(slots.acquire(), deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"parse:{method}") from None
+        finally:
+            self.waiting -= 1
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            future = executor.submit(_run_in_worker, method, args)
+        except BrokenProcessPool:
+            slots.release()
+            self._reset(executor)
+            raise
+        # 空位在子进程真正完成（或任务被取消）时才释放：调用方被取消时子进程可能仍在解析
+        self.pending += 1
+        future.add_done_callback(lambda _: self._call_soon(loop, self._release))
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            self._reset(executor)
+            raise
+
+    @staticmethod
+    def _call_soon(loop: asyncio.AbstractEventLoop, callback):
+        # 完成回调在进程池的管理线程中执行，需要切回事件循环
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            pass
+
+    def _release(self):
+        self.pending -= 1
+        self.completed += 1
+        self._slots.release()
+
+    def _reset(self, executor: ProcessPoolExecutor):
+        """子进程异常退出后丢弃整个进程池，下一次调用时重新创建"""
+        if self._executor is executor:
+            logger.warning("解析进程异常退出，重建解析进程池")
+            self._executor = None
+            self.restarts += 1
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict:
+        """返回进程数、当前排队/执行中的任务数、正在等待空位的解析数、等待空位的次数和重建次数"""
+        return {
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'max_tasks_per_worker': self.max_tasks_per_worker,
+            'pending': self.pending,
+            'waiting': self.waiting,
+            'completed': self.completed,
+            'waited_for_slot': self.waited,
+            'restarts': self.restarts
+        }
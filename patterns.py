@@ -0,0 +1,49 @@
+import re
+
+# 爬虫和接口层使用的正则表达式，在模块加载时统一编译；
+# 热点循环（逐个贡献者、逐个提交、逐个计数）中直接使用编译好的对象，不再每次调用时编译或查 re 模块的缓存。
+# 依次尝试的同类模式尽量合并为一个分支表达式，只扫描一遍文本。
+
+# 计数（如 "1.2k"、"45"）：数字 + 可选单位；没有匹配时退回到第一个数字
+COUNT_PATTERN = re.compile(r'([0-9]+(?:\.[0-9]+)?)\s*([kmb]?)(?:\s|$)')
+NUMBER_PATTERN = re.compile(r'([0-9]+(?:\.[0-9]+)?)')
+# 带千位分隔符的整数（如 "1,234"）
+GROUPED_NUMBER_PATTERN = re.compile(r'\d+(?:,\d+)*')
+
+# 贡献者条目中的提交次数（"12 commits" / "12 次提交"），没有时取第一个数字
+COMMIT_COUNT_PATTERN = re.compile(r'(\d+(?:,\d+)*)\s*(?:commit|次提交)', re.IGNORECASE)
+# 用户主页路径（/username）、按作者筛选的提交链接、以 @ 开头的头像 alt
+USER_PATH_PATTERN = re.compile(r'^/[^/]+$')
+COMMITS_AUTHOR_PATTERN = re.compile(r'/commits\?author=')
+AT_MENTION_PATTERN = re.compile(r'^@')
+# Commits 页面的提交条目
+COMMIT_ITEM_CLASS_PATTERN = re.compile(r'commit.*item|Box-row')
+
+# 仓库页的 star / fork 计数链接
+STARGAZERS_HREF_PATTERN = re.compile(r'/stargazers$')
+FORKS_HREF_PATTERN = re.compile(r'/forks$')
+
+# 用户主页文本中的邮箱、关注数、加入时间和贡献总数
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# 数字在前（"1.2k followers"、"45 关注者"）或在后（"Followers: 45"）两种写法合并为一个分支表达式，
+# 各分支的数字放在不同的命名分组中，用 match.lastgroup 取实际匹配的分组。
+# 分支表达式没有固定的开头，re 会在每个位置依次尝试各分支；开头的前瞻只允许从数字或关键字的首字符开始，
+# 其余位置一次字符集判断就跳过。数字用 [0-9]，比 Unicode 的 \d 判断更快，页面中的计数都是 ASCII 数字
+FOLLOWERS_PATTERN = re.compile(
+    r'(?=[0-9Ff关])(?:(?P<count>[0-9]+(?:\.[0-9]+)?[kKmMbB]?)\s*(?:[Ff]ollowers?|关注者)'
+    r'|[Ff]ollowers?[^0-9]*(?P<count_after>[0-9]+(?:\.[0-9]+)?[kKmMbB]?))'
+)
+FOLLOWING_PATTERN = re.compile(
+    r'(?=[0-9Ff关])(?:(?P<count>[0-9]+(?:\.[0-9]+)?[kKmMbB]?)\s*(?:[Ff]ollowing|关注中)'
+    r'|[Ff]ollowing[^0-9]*(?P<count_after>[0-9]+(?:\.[0-9]+)?[kKmMbB]?))'
+)
+# 加入时间的两种写法同样合并；没有固定前缀的表达式只能逐个位置尝试，
+# 调用方先用 str.find 找到最早出现的关键字（JOIN_DATE_KEYWORDS），从该位置开始匹配
+JOIN_DATE_KEYWORDS = ('Joined ', 'Member since ')
+JOIN_DATE_PATTERN = re.compile(
+    r'Joined (?:GitHub )?on (?P<joined>[A-Za-z]+ \d{1,2}, \d{4})|Member since (?P<since>[A-Za-z]+ \d{4})'
+)
+CONTRIBUTIONS_PATTERN = re.compile(r'(\d+(?:,\d+)*) contributions?')
+
+# AI 回复中的 ```json 代码块
+AI_JSON_BLOCK_PATTERN = re.compile(r'```json\s*({[\s\S]*?})\s*```')
@@ -0,0 +1,632 @@
+import re
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+from bs4.element import NavigableString, CData
+
+from html_parser import ParseRegions
+from selector_stats import SelectorStats
+from patterns import (
+    EMAIL_PATTERN, FOLLOWERS_PATTERN, FOLLOWING_PATTERN, JOIN_DATE_KEYWORDS, JOIN_DATE_PATTERN, CONTRIBUTIONS_PATTERN
+)
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 与 soup.get_text() 一致：只收集普通文本和CDATA，不含注释、脚本和样式
+TEXT_TYPES = (NavigableString, CData)
+
+# 各字段的选择器，按优先级排列；语义与逐个 select_one / select 相同
+AVATAR_SELECTORS = ['img[alt="@{username}"]', 'img.avatar-user', 'img[src*="avatars"]', '.avatar img']
+NAME_SELECTORS = ['span.p-name', 'h1.vcard-names', '[itemprop="name"]', '.h-card .p-name']
+PRONOUNS_SELECTORS = ['span.user-profile-pronouns', '[data-pronouns]', '.pronouns']
+BIO_SELECTORS = ['div.p-note.user-profile-bio', 'div[data-bio]', '[itemprop="description"]', '.user-profile-bio']
+WORK_SELECTORS = ['div.user-profile-work', '[data-work]', '.work-info']
+STATS_SELECTORS = {
+    field: [f'a[href*="?tab={tab}"]', f'a[href*="{tab}"]', f'[data-tab-item="{tab}"]',
+            f'.js-profile-tab[data-tab-item="{tab}"]']
+    for field, tab in (('followers', 'followers'), ('following', 'following'), ('public_repos', 'repositories'))
+}
+PROFILE_AREA_SELECTORS = [
+    'div.js-profile-editable-area',
+    'div[data-test-selector="profile-bio"]',
+    '.vcard-details',
+    '.js-profile-editable-replace',
+    '.user-profile-nav',
+    '.Layout-sidebar .BorderGrid-cell',
+    '.js-sticky .BorderGrid-cell',
+    '.Layout-sidebar',
+    '.profile-sidebar'
+]
+LINK_SELECTOR = 'a[href]'
+INFO_ITEM_SELECTORS = [
+    'li.vcard-detail',
+    '.vcard-detail',
+    'li[itemprop]',
+    '.js-profile-editable-area li',
+    '.BorderGrid-cell li',
+    '[data-test-selector="profile-bio"] li',
+    '.user-profile-bio li'
+]
+ARIA_SELECTOR = '[aria-label]'
+CSS_CLASS_HINTS = {
+    'location': ['user-location', 'profile-location', 'vcard-location'],
+    'company': ['user-company', 'profile-company', 'vcard-organization'],
+    'email': ['user-email', 'profile-email', 'vcard-email'],
+    'website': ['user-website', 'profile-website', 'vcard-url']
+}
+MICROFORMAT_SELECTORS = {
+    'location': ['[itemprop="address"]', '[itemprop="location"]', '.p-locality', '.h-adr'],
+    'company': ['[itemprop="worksFor"]', '[itemprop="affiliation"]', '.p-org', '.h-card .p-org'],
+    'email': ['[itemprop="email"]', '.u-email'],
+    'website': ['[itemprop="url"]', '.u-url']
+}
+JOIN_DATE_SELECTORS = ['time[datetime]', '[data-date]', '.join-date']
+# 加入日期文本（JOIN_DATE_PATTERN）的前缀；原始页面中没有时不必为查找加入日期完整解析
+JOIN_DATE_TEXT_MARKERS = tuple(keyword.encode('ascii') for keyword in JOIN_DATE_KEYWORDS)
+CONTRIBUTIONS_SELECTOR = '.js-yearly-contributions'
+# 部分解析时贡献日历不在解析区域内，从标题（如 "1,234 contributions in the last year"）读取总数
+CONTRIBUTIONS_HEADING_SELECTOR = 'h2'
+ORGANIZATION_SELECTORS = ['.avatar-group-item', '.org-avatar']
+PINNED_SELECTOR = '.pinned-item-list-item'
+
+INVALID_EMAIL_MARKERS = ['example.com', 'test.com', 'noreply', 'no-reply', 'placeholder']
+# 日志中统计的社交平台和联系方式字段
+SOCIAL_FIELDS = ('twitter', 'linkedin', 'instagram', 'facebook', 'youtube')
+CONTACT_FIELDS = ('email', 'phone', 'website', 'blog')
+
+# 主页的资料几乎都在侧栏，另外只需要页签计数、置顶仓库、各区块标题和加入日期元素（JOIN_DATE_SELECTORS）；
+# 贡献日历、动态列表和内联脚本的其余部分不构建节点
+PROFILE_REGIONS = ParseRegions(
+    classes=['Layout-sidebar', 'profile-sidebar', 'h-card', 'js-profile-editable-area', 'vcard-details',
+             'js-profile-editable-replace', 'user-profile-nav', 'UnderlineNav', 'pinned-item-list-item',
+             'join-date'],
+    tags=['h2', 'time'],
+    attrs=['data-tab-item', 'data-date'],
+    anchor='.Layout-sidebar, .profile-sidebar'
+)
+
+_COMPOUND_PATTERN = re.compile(r'([a-zA-Z][a-zA-Z0-9]*)?((?:\.[\w-]+|\[[^\]]+\])*)$')
+_PART_PATTERN = re.compile(r'\.([\w-]+)|\[([\w-]+)(?:(\*?=)"([^"]*)")?\]')
+
+
+class Compound:
+    """编译后的简单选择器：标签名、类名和属性条件，可带一个祖先条件（后代选择器）"""
+
+    __slots__ = ('css', 'tag', 'classes', 'attrs', 'ancestor', 'index_key')
+
+    def __init__(self, css: str):
+        self.css = css
+        *ancestors, own = css.split()
+        if len(ancestors) > 1:
+            raise ValueError(f"只支持一级后代选择器: {css}")
+        self.ancestor = Compound(ancestors[0]) if ancestors else None
+        match = _COMPOUND_PATTERN.match(own)
+        if not match:
+            raise ValueError(f"不支持的选择器: {css}")
+        self.tag = match.group(1)
+        self.classes: Tuple[str, ...] = ()
+        self.attrs: List[Tuple[str, Optional[str], Optional[str]]] = []
+        for part in _PART_PATTERN.finditer(match.group(2) or ''):
+            if part.group(1):
+                self.classes += (part.group(1),)
+            else:
+                self.attrs.append((part.group(2), part.group(3), part.group(4)))
+        # 按最有区分度的特征建立索引，遍历时只检查可能匹配的选择器
+        if self.classes:
+            self.index_key = ('class', self.classes[0])
+        elif self.attrs:
+            self.index_key = ('attr', self.attrs[0][0])
+        else:
+            self.index_key = ('tag', self.tag)
+
+    def matches(self, tag: Tag, classes, username: str) -> bool:
+        if self.tag and tag.name != self.tag:
+            return False
+        for class_name in self.classes:
+            if class_name not in classes:
+                return False
+        for name, operator, value in self.attrs:
+            actual = tag.attrs.get(name)
+            if actual is None:
+                return False
+            if operator is None:
+                continue
+            if isinstance(actual, list):
+                actual = ' '.join(actual)
+            expected = value.format(username=username) if '{' in value else value
+            if operator == '=' and actual != expected:
+                return False
+            if operator == '*=' and expected not in actual:
+                return False
+        return True
+
+
+class ProfileScan:
+    """单次DOM遍历的结果：每个选择器在文档顺序下的全部匹配，以及页面文本"""
+
+    def __init__(self, matches: Dict[str, List[Tuple[int, Tag]]], ranges: Dict[int, Tuple[int, int]],
+                 texts: List[str]):
+        self._matches = matches
+        self._ranges = ranges
+        self._texts = texts
+        self._text: Optional[str] = None
+
+    def all(self, css: str) -> List[Tag]:
+        return [tag for _, tag in self._matches.get(css, ())]
+
+    def first(self, css: str) -> Optional[Tag]:
+        found = self._matches.get(css)
+        return found[0][1] if found else None
+
+    def first_of(self, selectors: List[str]) -> Optional[Tag]:
+        """按优先级返回第一个有匹配的选择器的首个元素，等同于依次 select_one"""
+        return self.first_match(selectors)[1]
+
+    def first_match(self, selectors: List[str]) -> Tuple[Optional[str], Optional[Tag]]:
+        """同 first_of，同时返回命中的选择器"""
+        for css in selectors:
+            tag = self.first(css)
+            if tag is not None:
+                return css, tag
+        return None, None
+
+    def union(self, selectors: List[str]) -> List[Tag]:
+        """多个选择器的匹配按文档顺序合并去重，等同于 select('a, b')"""
+        found = {index: tag for css in selectors for index, tag in self._matches.get(css, ())}
+        return [found[index] for index in sorted(found)]
+
+    def within(self, css: str, area: Optional[Tag]) -> List[Tag]:
+        """选择器在区域内（不含区域本身）的匹配；区域为 None 时表示整个页面"""
+        found = self._matches.get(css, ())
+        if area is None:
+            return [tag for _, tag in found]
+        start, end = self._ranges[id(area)]
+        return [tag for index, tag in found if start < index <= end]
+
+    @property
+    def text(self) -> str:
+        """等同于 soup.get_text()，首次使用时才拼接"""
+        if self._text is None:
+            self._text = ''.join(self._texts)
+        return self._text
+
+
+class ProfileExtractor:
+    """用户主页单次遍历提取器
+
+    所有字段的选择器在初始化时编译并按类名/属性名/标签名建立索引，
+    提取时只遍历一次DOM，记录每个选择器的匹配和页面文本，
+    再按原有的优先级和回退规则填充资料和联系信息，耗时与页面大小成正比。
+    所有选择器在同一次遍历中求值，调整顺序不会减少开销，因此保持声明的优先级，只记录命中统计。
+    """
+
+    def __init__(self, parse_count: Callable[[str], int],
+                 classify_links: Callable[[List[str]], List[Optional[Dict]]],
+                 selector_stats: Optional[SelectorStats] = None):
+        self.parse_count = parse_count
+        self.classify_links = classify_links
+        self.selector_stats = selector_stats or SelectorStats()
+
+        selectors = (
+            AVATAR_SELECTORS + NAME_SELECTORS + PRONOUNS_SELECTORS + BIO_SELECTORS + WORK_SELECTORS
+            + [css for group in STATS_SELECTORS.values() for css in group]
+            + PROFILE_AREA_SELECTORS + [LINK_SELECTOR] + INFO_ITEM_SELECTORS + [ARIA_SELECTOR]
+            + [css for group in MICROFORMAT_SELECTORS.values() for css in group]
+            + JOIN_DATE_SELECTORS + [CONTRIBUTIONS_SELECTOR, CONTRIBUTIONS_HEADING_SELECTOR]
+            + ORGANIZATION_SELECTORS + [PINNED_SELECTOR]
+        )
+        self.compounds = [Compound(css) for css in dict.fromkeys(selectors)]
+        self._area_selectors = set(PROFILE_AREA_SELECTORS)
+        self._index: Dict[Tuple[str, str], List[Compound]] = {}
+        for compound in self.compounds:
+            self._index.setdefault(compound.index_key, []).append(compound)
+        # 后代选择器用到的祖先条件，遍历时维护计数
+        self._ancestors: Dict[str, Compound] = {}
+        for compound in self.compounds:
+            if compound.ancestor is not None:
+                self._ancestors.setdefault(compound.ancestor.css, compound.ancestor)
+        self._css_hints = [hint for hints in CSS_CLASS_HINTS.values() for hint in hints]
+
+    def scan(self, soup: BeautifulSoup, username: str) -> ProfileScan:
+        """遍历一次DOM，返回各选择器的匹配、区域范围和页面文本"""
+        matches: Dict[str, List[Tuple[int, Tag]]] = {}
+        ranges: Dict[int, Tuple[int, int]] = {}
+        open_ranges: Dict[int, int] = {}
+        texts: List[str] = []
+        ancestor_depth = {css: 0 for css in self._ancestors}
+        hint_matches: Dict[str, List[Tuple[int, Tag]]] = {}
+        index = 0
+
+        stack = [iter(soup.contents)]
+        exits: List[Tuple[Optional[Tag], List[str]]] = [(None, [])]
+        while stack:
+            for node in stack[-1]:
+                if isinstance(node, Tag):
+                    index += 1
+                    classes = node.attrs.get('class') or ()
+                    candidates = list(self._index.get(('tag', node.name), ()))
+                    for class_name in classes:
+                        candidates.extend(self._index.get(('class', class_name), ()))
+                    for attr in node.attrs:
+                        candidates.extend(self._index.get(('attr', attr), ()))
+                    for compound in candidates:
+                        if compound.ancestor is not None and not ancestor_depth[compound.ancestor.css]:
+                            continue
+                        if compound.matches(node, classes, username):
+                            found = matches.setdefault(compound.css, [])
+                            if not found or found[-1][0] != index:
+                                found.append((index, node))
+                                if compound.css in self._area_selectors:
+                                    open_ranges[id(node)] = index
+                    if classes:
+                        joined = ' '.join(classes)
+                        for hint in self._css_hints:
+                            if hint in joined:
+                                hint_matches.setdefault(hint, []).append((index, node))
+                    entered = [css for css, ancestor in self._ancestors.items()
+                               if ancestor.matches(node, classes, username)]
+                    for css in entered:
+                        ancestor_depth[css] += 1
+                    stack.append(iter(node.contents))
+                    exits.append((node, entered))
+                    break
+                if type(node) in TEXT_TYPES:
+                    texts.append(node)
+            else:
+                stack.pop()
+                node, entered = exits.pop()
+                for css in entered:
+                    ancestor_depth[css] -= 1
+                if node is not None and id(node) in open_ranges:
+                    ranges[id(node)] = (open_ranges.pop(id(node)), index)
+
+        for hint, found in hint_matches.items():
+            matches[f'~{hint}'] = found
+        return ProfileScan(matches, ranges, texts)
+
+    def extract(self, soup: BeautifulSoup, profile: Dict) -> Dict:
+        """填充基本信息、统计和额外资料，返回联系信息（由调用方合并到资料中）"""
+        scan = self.scan(soup, profile['username'])
+        self._fill_basic_info(scan, profile)
+        self._fill_stats(scan, profile)
+        contact_info = self._contact_info(scan)
+        self._fill_additional_data(scan, profile)
+        return contact_info
+
+    def fill_join_date(self, soup: BeautifulSoup, profile: Dict):
+        """只提取加入日期；部分解析的页面找不到加入日期时，调用方用完整解析的DOM再次提取"""
+        join_date = self._join_date(self.scan(soup, profile['username']))
+        if join_date:
+            profile['additional_info']['join_date'] = join_date
+            profile['created_at'] = join_date
+
+    def _fill_basic_info(self, scan: ProfileScan, profile: Dict):
+        for css in AVATAR_SELECTORS:
+            avatar_elem = scan.first(css)
+            if avatar_elem and avatar_elem.get('src'):
+                profile['avatar_url'] = avatar_elem.get('src')
+                logger.debug("找到头像: %s", profile['avatar_url'])
+                break
+
+        name_elem = scan.first_of(NAME_SELECTORS)
+        if name_elem:
+            profile['name'] = name_elem.text.strip()
+            logger.debug("找到姓名: %s", profile['name'])
+
+        pronouns_elem = scan.first_of(PRONOUNS_SELECTORS)
+        if pronouns_elem:
+            profile['pronouns'] = pronouns_elem.text.strip()
+            logger.debug("找到代词: %s", profile['pronouns'])
+
+        # 简介和工作信息：首个匹配为空时继续尝试下一个选择器
+        for field, selectors in (('bio', BIO_SELECTORS), ('work_info', WORK_SELECTORS)):
+            for css in selectors:
+                elem = scan.first(css)
+                if elem:
+                    text = elem.text.strip()
+                    if text:
+                        profile[field] = text
+                        logger.debug("找到%s: %s", '简介' if field == 'bio' else '工作信息', text[:50])
+                        break
+
+    def _fill_stats(self, scan: ProfileScan, profile: Dict):
+        stats = {'followers': 0, 'following': 0, 'public_repos': 0}
+        try:
+            for field, selectors in STATS_SELECTORS.items():
+                css, elem = scan.first_match(selectors)
+                self.selector_stats.plan(f'profile.{field}', selectors).record(css)
+                if elem:
+                    stats[field] = self.parse_count(elem.get_text().strip())
+
+            # 备用方法：从页面文本中查找
+            if stats['followers'] == 0 or stats['following'] == 0 or stats['public_repos'] == 0:
+                for field, pattern in (('followers', FOLLOWERS_PATTERN), ('following', FOLLOWING_PATTERN)):
+                    if stats[field]:
+                        continue
+                    match = pattern.search(scan.text)
+                    if match:
+                        count = match.group(match.lastgroup)
+                        stats[field] = self.parse_count(count)
+                        logger.debug("从文本中解析到 %s: '%s' -> %s", field, count, stats[field])
+        except Exception as e:
+            logger.warning("解析用户统计信息时出错: %s", e)
+
+        profile.update(stats)
+        logger.info("统计信息: followers=%s, following=%s, repos=%s", stats['followers'], stats['following'], stats['public_repos'])
+
+    def _contact_info(self, scan: ProfileScan) -> Dict:
+        contact_info = {
+            # 基本联系信息
+            'company': None,
+            'location': None,
+            'email': None,
+            'phone': None,
+            'website': None,
+            'blog': None,
+
+            # 社交媒体平台
+            'twitter': None,
+            'linkedin': None,
+            'mastodon': None,
+            'instagram': None,
+            'facebook': None,
+            'youtube': None,
+            'tiktok': None,
+
+            # 专业平台
+            'github': None,
+            'stackoverflow': None,
+            'devto': None,
+            'medium': None,
+            'hashnode': None,
+
+            # 组织化数据
+            'social_accounts': [],
+            'contact_methods': [],
+            'additional_links': [],
+            'all_links': [],
+            'raw_data': {}
+        }
+
+        try:
+            # 个人资料区域；没有找到时使用整个页面
+            area_css, profile_area = scan.first_match(PROFILE_AREA_SELECTORS)
+            self.selector_stats.plan('profile.area', PROFILE_AREA_SELECTORS).record(area_css)
+            self._classify_links(scan.within(LINK_SELECTOR, profile_area), contact_info)
+
+            info_items = [item for css in INFO_ITEM_SELECTORS for item in scan.within(css, profile_area)]
+            seen_items = set()
+            for item in info_items:
+                item_text = item.get_text().strip()
+                if item_text and item_text not in seen_items:
+                    seen_items.add(item_text)
+                    self._parse_info_item(item, item_text, contact_info)
+
+            self._apply_fallbacks(scan, contact_info)
+
+            # 计数只用于日志，日志级别不输出时不计算
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("联系信息提取完成: 社交平台=%d, 联系方式=%d",
+                            sum(1 for k in SOCIAL_FIELDS if contact_info.get(k)),
+                            sum(1 for k in CONTACT_FIELDS if contact_info.get(k)))
+        except Exception as e:
+            logger.warning("提取联系信息时出错: %s", e)
+
+        return contact_info
+
+    def _classify_links(self, links: List[Tag], contact_info: Dict):
+        external = []
+        for link in links:
+            href = link.get('href', '').strip()
+            if not href or href.startswith('#'):
+                continue
+            if href.startswith('/'):
+                if href.startswith('//'):
+                    href = 'https:' + href
+                else:
+                    # GitHub 内部链接，跳过
+                    continue
+            external.append((link, href))
+
+        # 整个页面的链接一次批量分类
+        for (link, href), platform_info in zip(external, self.classify_links([href for _, href in external])):
+            link_info = {
+                'url': href,
+                'text': link.get_text().strip(),
+                'title': link.get('title', ''),
+                'platform': None,
+                'type': None
+            }
+            if platform_info:
+                link_info.update(platform_info)
+                platform = platform_info['platform']
+                if platform in contact_info:
+                    contact_info[platform] = href
+                if platform_info['type'] == 'social':
+                    contact_info['social_accounts'].append(link_info)
+                elif platform_info['type'] == 'contact':
+                    contact_info['contact_methods'].append(link_info)
+                else:
+                    contact_info['additional_links'].append(link_info)
+            contact_info['all_links'].append(link_info)
+
+    def _parse_info_item(self, item: Tag, item_text: str, contact_info: Dict):
+        """根据信息项中的 SVG 图标判断类型"""
+        svg_elem = item.find('svg')
+        if not svg_elem:
+            return
+        svg_classes = ' '.join(svg_elem.get('class', [])).lower()
+        aria_label = svg_elem.get('aria-label', '').lower()
+
+        if any(keyword in svg_classes for keyword in ['organization', 'building']) or 'organization' in aria_label:
+            if not contact_info.get('company'):
+                contact_info['company'] = item_text
+                logger.debug("找到公司信息: %s", item_text)
+        elif any(keyword in svg_classes for keyword in ['location', 'geo']) or 'location' in aria_label:
+            if not contact_info.get('location'):
+                contact_info['location'] = item_text
+                logger.debug("找到位置信息: %s", item_text)
+        elif any(keyword in svg_classes for keyword in ['mail', 'email']) or 'mail' in aria_label:
+            email_link = item.find('a', href=lambda x: x and 'mailto:' in x)
+            if email_link and not contact_info.get('email'):
+                contact_info['email'] = email_link.get('href').replace('mailto:', '')
+                logger.debug("找到邮箱信息: %s", contact_info['email'])
+        elif any(keyword in svg_classes for keyword in ['link', 'globe', 'url']) or 'link' in aria_label:
+            website_link = item.find('a', href=True)
+            if website_link and not contact_info.get('website'):
+                url = website_link.get('href')
+                if not any(excluded in url.lower() for excluded in ['github.com', 'twitter.com', 'linkedin.com']):
+                    contact_info['website'] = url
+                    contact_info['blog'] = url
+                    logger.debug("找到网站信息: %s", url)
+
+    def _apply_fallbacks(self, scan: ProfileScan, contact_info: Dict):
+        """备用策略：aria-label、邮箱正则、CSS类名、微格式，均基于同一次遍历的结果"""
+        try:
+            for elem in scan.all(ARIA_SELECTOR):
+                aria_label = elem.get('aria-label', '').lower()
+                is_location = 'location' in aria_label
+                is_organization = 'organization' in aria_label
+                # 只有可能用到文本时才计算
+                elem_text = elem.get_text().strip() if is_location or is_organization else ''
+                if is_location and elem_text and not contact_info.get('location'):
+                    contact_info['location'] = elem_text
+                elif is_organization and elem_text and not contact_info.get('company'):
+                    contact_info['company'] = elem_text
+                elif 'email' in aria_label or 'mail' in aria_label:
+                    email_link = elem.find('a', href=lambda x: x and 'mailto:' in x)
+                    if email_link and not contact_info.get('email'):
+                        contact_info['email'] = email_link.get('href').replace('mailto:', '')
+
+            if not contact_info.get('email'):
+                valid_emails = [
+                    email for email in EMAIL_PATTERN.findall(scan.text)
+                    if not any(invalid in email.lower() for invalid in INVALID_EMAIL_MARKERS)
+                ]
+                if valid_emails:
+                    contact_info['email'] = valid_emails[0]
+
+            # 同一字段的多个类名依次尝试，后面类名的匹配覆盖前面的（与原有逐类名扫描的结果一致）
+            for info_type, hints in CSS_CLASS_HINTS.items():
+                if contact_info.get(info_type):
+                    continue
+                for hint in hints:
+                    for elem in scan.all(f'~{hint}'):
+                        elem_text = elem.get_text().strip()
+                        if not elem_text:
+                            continue
+                        if info_type == 'email' and '@' in elem_text:
+                            contact_info['email'] = elem_text
+                            break
+                        elif info_type in ['location', 'company'] and len(elem_text) > 2:
+                            contact_info[info_type] = elem_text
+                            break
+                        elif info_type == 'website':
+                            link = elem.find('a', href=True)
+                            if link:
+                                contact_info['website'] = link.get('href')
+                                contact_info['blog'] = link.get('href')
+                                break
+
+            for info_type, selectors in MICROFORMAT_SELECTORS.items():
+                if contact_info.get(info_type):
+                    continue
+                for css in selectors:
+                    for elem in scan.all(css):
+                        if info_type == 'email':
+                            if elem.name == 'a' and elem.get('href', '').startswith('mailto:'):
+                                contact_info['email'] = elem.get('href').replace('mailto:', '')
+                                break
+                        elif info_type == 'website':
+                            if elem.name == 'a' and elem.get('href'):
+                                contact_info['website'] = elem.get('href')
+                                contact_info['blog'] = elem.get('href')
+                                break
+                        else:
+                            elem_text = elem.get_text().strip()
+                            if elem_text:
+                                contact_info[info_type] = elem_text
+                                break
+        except Exception as e:
+            logger.warning("备用解析策略执行失败: %s", e)
+
+    def _fill_additional_data(self, scan: ProfileScan, profile: Dict):
+        additional_info = {}
+        try:
+            join_date = self._join_date(scan)
+            if join_date:
+                additional_info['join_date'] = join_date
+                profile['created_at'] = join_date
+
+            total_contributions = self._total_contributions(scan)
+            if total_contributions is not None:
+                additional_info['contributions'] = {'total_contributions': total_contributions}
+
+            organizations = self._organizations(scan)
+            if organizations:
+                additional_info['organizations'] = organizations
+
+            pinned_repos = self._pinned_repositories(scan)
+            if pinned_repos:
+                additional_info['pinned_repositories'] = pinned_repos
+        except Exception as e:
+            logger.warning("提取额外资料数据时出错: %s", e)
+
+        profile['additional_info'] = additional_info
+
+    def _join_date(self, scan: ProfileScan) -> Optional[str]:
+        elem = scan.first_of(JOIN_DATE_SELECTORS)
+        if elem:
+            return elem.get('datetime') or elem.get('data-date') or elem.text.strip()
+        starts = [start for start in map(scan.text.find, JOIN_DATE_KEYWORDS) if start >= 0]
+        if not starts:
+            return None
+        match = JOIN_DATE_PATTERN.search(scan.text, min(starts))
+        return match.group(match.lastgroup) if match else None
+
+    def _total_contributions(self, scan: ProfileScan) -> Optional[int]:
+        contribution_graph = scan.first(CONTRIBUTIONS_SELECTOR)
+        if contribution_graph:
+            candidates = [contribution_graph]
+        else:
+            candidates = scan.all(CONTRIBUTIONS_HEADING_SELECTOR)
+        for elem in candidates:
+            total_match = CONTRIBUTIONS_PATTERN.search(elem.get_text())
+            if total_match:
+                return int(total_match.group(1).replace(',', ''))
+        return None
+
+    def _organizations(self, scan: ProfileScan) -> List[Dict]:
+        organizations = []
+        for org_elem in scan.union(ORGANIZATION_SELECTORS):
+            org_link = org_elem.find('a', href=True)
+            if org_link:
+                href = org_link.get('href')
+                if href.startswith('/'):
+                    img_elem = org_elem.find('img')
+                    organizations.append({
+                        'name': href.strip('/').split('/')[0],
+                        'url': f"https://github.com{href}",
+                        'avatar_url': img_elem.get('src') if img_elem else None
+                    })
+        return organizations
+
+    def _pinned_repositories(self, scan: ProfileScan) -> List[Dict]:
+        pinned_repos = []
+        for pinned_elem in scan.all(PINNED_SELECTOR):
+            repo_link = pinned_elem.select_one('a[href*="/"]')
+            if repo_link:
+                href = repo_link.get('href')
+                repo_name = href.strip('/').split('/')[-1] if href else None
+                desc_elem = pinned_elem.select_one('.pinned-item-desc')
+                lang_elem = pinned_elem.select_one('[itemprop="programmingLanguage"]')
+                if repo_name:
+                    pinned_repos.append({
+                        'name': repo_name,
+                        'url': f"https://github.com{href}" if href else None,
+                        'description': desc_elem.text.strip() if desc_elem else None,
+                        'language': lang_elem.text.strip() if lang_elem else None
+                    })
+        return pinned_repos
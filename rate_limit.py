@@ -0,0 +1,138 @@
+import os
+import time
+import hashlib
+import logging
+from typing import Dict, Optional, Mapping
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# GitHub API 的限流资源类别
+CORE = "core"
+SEARCH = "search"
+GRAPHQL = "graphql"
+
+ANONYMOUS = "anonymous"
+
+# 为每个资源保留的请求余量，避免并发请求同时耗尽最后几次额度
+DEFAULT_RESERVE = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "1"))
+
+
+def identity_for_authorization(authorization: Optional[str]) -> str:
+    """根据 Authorization 头生成不含明文token的身份标识"""
+    if not authorization:
+        return ANONYMOUS
+    digest = hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:8]
+    return f"token:{digest}"
+
+
+class RateLimitBudget:
+    """单个身份在单个资源上的剩余额度"""
+
+    def __init__(self, limit: int, remaining: int, reset: float):
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        self.updated_at = time.time()
+
+    def available(self, now: float) -> int:
+        """当前可用额度；已过重置时间则视为额度恢复"""
+        if self.reset and now >= self.reset:
+            return self.limit
+        return self.remaining
+
+    def to_dict(self) -> Dict:
+        return {
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'reset': int(self.reset),
+            'reset_in': max(0, int(self.reset - time.time()))
+        }
+
+
+class RateLimitScheduler:
+    """GitHub API 限流预算调度器
+
+    从每个 api.github.com 响应的 X-RateLimit-* 头中读取各资源(core/search/graphql)
+    的实时额度，请求发出前判断是否还有预算，没有预算时调用方直接走HTML抓取路径，
+    而不是先吃一次403再回退。
+    """
+
+    def __init__(self, reserve: int = DEFAULT_RESERVE):
+        self.reserve = reserve
+        self._budgets: Dict[str, Dict[str, RateLimitBudget]] = {}
+        self.skipped = 0
+
+    def observe(self, request_headers: Mapping, status: int, response_headers: Mapping):
+        """记录一次 api.github.com 响应中的限流信息"""
+        identity = identity_for_authorization(request_headers.get('Authorization'))
+        remaining = response_headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            # 二级限流只返回 Retry-After
+            retry_after = response_headers.get('Retry-After')
+            if status in (403, 429) and retry_after:
+                resource = response_headers.get('X-RateLimit-Resource', CORE)
+                self._update(identity, resource, 0, 0, time.time() + float(retry_after))
+            return
+
+        resource = response_headers.get('X-RateLimit-Resource', CORE)
+        try:
+            self._update(
+                identity,
+                resource,
+                int(response_headers.get('X-RateLimit-Limit', 0)),
+                int(remaining),
+                float(response_headers.get('X-RateLimit-Reset', 0))
+            )
+        except ValueError:
+            logger.warning("无法解析限流响应头: remaining=%s", remaining)
+
+    def _update(self, identity: str, resource: str, limit: int, remaining: int, reset: float):
+        budgets = self._budgets.setdefault(identity, {})
+        budget = budgets.get(resource)
+        if budget is None:
+            budgets[resource] = RateLimitBudget(limit, remaining, reset)
+        else:
+            budget.limit = limit or budget.limit
+            budget.remaining = remaining
+            budget.reset = reset
+            budget.updated_at = time.time()
+        if remaining <= self.reserve:
+            logger.warning("GitHub API %s 额度即将耗尽 (%s): 剩余 %s，重置时间 %s", resource, identity, remaining, int(reset))
+
+    def available(self, resource: str = CORE, identity: str = ANONYMOUS) -> Optional[int]:
+        """返回指定身份在资源上的可用额度；尚未观测到时返回 None"""
+        budget = self._budgets.get(identity, {}).get(resource)
+        if budget is None:
+            return None
+        return budget.available(time.time())
+
+    def has_budget(self, resource: str = CORE, identity: str = ANONYMOUS, cost: int = 1) -> bool:
+        """判断指定身份在资源上是否还有预算；尚未观测到的资源视为有预算"""
+        budget = self._budgets.get(identity, {}).get(resource)
+        if budget is None:
+            return True
+        return budget.available(time.time()) - cost >= self.reserve
+
+    def acquire(self, resource: str = CORE, identity: str = ANONYMOUS, cost: int = 1) -> bool:
+        """请求发出前预扣额度，响应到达后以响应头为准；无预算时返回 False"""
+        if not self.has_budget(resource, identity, cost):
+            self.skipped += 1
+            return False
+        budget = self._budgets.get(identity, {}).get(resource)
+        if budget is not None:
+            if budget.reset and time.time() >= budget.reset:
+                budget.remaining = budget.limit
+                budget.reset = 0
+            budget.remaining -= cost
+        return True
+
+    def snapshot(self) -> Dict:
+        """返回各身份、各资源的当前额度"""
+        return {
+            'skipped_requests': self.skipped,
+            'budgets': {
+                identity: {resource: budget.to_dict() for resource, budget in budgets.items()}
+                for identity, budgets in self._budgets.items()
+            }
+        }
@@ -0,0 +1,411 @@
+import os
+import sys
+import time
+import asyncio
+import logging
+import functools
+import contextvars
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Hashable, MutableMapping, Optional, Tuple
+
+from crawl_store import CrawlStore
+from deadline import deadline_scope, DEFAULT_REQUEST_DEADLINE
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 缓存的实体类型
+REPOSITORY = 'repository'
+CONTRIBUTORS = 'contributors'
+PROFILE = 'profile'
+SEARCH = 'search'
+# 名称纠正的别名：AI 给出的不存在的仓库名 -> 搜索纠正得到的仓库全名
+ALIAS = 'alias'
+
+# 是否启用结果缓存
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+# 缓存占用内存的上限（按结果的近似字节数计算）
+DEFAULT_RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# 各类结果的软有效期（秒）：超过后仍直接返回旧结果，同时在后台重新获取
+# 仓库信息和搜索结果变化较快，贡献者列表变化最慢
+DEFAULT_TTLS = {
+    REPOSITORY: float(os.getenv("RESULT_CACHE_TTL_REPOSITORY", "600")),
+    CONTRIBUTORS: float(os.getenv("RESULT_CACHE_TTL_CONTRIBUTORS", "1800")),
+    PROFILE: float(os.getenv("RESULT_CACHE_TTL_PROFILE", "900")),
+    SEARCH: float(os.getenv("RESULT_CACHE_TTL_SEARCH", "300")),
+    ALIAS: float(os.getenv("RESULT_CACHE_TTL_ALIAS", str(7 * 24 * 3600))),
+}
+# 各类结果的硬有效期（秒）：超过后不再返回旧结果，在请求中同步重新获取；
+# 不大于软有效期时不返回旧结果（搜索结果默认如此）
+DEFAULT_HARD_TTLS = {
+    REPOSITORY: float(os.getenv("RESULT_CACHE_HARD_TTL_REPOSITORY", "21600")),
+    CONTRIBUTORS: float(os.getenv("RESULT_CACHE_HARD_TTL_CONTRIBUTORS", "86400")),
+    PROFILE: float(os.getenv("RESULT_CACHE_HARD_TTL_PROFILE", "86400")),
+    SEARCH: float(os.getenv("RESULT_CACHE_HARD_TTL_SEARCH", "300")),
+}
+# 负缓存的有效期（秒）：上游确认不存在（404）的仓库、用户和搜索纠正失败的名称，在此期间不再请求上游
+DEFAULT_NEGATIVE_TTL = float(os.getenv("RESULT_CACHE_NEGATIVE_TTL", "300"))
+# 后台刷新失败后，同一结果至少间隔多久（秒）再尝试刷新
+DEFAULT_REFRESH_RETRY = float(os.getenv("RESULT_CACHE_REFRESH_RETRY", "60"))
+# 写入持久化存储的实体类型；搜索结果变化快、键的组合多，只保存在内存中
+PERSISTED_ENTITIES = (REPOSITORY, CONTRIBUTORS, PROFILE, ALIAS)
+# 启动时从持久化存储预热到内存的每类结果条数上限
+DEFAULT_WARM_LIMIT = int(os.getenv("RESULT_CACHE_WARM_LIMIT", "500"))
+
+# 结果来源：有效期内的缓存、超过软有效期的旧缓存、本次请求重新获取
+HIT = 'HIT'
+STALE = 'STALE'
+MISS = 'MISS'
+
+
+def approximate_size(value: Any) -> int:
+    """结果的近似内存占用（字节）：递归累加 dict / list / str 等对象的 sys.getsizeof"""
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+class Missing:
+    """上游确认不存在（例如返回 404）时，被 @cached 装饰的方法返回 Missing(返回给调用方的默认值)
+
+    @cached 把默认值作为负缓存保存 negative_ttl 秒，期间相同的调用直接返回默认值而不再请求上游；
+    调用方拿到的始终是默认值本身。
+    """
+
+    __slots__ = ('default',)
+
+    def __init__(self, default: Any = None):
+        self.default = default
+
+
+class CacheEntry:
+    """已缓存的结果、抓取时间、软/硬过期时间（time.monotonic() 时刻）、近似大小，以及是否为负缓存"""
+
+    __slots__ = ('entity', 'value', 'fetched_at', 'stale_at', 'expires_at', 'size', 'negative')
+
+    def __init__(self, entity: str, value: Any, fetched_at: float, stale_at: float, expires_at: float, size: int,
+                 negative: bool = False):
+        self.entity = entity
+        self.value = value
+        self.fetched_at = fetched_at
+        self.stale_at = stale_at
+        self.expires_at = expires_at
+        self.size = size
+        self.negative = negative
+
+    def age(self) -> float:
+        """结果抓取至今的秒数"""
+        return max(0.0, time.time() - self.fetched_at)
+
+    def is_stale(self) -> bool:
+        return self.stale_at <= time.monotonic()
+
+
+class Freshness:
+    """当前请求所用结果的新鲜程度：最旧结果的年龄和来源（任一结果为旧缓存时为 STALE）"""
+
+    __slots__ = ('status', 'age')
+
+    def __init__(self):
+        self.status: Optional[str] = None
+        self.age = 0.0
+
+    def record(self, status: str, age: float):
+        if self.status != STALE and (status == STALE or self.status is None or status == MISS):
+            self.status = status
+        self.age = max(self.age, age)
+
+    def apply(self, headers: MutableMapping[str, str]):
+        """写入 X-Cache（HIT / STALE / MISS）和 X-Data-Age（秒）响应头"""
+        if self.status is None:
+            return
+        headers['X-Cache'] = self.status
+        headers['X-Data-Age'] = str(int(self.age))
+
+
+# 当前请求的 Freshness；由接口调用 track_freshness() 设置，asyncio.gather 启动的任务共享同一个对象
+_freshness: ContextVar[Optional[Freshness]] = ContextVar('result_freshness', default=None)
+
+
+def track_freshness() -> Freshness:
+    """开始记录当前请求读取的缓存结果的新鲜程度"""
+    freshness = Freshness()
+    _freshness.set(freshness)
+    return freshness
+
+
+def _report(status: str, age: float):
+    freshness = _freshness.get()
+    if freshness is not None:
+        freshness.record(status, age)
+
+
+class ResultCache:
+    """爬虫结果的进程内缓存：按实体类型设置软/硬有效期，按近似字节数做 LRU 淘汰
+
+    仓库信息、贡献者列表、用户资料和搜索结果共用一个 LRU 链表和内存上限，各类结果的有效期不同。
+    在软有效期内直接返回；超过软有效期、未超过硬有效期时仍直接返回旧结果，并在后台重新获取
+    （stale-while-revalidate）；超过硬有效期的结果在读取时删除，由调用方同步获取。
+    写入时从最久未使用的结果开始淘汰，直到总大小回到上限以内。结果在调用方之间共享，调用方不应原地修改。
+
+    负缓存：上游确认不存在的结果（见 Missing）只在内存中保存 negative_ttl 秒，不区分软硬有效期。
+    别名：搜索纠正得到的名称映射按 ALIAS 类型保存，下次直接使用纠正后的名称。
+
+    传入 store 时作为二级缓存：仓库信息、贡献者列表、用户资料和别名写入时同步写入 SQLite，
+    内存未命中时按抓取时间读取仍在硬有效期内的记录，剩余有效期从抓取时间起算，重启不会延长结果的有效期。
+    SQLite 读写是阻塞调用，经 asyncio.to_thread 在线程中执行，不占用事件循环；因此 lookup / put 等
+    需要访问持久化存储的方法都是协程。
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+                 ttls: Optional[Dict[str, float]] = None, enabled: bool = RESULT_CACHE_ENABLED,
+                 store: Optional[CrawlStore] = None, hard_ttls: Optional[Dict[str, float]] = None,
+                 refresh_retry: float = DEFAULT_REFRESH_RETRY, negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.hard_ttls = dict(DEFAULT_HARD_TTLS)
+        self.hard_ttls.update(hard_ttls or {})
+        self.refresh_retry = refresh_retry
+        self.negative_ttl = negative_ttl
+        self.enabled = enabled
+        self.store = store
+        self._entries: 'OrderedDict[Hashable, CacheEntry]' = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self.total_bytes = 0
+        self.counters = {entity: self._new_counter() for entity in self.ttls}
+
+    @staticmethod
+    def _new_counter() -> Dict[str, int]:
+        return {'hits': 0, 'stale_hits': 0, 'store_hits': 0, 'negative_hits': 0, 'misses': 0, 'expired': 0,
+                'evictions': 0, 'refreshes': 0, 'refresh_failures': 0}
+
+    def _counter(self, entity: str) -> Dict[str, int]:
+        return self.counters.setdefault(entity, self._new_counter())
+
+    def _hard_ttl(self, entity: str) -> float:
+        return max(self.ttls.get(entity, 0), self.hard_ttls.get(entity, 0))
+
+    async def get(self, entity: str, key: Hashable) -> Tuple[bool, Any]:
+        """读取未超过硬有效期的结果，返回 (是否命中, 结果)"""
+        entry = await self.lookup(entity, key)
+        if entry is None:
+            return False, None
+        return True, entry.value
+
+    async def lookup(self, entity: str, key: Hashable) -> Optional[CacheEntry]:
+        """读取未超过硬有效期的缓存项（可能已超过软有效期）；内存未命中时读取持久化存储"""
+        entry = self._entries.get(key)
+        counter = self._counter(entity)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            counter['expired'] += 1
+            entry = None
+        if entry is None:
+            entry = await self._load(entity, key)
+            if entry is None:
+                counter['misses'] += 1
+                return None
+            counter['store_hits'] += 1
+        else:
+            self._entries.move_to_end(key)
+            counter['hits'] += 1
+            if entry.negative:
+                counter['negative_hits'] += 1
+        if entry.is_stale():
+            counter['stale_hits'] += 1
+        return entry
+
+    async def _load(self, entity: str, key: Hashable) -> Optional[CacheEntry]:
+        """从持久化存储读取硬有效期内的结果并放回内存，没有时返回 None"""
+        if self.store is None or entity not in PERSISTED_ENTITIES or self.ttls.get(entity, 0) <= 0:
+            return None
+        row = await asyncio.to_thread(self.store.load, key, self._hard_ttl(entity))
+        if row is None:
+            return None
+        # 读取期间其他请求已写入更新的结果时，不用存储中的旧记录覆盖
+        current = self._entries.get(key)
+        if current is not None:
+            return current
+        value, fetched_at = row
+        return self._insert(entity, key, value, fetched_at)
+
+    async def put(self, entity: str, key: Hashable, value: Any):
+        """写入结果并同步写入持久化存储；单个结果超过内存上限时不放入内存"""
+        if self.ttls.get(entity, 0) <= 0:
+            return
+        fetched_at = time.time()
+        # 先放入内存，写入存储期间的读取直接命中
+        self._insert(entity, key, value, fetched_at)
+        if self.store is not None and entity in PERSISTED_ENTITIES:
+            await asyncio.to_thread(self.store.save, entity, key, value, fetched_at)
+
+    def put_missing(self, entity: str, key: Hashable, default: Any):
+        """写入负缓存：上游确认不存在，negative_ttl 秒内直接返回 default；不写入持久化存储"""
+        if self.negative_ttl <= 0:
+            return
+        self._insert(entity, key, default, time.time(), self.negative_ttl, self.negative_ttl, negative=True)
+
+    async def resolve_alias(self, kind: str, name: str) -> Optional[str]:
+        """返回 name 纠正后的名称（GitHub 名称不区分大小写），没有别名时返回 None"""
+        entry = await self.lookup(ALIAS, (ALIAS, kind, name.lower())) if self.enabled else None
+        return entry.value if entry is not None else None
+
+    async def put_alias(self, kind: str, name: str, target: str):
+        """保存名称纠正的别名 name -> target
+
+        纠正后的名称由搜索确认存在，同时删除 target 自身的别名，别名之间不会形成环。
+        """
+        if not self.enabled or name.lower() == target.lower():
+            return
+        target_key = (ALIAS, kind, target.lower())
+        if target_key in self._entries:
+            self._remove(target_key)
+        if self.store is not None:
+            await asyncio.to_thread(self.store.delete, target_key)
+        await self.put(ALIAS, (ALIAS, kind, name.lower()), target)
+
+    async def warm(self, limit: int = DEFAULT_WARM_LIMIT) -> int:
+        """启动时把持久化存储中每类最近抓取、仍在硬有效期内的结果载入内存，返回载入条数"""
+        if self.store is None or not self.enabled:
+            return 0
+        loaded = 0
+        for entity in PERSISTED_ENTITIES:
+            if self.ttls.get(entity, 0) <= 0:
+                continue
+            rows = await asyncio.to_thread(lambda: list(self.store.recent(entity, self._hard_ttl(entity), limit)))
+            # 从旧到新写入，最近抓取的结果位于 LRU 链表末尾
+            for key, value, fetched_at in reversed(rows):
+                self._insert(entity, key, value, fetched_at)
+                loaded += 1
+        if loaded:
+            logger.info("从持久化存储预热 %s 条结果", loaded)
+        return loaded
+
+    def _insert(self, entity: str, key: Hashable, value: Any, fetched_at: float, ttl: Optional[float] = None,
+                hard_ttl: Optional[float] = None, negative: bool = False) -> Optional[CacheEntry]:
+        size = approximate_size(value)
+        if size > self.max_bytes:
+            return None
+        if key in self._entries:
+            self._remove(key)
+        # 剩余有效期从抓取时间起算
+        now = time.monotonic()
+        age = max(0.0, time.time() - fetched_at)
+        soft = self.ttls.get(entity, 0) if ttl is None else ttl
+        hard = self._hard_ttl(entity) if hard_ttl is None else hard_ttl
+        entry = CacheEntry(entity, value, fetched_at, now + soft - age, now + hard - age, size, negative)
+        self._entries[key] = entry
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            self._remove(oldest_key)
+            self._counter(oldest.entity)['evictions'] += 1
+        return entry
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+
+    def refresh_in_background(self, entity: str, key: Hashable, refresh: Callable[[], Awaitable[Any]]):
+        """在后台重新获取超过软有效期的结果；同一个结果同时只有一个后台刷新
+
+        刷新任务在新的上下文中运行，不继承触发它的请求的截止时间，使用单独的处理时限；
+        刷新失败时保留旧结果，refresh_retry 秒后才会再次尝试。
+        """
+        if key in self._refreshing:
+            return
+        task = asyncio.get_running_loop().create_task(self._refresh(entity, key, refresh), context=contextvars.Context())
+        self._refreshing[key] = task
+
+    async def _refresh(self, entity: str, key: Hashable, refresh: Callable[[], Awaitable[Any]]):
+        stale = self._entries.get(key)
+        counter = self._counter(entity)
+        try:
+            with deadline_scope(DEFAULT_REQUEST_DEADLINE):
+                await refresh()
+        except Exception as e:
+            logger.warning("后台刷新缓存结果失败 %s: %s", key, e)
+        finally:
+            self._refreshing.pop(key, None)
+            if stale is not None and self._entries.get(key) is stale:
+                # 未获取到可缓存的新结果
+                counter['refresh_failures'] += 1
+                stale.stale_at = time.monotonic() + self.refresh_retry
+            else:
+                counter['refreshes'] += 1
+
+    def cancel_refreshes(self):
+        """取消尚未完成的后台刷新（服务退出时调用）"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+
+    def stats(self) -> Dict:
+        """返回条数、近似占用字节数、进行中的后台刷新数，以及各类结果的命中、旧结果命中、持久化存储命中、
+        负缓存命中、未命中、过期、淘汰和后台刷新次数"""
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'ttls': dict(self.ttls),
+            'hard_ttls': {entity: self._hard_ttl(entity) for entity in self.ttls},
+            'negative_ttl': self.negative_ttl,
+            'negative_entries': sum(1 for entry in self._entries.values() if entry.negative),
+            'refreshing': len(self._refreshing),
+            'entities': {entity: dict(counter) for entity, counter in self.counters.items()}
+        }
+
+
+def cached(entity: str, cacheable: Callable[[Any], bool] = bool, keep_missing: bool = False):
+    """异步方法装饰器：按方法名和参数缓存结果，实例需提供 result_cache 属性
+
+    只缓存 cacheable(结果) 为真的结果，获取失败时返回的默认值不会被缓存；
+    方法返回 Missing(默认值) 时作为负缓存保存，调用方拿到默认值；
+    keep_missing=True 时调用方拿到 Missing 本身（包括命中负缓存时），用于区分"确认不存在"和"获取失败"；
+    超过软有效期的结果直接返回，同时在后台以 force_refresh=True 重新调用本方法；
+    调用时传入 force_refresh=True 跳过读取缓存，重新获取并覆盖已缓存的结果。
+    结果的来源和年龄记录到当前请求的 Freshness（见 track_freshness）。
+    放在 @coalesced 之外，命中缓存时不再进入在途请求合并。
+    """
+
+    def decorator(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(method)
+        async def wrapper(self, *args, force_refresh: bool = False, **kwargs):
+            cache: Optional[ResultCache] = getattr(self, 'result_cache', None)
+            if cache is None or not cache.enabled:
+                value = await method(self, *args, **kwargs)
+                return value.default if isinstance(value, Missing) and not keep_missing else value
+            key = (method.__qualname__,) + args + tuple(sorted(kwargs.items()))
+            if not force_refresh:
+                entry = await cache.lookup(entity, key)
+                if entry is not None:
+                    if entry.is_stale():
+                        cache.refresh_in_background(
+                            entity, key, lambda: wrapper(self, *args, force_refresh=True, **kwargs))
+                        _report(STALE, entry.age())
+                    else:
+                        _report(HIT, entry.age())
+                    return Missing(entry.value) if entry.negative and keep_missing else entry.value
+            value = await method(self, *args, **kwargs)
+            _report(MISS, 0.0)
+            if isinstance(value, Missing):
+                cache.put_missing(entity, key, value.default)
+                return value if keep_missing else value.default
+            if cacheable(value):
+                await cache.put(entity, key, value)
+            return value
+
+        return wrapper
+
+    return decorator
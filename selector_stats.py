@@ -0,0 +1,113 @@
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 命中分数的衰减系数：每次查找后所有候选项的分数乘以该系数，命中的候选项再加1；
+# 页面改版后新的命中者在几次查找内就会排到前面
+DEFAULT_DECAY = 0.9
+
+
+class SelectorPlan:
+    """一组按优先级声明的备选选择器（或提取策略），按历史命中自适应调整尝试顺序
+
+    近期命中最多的候选项排在最前面，分数相同时保持声明顺序，其余候选项仍作为回退依次尝试，
+    因此页面结构稳定时通常第一次尝试就命中，不必为每个落空的选择器扫描一遍DOM树。
+    """
+
+    def __init__(self, name: str, candidates: Iterable[str], decay: float = DEFAULT_DECAY,
+                 journal: Optional[List[Tuple]] = None):
+        self.name = name
+        self.candidates = list(candidates)
+        self.decay = decay
+        self._position = {candidate: index for index, candidate in enumerate(self.candidates)}
+        self._scores = {candidate: 0.0 for candidate in self.candidates}
+        self._order = list(self.candidates)
+        self.hits = {candidate: 0 for candidate in self.candidates}
+        self.lookups = 0
+        self.misses = 0
+        self.probes = 0
+        self._journal = journal
+
+    def order(self) -> List[str]:
+        """当前的尝试顺序"""
+        return self._order
+
+    def first(self, probe: Callable[[str], Any]) -> Tuple[Optional[str], Any]:
+        """按当前顺序尝试候选项，返回第一个结果为真的 (候选项, 结果) 并记录命中；都落空时返回 (None, None)"""
+        for probes, candidate in enumerate(self._order, 1):
+            result = probe(candidate)
+            if result:
+                self.record(candidate, probes)
+                return candidate, result
+        self.record(None, len(self._order))
+        return None, None
+
+    def record(self, winner: Optional[str], probes: int = 0):
+        """记录一次查找的结果；probes 为实际尝试的候选项数（单次遍历中一并求值的选择器记为0）"""
+        self.lookups += 1
+        self.probes += probes
+        if self._journal is not None:
+            self._journal.append((self.name, self.candidates, winner, probes))
+        for candidate in self._scores:
+            self._scores[candidate] *= self.decay
+        if winner is None:
+            self.misses += 1
+            return
+        self.hits[winner] += 1
+        self._scores[winner] += 1
+        if self._order[0] != winner:
+            previous = self._order[0]
+            self._order = sorted(self.candidates, key=lambda candidate: (-self._scores[candidate], self._position[candidate]))
+            if self._order[0] != previous:
+                logger.info("选择器顺序调整 %s: 优先尝试 '%s'", self.name, self._order[0])
+
+    def stats(self) -> Dict:
+        """返回查找次数、落空次数、平均尝试次数、当前顺序和各候选项的命中率"""
+        return {
+            'lookups': self.lookups,
+            'misses': self.misses,
+            'probes_per_lookup': round(self.probes / self.lookups, 2) if self.lookups else 0,
+            'order': list(self._order),
+            'hit_rates': {
+                candidate: round(hits / self.lookups, 3) if self.lookups else 0
+                for candidate, hits in self.hits.items()
+            }
+        }
+
+
+class SelectorStats:
+    """按名称管理各提取点的 SelectorPlan，供 /api/stats 汇总命中率
+
+    解析在子进程中进行时，子进程开启 journal 记录每次查找，随解析结果带回主进程重放，
+    使主进程的统计覆盖所有子进程。
+    """
+
+    def __init__(self, decay: float = DEFAULT_DECAY, journal: bool = False):
+        self.decay = decay
+        self._plans: Dict[str, SelectorPlan] = {}
+        self._journal: Optional[List[Tuple]] = [] if journal else None
+
+    def plan(self, name: str, candidates: Iterable[str]) -> SelectorPlan:
+        """获取（必要时创建）名为 name 的选择器计划"""
+        plan = self._plans.get(name)
+        if plan is None:
+            plan = self._plans[name] = SelectorPlan(name, candidates, self.decay, self._journal)
+        return plan
+
+    def drain(self) -> List[Tuple]:
+        """取出并清空 journal 中尚未带回的查找记录"""
+        if not self._journal:
+            return []
+        records = list(self._journal)
+        self._journal.clear()
+        return records
+
+    def replay(self, records: List[Tuple]):
+        """重放子进程带回的查找记录"""
+        for name, candidates, winner, probes in records:
+            self.plan(name, candidates).record(winner, probes)
+
+    def stats(self) -> Dict:
+        return {name: plan.stats() for name, plan in self._plans.items()}
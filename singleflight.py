@@ -0,0 +1,81 @@
+import asyncio
+import inspect
+import functools
+import logging
+import contextvars
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+import deadline
+from deadline import DeadlineExceeded, deadline_scope, DEFAULT_REQUEST_DEADLINE
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """在途请求合并：同一个 key 同时只执行一次上游请求和解析
+
+    后到的相同请求直接等待第一个请求的结果。共享的任务通过 asyncio.shield 保护，
+    某个调用方被取消（例如客户端断开）不会影响其他仍在等待的调用方。
+    共享的任务不继承第一个调用方的截止时间，在新的上下文中使用单独的处理时限；
+    每个调用方只按自己剩余的时间等待，超时时抛出 DeadlineExceeded，任务继续为其他调用方执行。
+    返回值在调用方之间共享，调用方不应原地修改。
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """执行或加入 key 对应的在途请求"""
+        task = self._inflight.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.get_running_loop().create_task(self._run(factory), context=contextvars.Context())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish, key))
+        else:
+            self.shared += 1
+            logger.info("合并在途请求: %s", key)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(str(key)) from None
+
+    @staticmethod
+    async def _run(factory: Callable[[], Awaitable[Any]]) -> Any:
+        with deadline_scope(DEFAULT_REQUEST_DEADLINE):
+            return await factory()
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 所有调用方都已取消时，避免出现未获取异常的警告
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        """返回实际执行次数、被合并的请求数和当前在途数量"""
+        return {
+            'executed': self.executed,
+            'shared': self.shared,
+            'in_flight': len(self._inflight)
+        }
+
+
+def coalesced(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """异步方法装饰器：按方法名和参数合并并发的相同调用，实例需提供 singleflight 属性
+
+    参数按方法签名绑定并补全默认值后组成键，f(owner, repo) 与 f(owner=owner, repo=repo) 视为同一调用。
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__qualname__,) + tuple(bound.arguments.items())[1:]
+        return await self.singleflight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
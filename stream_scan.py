@@ -0,0 +1,53 @@
+import codecs
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, List, Optional
+
+# 目标元素的匹配函数：(标签名, 属性字典) -> 是否为目标元素
+ElementMatcher = Callable[[str, Dict[str, Optional[str]]], bool]
+
+
+class ElementTracker(HTMLParser):
+    """增量扫描HTML片段，判断一组目标元素是否都已完整出现（读到了结束标签）
+
+    边下载边喂入响应块，只记录目标元素是否出现，不构建DOM；
+    任意一组目标（默认为全部目标）都已出现后，已下载的前缀就足够提取所需字段，剩余内容可以不再下载。
+    """
+
+    def __init__(self, targets: Dict[str, ElementMatcher], groups: Optional[Iterable[Iterable[str]]] = None):
+        super().__init__(convert_charrefs=False)
+        self.targets = dict(targets)
+        self.groups = [frozenset(group) for group in (groups or [self.targets])]
+        self.found = set()
+        # 正在读取的目标元素：[目标名, 标签名, 同名标签的嵌套深度]
+        self._open: List[list] = []
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.bytes_read = 0
+
+    @property
+    def done(self) -> bool:
+        return any(group <= self.found for group in self.groups)
+
+    def feed_bytes(self, chunk: bytes):
+        """喂入一个响应块；多字节字符可以跨块"""
+        self.bytes_read += len(chunk)
+        self.feed(self._decoder.decode(chunk))
+
+    def handle_starttag(self, tag: str, attrs):
+        for entry in self._open:
+            if entry[1] == tag:
+                entry[2] += 1
+        attr_map = dict(attrs)
+        reading = {entry[0] for entry in self._open}
+        for name, matches in self.targets.items():
+            if name not in self.found and name not in reading and matches(tag, attr_map):
+                self._open.append([name, tag, 0])
+
+    def handle_endtag(self, tag: str):
+        for entry in list(self._open):
+            if entry[1] != tag:
+                continue
+            if entry[2]:
+                entry[2] -= 1
+            else:
+                self._open.remove(entry)
+                self.found.add(entry[0])
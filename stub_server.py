@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+GitHub / DeepSeek 本地替身服务器 - 用于离线压测
+录制模式下代理真实上游并保存响应，回放模式下返回已录制的响应，
+未录制的请求返回合成数据；支持配置延迟和错误注入。
+
+启动替身服务器后，将后端服务的上游地址指向它：
+    GITHUB_WEB_BASE=http://127.0.0.1:9100/github
+    GITHUB_API_BASE=http://127.0.0.1:9100/api
+    DEEPSEEK_API_BASE=http://127.0.0.1:9100/deepseek/v1/chat/completions
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+
+# 设置日志
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 路径前缀 -> 真实上游地址
+UPSTREAMS = {
+    'github': 'https://github.com',
+    'api': 'https://api.github.com',
+    'deepseek': 'https://api.deepseek.com',
+}
+
+DEFAULT_PORT = 9100
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / "stub_fixtures"
+
+# 录制时保留的响应头；限流头由替身服务器按回放时间重新生成
+RECORDED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+# 录制时转发给上游的请求头
+FORWARDED_HEADERS = ('Accept', 'Authorization', 'User-Agent', 'Content-Type')
+
+
+class StubConfig:
+    """延迟和错误注入配置，可通过 POST /_stub/config 在运行时修改"""
+
+    def __init__(self, latency_ms: Optional[Dict[str, float]] = None, jitter_ms: float = 0,
+                 error_rate: float = 0, error_status: int = 503,
+                 hang_rate: float = 0, hang_seconds: float = 120, pad_kb: int = 0):
+        # 各上游的基础延迟（毫秒），键为 UPSTREAMS 中的前缀，'*' 为默认值
+        self.latency_ms = latency_ms or {'*': 0}
+        self.jitter_ms = jitter_ms
+        # 按比例返回错误状态码
+        self.error_rate = error_rate
+        self.error_status = error_status
+        # 按比例挂起请求，模拟上游无响应
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        # 合成HTML页面的填充大小（KB），使解析开销接近真实页面
+        self.pad_kb = pad_kb
+
+    def latency_for(self, upstream: str) -> float:
+        base = self.latency_ms.get(upstream, self.latency_ms.get('*', 0))
+        jitter = random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, base + jitter) / 1000
+
+    def update(self, values: Dict):
+        converters = {'jitter_ms': float, 'error_rate': float, 'error_status': int,
+                      'hang_rate': float, 'hang_seconds': float, 'pad_kb': int}
+        for name, convert in converters.items():
+            if name in values:
+                setattr(self, name, convert(values[name]))
+        if 'latency_ms' in values:
+            latency = values['latency_ms']
+            self.latency_ms = dict(latency) if isinstance(latency, dict) else {'*': float(latency)}
+
+    def to_dict(self) -> Dict:
+        return {
+            'latency_ms': self.latency_ms,
+            'jitter_ms': self.jitter_ms,
+            'error_rate': self.error_rate,
+            'error_status': self.error_status,
+            'hang_rate': self.hang_rate,
+            'hang_seconds': self.hang_seconds,
+            'pad_kb': self.pad_kb
+        }
+
+
+class FixtureStore:
+    """录制的响应，每个请求一个JSON文件：<目录>/<上游>/<请求摘要>.json"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._by_upstream: Dict[str, List[Path]] = {}
+
+    @staticmethod
+    def key(method: str, path_qs: str, body: bytes) -> str:
+        digest = hashlib.sha1()
+        digest.update(method.encode('utf-8'))
+        digest.update(path_qs.encode('utf-8'))
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _path(self, upstream: str, key: str) -> Path:
+        return self.root / upstream / f"{key}.json"
+
+    def load(self, upstream: str, key: str) -> Optional[Dict]:
+        path = self._path(upstream, key)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def any_for(self, upstream: str, key: str) -> Optional[Dict]:
+        """没有完全匹配的录制时，按请求摘要稳定地选一条同上游的录制（用于每次提示词都不同的AI请求）"""
+        paths = self._by_upstream.get(upstream)
+        if paths is None:
+            directory = self.root / upstream
+            paths = sorted(directory.glob('*.json')) if directory.exists() else []
+            self._by_upstream[upstream] = paths
+        if not paths:
+            return None
+        path = paths[int(key[:8], 16) % len(paths)]
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def save(self, upstream: str, key: str, record: Dict):
+        path = self._path(upstream, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding='utf-8')
+        self._by_upstream.pop(upstream, None)
+
+
+def _html_page(title: str, body: str, pad_kb: int) -> str:
+    padding = ''
+    if pad_kb:
+        # 真实的 GitHub 页面大部分是与数据无关的导航和脚本
+        padding = '<div class="footer-padding">' + ('<span class="x">padding</span>' * (pad_kb * 1024 // 28)) + '</div>'
+    return f"<!DOCTYPE html><html><head><title>{title}</title></head><body>{body}{padding}</body></html>"
+
+
+def _seeded(text: str, low: int, high: int) -> int:
+    """按名称生成稳定的伪随机数，同一仓库每次返回相同的统计数据"""
+    return low + int(hashlib.md5(text.encode('utf-8')).hexdigest()[:8], 16) % (high - low)
+
+
+def _synthetic_github(parts: List[str], query: Dict, pad_kb: int) -> Dict:
+    """合成 github.com 页面：仓库页、贡献者页、Commits页、用户主页和搜索页"""
+    if parts == ['search']:
+        q = query.get('q', 'project')
+        items = ''.join(
+            f'<div class="repo-list-item"><a href="/{q}-org/{q}-{i}">{q}-org/{q}-{i}</a>'
+            f'<p class="mb-1">Synthetic {q} project {i}</p>'
+            f'<a href="/{q}-org/{q}-{i}/stargazers">{_seeded(q + str(i), 10, 5000)}</a>'
+            f'<span itemprop="programmingLanguage">Python</span></div>'
+            for i in range(10)
+        )
+        # 新版搜索页的结果以JSON形式内嵌在 react-app 中
+        results = [
+            {'hl_name': f'{q}-org/<em>{q}</em>-{i}', 'hl_trunc_description': f'Synthetic <em>{q}</em> project {i}',
+             'followers': _seeded(q + str(i), 10, 5000), 'language': 'Python',
+             'repo': {'repository': {'owner_login': f'{q}-org', 'name': f'{q}-{i}', 'updated_at': '2024-01-01T00:00:00Z'}}}
+            for i in range(10)
+        ]
+        payload = json.dumps({'payload': {'results': results, 'result_count': len(results)}}).replace('<', '\\u003c')
+        items += f'<react-app><script type="application/json" data-target="react-app.embeddedData">{payload}</script></react-app>'
+        return {'status': 200, 'headers': {'Content-Type': 'text/html; charset=utf-8'},
+                'body': _html_page('Search', items, pad_kb)}
+
+    if len(parts) == 1:
+        username = parts[0]
+        body = (
+            f'<div class="Layout-sidebar"><div class="h-card">'
+            f'<span class="p-name vcard-fullname">{username.title()}</span>'
+            f'<span class="p-nickname vcard-username">{username}</span>'
+            f'<div class="p-note user-profile-bio"><div>Synthetic profile of {username}</div></div>'
+            f'<a href="/{username}?tab=followers"><span class="text-bold">{_seeded(username, 0, 900)}</span> followers</a>'
+            f'<a href="/{username}?tab=following"><span class="text-bold">{_seeded(username + "f", 0, 90)}</span> following</a>'
+            f'</div></div>'
+        )
+        return {'status': 200, 'headers': {'Content-Type': 'text/html; charset=utf-8'},
+                'body': _html_page(username, body, pad_kb)}
+
+    if len(parts) >= 2:
+        owner, repo = parts[0], parts[1]
+        rest = parts[2:]
+        if rest == ['commits']:
+            rows = ''.join(
+                f'<div class="Box-row"><img alt="@{owner}-dev{i}" src="https://github.com/{owner}-dev{i}.png">'
+                f'<a href="/{owner}-dev{i}">{owner}-dev{i}</a></div>'
+                for i in range(10)
+            )
+            return {'status': 200, 'headers': {'Content-Type': 'text/html; charset=utf-8'},
+                    'body': _html_page(f'Commits · {owner}/{repo}', rows, pad_kb)}
+        if rest == ['graphs', 'contributors']:
+            # 真实页面的贡献者列表由前端脚本渲染，静态HTML中没有数据
+            return {'status': 200, 'headers': {'Content-Type': 'text/html; charset=utf-8'},
+                    'body': _html_page(f'Contributors · {owner}/{repo}', '', pad_kb)}
+        if not rest:
+            name = f"{owner}/{repo}"
+            body = (
+                f'<div id="repository-container-header">'
+                f'<a href="/{name}/stargazers">{_seeded(name, 10, 90000)}</a>'
+                f'<a href="/{name}/forks">{_seeded(name + "f", 1, 9000)}</a>'
+                f'</div><div class="Layout-sidebar">'
+                f'<p class="f4 my-3">Synthetic repository {name}</p>'
+                f'<span class="color-fg-default text-bold mr-1">Python</span>'
+                f'</div>'
+            )
+            return {'status': 200, 'headers': {'Content-Type': 'text/html; charset=utf-8'},
+                    'body': _html_page(name, body, pad_kb)}
+
+    return {'status': 404, 'headers': {'Content-Type': 'text/html; charset=utf-8'}, 'body': 'Not Found'}
+
+
+def _repo_json(owner: str, repo: str) -> Dict:
+    name = f"{owner}/{repo}"
+    return {
+        'name': repo,
+        'full_name': name,
+        'owner': {'login': owner},
+        'description': f"Synthetic repository {name}",
+        'stargazers_count': _seeded(name, 10, 90000),
+        'forks_count': _seeded(name + 'f', 1, 9000),
+        'language': 'Python',
+        'html_url': f"https://github.com/{name}",
+        'topics': ['synthetic'],
+        'license': {'name': 'MIT License'},
+        'created_at': '2020-01-01T00:00:00Z',
+        'updated_at': '2024-01-01T00:00:00Z'
+    }
+
+
+def _synthetic_api(parts: List[str], query: Dict) -> Dict:
+    """合成 api.github.com 响应：仓库、贡献者和仓库搜索"""
+    data = None
+    if parts == ['search', 'repositories']:
+        q = query.get('q', 'project').split()[0]
+        per_page = int(query.get('per_page', 10))
+        items = [_repo_json(f"{q}-org", f"{q}-{i}") for i in range(per_page)]
+        data = {'total_count': len(items), 'incomplete_results': False, 'items': items}
+    elif len(parts) == 3 and parts[0] == 'repos':
+        data = _repo_json(parts[1], parts[2])
+    elif len(parts) == 4 and parts[0] == 'repos' and parts[3] == 'contributors':
+        owner = parts[1]
+        per_page = int(query.get('per_page', 10))
+        data = [
+            {'login': f"{owner}-dev{i}", 'avatar_url': f"https://github.com/{owner}-dev{i}.png",
+             'contributions': 500 - i * 37, 'html_url': f"https://github.com/{owner}-dev{i}"}
+            for i in range(per_page)
+        ]
+    if data is None:
+        return {'status': 404, 'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps({'message': 'Not Found'})}
+    return {'status': 200, 'headers': {'Content-Type': 'application/json; charset=utf-8'},
+            'body': json.dumps(data)}
+
+
+def _synthetic_deepseek(body: bytes) -> Dict:
+    """合成 DeepSeek chat completion：按请求内容返回固定格式的推荐JSON"""
+    seed = hashlib.md5(body).hexdigest()[:6]
+    content = {
+        'analysis': {'summary': '合成的需求分析', 'keywords': ['stub', 'load-test']},
+        'recommendations': [
+            {'repository': f"stub-{seed}/project-{i}", 'name': f"project-{i}",
+             'description': f"Synthetic recommendation {i}", 'match_reason': '合成推荐'}
+            for i in range(5)
+        ]
+    }
+    completion = {
+        'id': f"stub-{seed}",
+        'object': 'chat.completion',
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': json.dumps(content, ensure_ascii=False)},
+                     'finish_reason': 'stop'}]
+    }
+    return {'status': 200, 'headers': {'Content-Type': 'application/json'}, 'body': json.dumps(completion)}
+
+
+class StubServer:
+    """替身服务器：按路径前缀区分上游，依次尝试录制的响应和合成响应"""
+
+    def __init__(self, store: FixtureStore, config: StubConfig, record: bool = False,
+                 synthetic: bool = True):
+        self.store = store
+        self.config = config
+        self.record = record
+        self.synthetic = synthetic
+        self.stats = {name: {'requests': 0, 'replayed': 0, 'recorded': 0, 'synthetic': 0,
+                             'not_modified': 0, 'injected_errors': 0, 'hung': 0, 'missing': 0}
+                      for name in UPSTREAMS}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def on_cleanup(self, app: web.Application):
+        if self._session is not None:
+            await self._session.close()
+
+    async def _proxy(self, upstream: str, request: web.Request, tail: str, body: bytes) -> Dict:
+        """录制模式：转发到真实上游，返回可保存的响应记录"""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        headers = {name: request.headers[name] for name in FORWARDED_HEADERS if name in request.headers}
+        url = f"{UPSTREAMS[upstream]}/{tail}"
+        async with self._session.request(request.method, url, params=request.query, data=body or None,
+                                         headers=headers) as response:
+            content = await response.read()
+            return {
+                'status': response.status,
+                'headers': {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+                'body': content.decode('utf-8', errors='replace')
+            }
+
+    def _synthesize(self, upstream: str, tail: str, query: Dict, body: bytes) -> Dict:
+        parts = [part for part in tail.split('/') if part]
+        if upstream == 'github':
+            return _synthetic_github(parts, query, self.config.pad_kb)
+        if upstream == 'api':
+            return _synthetic_api(parts, query)
+        return _synthetic_deepseek(body)
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        upstream = request.match_info['upstream']
+        if upstream not in UPSTREAMS:
+            raise web.HTTPNotFound(text=f"未知上游: {upstream}")
+        tail = request.match_info['tail']
+        body = await request.read()
+        stats = self.stats[upstream]
+        stats['requests'] += 1
+
+        delay = self.config.latency_for(upstream)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.config.hang_rate and random.random() < self.config.hang_rate:
+            stats['hung'] += 1
+            await asyncio.sleep(self.config.hang_seconds)
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            stats['injected_errors'] += 1
+            return web.json_response({'message': 'injected error'}, status=self.config.error_status)
+
+        path_qs = '/' + tail + (f"?{request.query_string}" if request.query_string else '')
+        key = FixtureStore.key(request.method, path_qs, body)
+        if self.record:
+            record = await self._proxy(upstream, request, tail, body)
+            self.store.save(upstream, key, record)
+            stats['recorded'] += 1
+        else:
+            record = self.store.load(upstream, key)
+            if record is None and upstream == 'deepseek':
+                record = self.store.any_for(upstream, key)
+            if record is not None:
+                stats['replayed'] += 1
+            elif self.synthetic:
+                record = self._synthesize(upstream, tail, dict(request.query), body)
+                stats['synthetic'] += 1
+            else:
+                stats['missing'] += 1
+                return web.json_response({'message': f"未录制的请求: {request.method} {path_qs}"}, status=404)
+
+        return self._respond(upstream, tail, record, request)
+
+    def _respond(self, upstream: str, tail: str, record: Dict, request: web.Request) -> web.Response:
+        headers = dict(record.get('headers', {}))
+        body = record.get('body', '').encode('utf-8')
+        if upstream == 'api':
+            # 限流头按回放时间生成，避免录制时的剩余额度让调度器跳过API
+            headers['X-RateLimit-Limit'] = '5000'
+            headers['X-RateLimit-Remaining'] = '4999'
+            headers['X-RateLimit-Reset'] = str(int(time.time()) + 3600)
+            headers['X-RateLimit-Resource'] = 'search' if tail.startswith('search') else 'core'
+            if record['status'] == 200:
+                etag = headers.setdefault('ETag', f'W/"{hashlib.sha1(body).hexdigest()[:20]}"')
+                if request.headers.get('If-None-Match') == etag:
+                    self.stats[upstream]['not_modified'] += 1
+                    return web.Response(status=304, headers=headers)
+        content_type = headers.pop('Content-Type', 'application/octet-stream')
+        response = web.Response(status=record['status'], body=body, headers=headers)
+        response.headers['Content-Type'] = content_type
+        return response
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({'config': self.config.to_dict(), 'upstreams': self.stats})
+
+    async def update_config(self, request: web.Request) -> web.Response:
+        self.config.update(await request.json())
+        logger.info("替身服务器配置已更新: %s", self.config.to_dict())
+        return web.json_response(self.config.to_dict())
+
+    def make_app(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_get('/_stub/stats', self.get_stats)
+        app.router.add_post('/_stub/config', self.update_config)
+        app.router.add_route('*', '/{upstream}/{tail:.*}', self.handle)
+        app.on_cleanup.append(self.on_cleanup)
+        return app
+
+
+def _parse_latency(values: List[str]) -> Dict[str, float]:
+    """解析 --latency 参数：'80' 表示所有上游，'deepseek=1500' 表示单个上游"""
+    latency = {'*': 0.0}
+    for value in values or []:
+        if '=' in value:
+            name, ms = value.split('=', 1)
+            if name not in UPSTREAMS:
+                raise argparse.ArgumentTypeError(f"未知上游: {name}")
+            latency[name] = float(ms)
+        else:
+            latency['*'] = float(value)
+    return latency
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="GitHub / DeepSeek 本地替身服务器")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=int(os.getenv("STUB_PORT", DEFAULT_PORT)))
+    parser.add_argument('--fixtures', default=str(DEFAULT_FIXTURES_DIR), help="录制文件目录")
+    parser.add_argument('--record', action='store_true', help="代理真实上游并录制响应（需要网络）")
+    parser.add_argument('--no-synthetic', action='store_true', help="未录制的请求返回404而不是合成数据")
+    parser.add_argument('--latency', action='append', metavar='[UPSTREAM=]MS',
+                        help="注入延迟（毫秒），可重复，如 --latency 50 --latency deepseek=1500")
+    parser.add_argument('--jitter', type=float, default=0, help="延迟抖动（毫秒）")
+    parser.add_argument('--error-rate', type=float, default=0, help="返回错误状态码的比例")
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--hang-rate', type=float, default=0, help="挂起不响应的请求比例")
+    parser.add_argument('--hang-seconds', type=float, default=120)
+    parser.add_argument('--pad-kb', type=int, default=0, help="合成HTML页面的填充大小（KB）")
+    args = parser.parse_args(argv)
+
+    config = StubConfig(
+        latency_ms=_parse_latency(args.latency),
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        pad_kb=args.pad_kb
+    )
+    server = StubServer(FixtureStore(args.fixtures), config, record=args.record, synthetic=not args.no_synthetic)
+
+    base = f"http://{args.host}:{args.port}"
+    print(f"替身服务器运行在 {base}（{'录制' if args.record else '回放'}模式）")
+    print(f"  GITHUB_WEB_BASE={base}/github")
+    print(f"  GITHUB_API_BASE={base}/api")
+    print(f"  DEEPSEEK_API_BASE={base}/deepseek/v1/chat/completions")
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""结果缓存和 AI 推荐结果缓存：持久化存储的读写不在事件循环线程中执行，AI 缓存按间隔清理"""
+
+import asyncio
+import threading
+
+from ai_response_cache import AIResponseCache
+from crawl_store import CrawlStore
+from result_cache import ResultCache, REPOSITORY, cached
+
+
+class RecordingStore(CrawlStore):
+    """记录每次数据库操作所在的线程"""
+
+    def __init__(self):
+        super().__init__(path=':memory:')
+        self.threads = []
+        self.trims = 0
+
+    def load(self, key, max_age):
+        self.threads.append(threading.get_ident())
+        return super().load(key, max_age)
+
+    def save(self, entity, key, value, fetched_at=None):
+        self.threads.append(threading.get_ident())
+        super().save(entity, key, value, fetched_at)
+
+    def trim(self, entity, max_entries):
+        self.threads.append(threading.get_ident())
+        self.trims += 1
+        super().trim(entity, max_entries)
+
+
+class Crawler:
+    def __init__(self, cache: ResultCache):
+        self.result_cache = cache
+        self.calls = 0
+
+    @cached(REPOSITORY)
+    async def get_repository(self, owner: str, repo: str):
+        self.calls += 1
+        return {'full_name': f"{owner}/{repo}"}
+
+
+def test_result_cache_store_io_runs_off_the_event_loop():
+    store = RecordingStore()
+
+    async def run():
+        crawler = Crawler(ResultCache(store=store))
+        await crawler.get_repository('octo', 'cat')
+        # 新的进程内缓存只能从持久化存储读到结果
+        restarted = Crawler(ResultCache(store=store))
+        value = await restarted.get_repository('octo', 'cat')
+        return threading.get_ident(), value, restarted.calls
+
+    loop_thread, value, calls = asyncio.run(run())
+    assert value == {'full_name': 'octo/cat'}
+    assert calls == 0
+    assert len(store.threads) >= 2
+    assert loop_thread not in store.threads
+
+
+def test_ai_cache_trims_on_open_and_every_interval():
+    store = RecordingStore()
+    cache = AIResponseCache('model', 0.7, 'prompt', store=store, max_entries=2, trim_interval=3)
+    assert store.trims == 1
+
+    async def run():
+        for i in range(7):
+            await cache.put(f"需求 {i}", 5, {'analysis': '', 'recommendations': [{'name': str(i)}]})
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    # 第3、6次写入后清理，之后的写入暂时超出上限
+    assert store.trims == 3
+    assert store.stats()['entries'] == 3
+    assert loop_thread not in store.threads[1:]
+
+    reopened = AIResponseCache('model', 0.7, 'prompt', store=store, max_entries=2)
+    assert store.trims == 4
+    assert store.stats()['entries'] == 2
+    assert asyncio.run(reopened.get("需求 6", 5)) == {'analysis': '', 'recommendations': [{'name': '6'}]}
@@ -0,0 +1,36 @@
+"""解析进程池的背压：等待空位的解析也计入 busy()"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import parse_pool
+from parse_pool import ParsePool
+
+
+def test_busy_counts_waiters(monkeypatch):
+    gate = threading.Event()
+    monkeypatch.setattr(parse_pool, '_run_in_worker', lambda method, args: (gate.wait(5), []))
+    pool = ParsePool('lxml', workers=1, max_queue=1)
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(pool, '_get_executor', lambda: executor)
+
+    async def run():
+        assert not pool.busy()
+        tasks = [asyncio.ensure_future(pool.run('_parse_user_profile_page', b'', 'octocat')) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert pool.stats()['pending'] == 1 and pool.stats()['waiting'] == 2
+        assert pool.busy()
+        gate.set()
+        # 第一个解析完成、空位刚释放而等待者尚未提交时，仍视为繁忙
+        while pool.completed == 0:
+            await asyncio.sleep(0)
+        assert pool.pending + pool.waiting >= 1
+        assert pool.busy()
+        await asyncio.gather(*tasks)
+        assert not pool.busy()
+        return pool.stats()
+
+    stats = asyncio.run(run())
+    executor.shutdown()
+    assert stats['completed'] == 3 and stats['waiting'] == 0
@@ -0,0 +1,32 @@
+"""合并后的关注数、加入时间模式：各种写法取到与原先依次尝试的模式相同的分组"""
+
+import pytest
+
+from patterns import FOLLOWERS_PATTERN, FOLLOWING_PATTERN, JOIN_DATE_PATTERN
+
+
+def matched(pattern, text):
+    match = pattern.search(text)
+    return match.group(match.lastgroup) if match else None
+
+
+@pytest.mark.parametrize('text, followers, following', [
+    ('1.2k followers · 30 following', '1.2k', '30'),
+    ('Followers: 45 · Following: 3', '45', '3'),
+    ('12 关注者 · 5 关注中', '12', '5'),
+    ('7\xa0follower', '7', None),
+    ('Overview Repositories', None, None),
+])
+def test_follow_counts(text, followers, following):
+    assert matched(FOLLOWERS_PATTERN, text) == followers
+    assert matched(FOLLOWING_PATTERN, text) == following
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Joined GitHub on March 3, 2012', 'March 3, 2012'),
+    ('Joined on May 14, 2015', 'May 14, 2015'),
+    ('Member since May 2019', 'May 2019'),
+    ('Joined the organization', None),
+])
+def test_join_date(text, expected):
+    assert matched(JOIN_DATE_PATTERN, text) == expected
@@ -0,0 +1,130 @@
+"""
+单次遍历选择器引擎（Compound / ProfileScan）与 BeautifulSoup select 的一致性测试
+
+在保存的用户主页上逐个选择器对比匹配结果，分别使用完整解析和部分解析得到的 DOM；
+并检查部分解析与完整解析提取的资料相同（包括侧栏之外的加入日期）。
+"""
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from github_crawler import GitHubCrawler
+import html_parser
+from html_parser import make_soup
+from profile_extractor import (
+    PROFILE_REGIONS, PROFILE_AREA_SELECTORS, LINK_SELECTOR, INFO_ITEM_SELECTORS,
+    AVATAR_SELECTORS, NAME_SELECTORS, BIO_SELECTORS, JOIN_DATE_SELECTORS, ORGANIZATION_SELECTORS
+)
+
+FIXTURE = Path(__file__).resolve().parent / 'fixtures' / 'profile.html'
+USERNAME = 'octocat'
+
+
+@pytest.fixture(scope='module')
+def crawler():
+    return GitHubCrawler(html_parser='lxml')
+
+
+@pytest.fixture(scope='module')
+def extractor(crawler):
+    return crawler.profile_extractor
+
+
+@pytest.fixture(scope='module', params=['full', 'partial'])
+def soup(request):
+    content = FIXTURE.read_bytes()
+    if request.param == 'full':
+        return BeautifulSoup(content, 'lxml')
+    return make_soup(content, 'lxml', PROFILE_REGIONS)
+
+
+def select(soup, css):
+    return soup.select(css.format(username=USERNAME))
+
+
+def select_one(soup, css):
+    return soup.select_one(css.format(username=USERNAME))
+
+
+def test_all_matches_select(soup, extractor):
+    scan = extractor.scan(soup, USERNAME)
+    for compound in extractor.compounds:
+        assert scan.all(compound.css) == select(soup, compound.css), compound.css
+
+
+def test_first_of_matches_select_one(soup, extractor):
+    scan = extractor.scan(soup, USERNAME)
+    for selectors in (AVATAR_SELECTORS, NAME_SELECTORS, BIO_SELECTORS, JOIN_DATE_SELECTORS):
+        expected = next((tag for tag in (select_one(soup, css) for css in selectors) if tag is not None), None)
+        assert scan.first_of(selectors) is expected, selectors
+
+
+def test_union_matches_grouped_select(soup, extractor):
+    scan = extractor.scan(soup, USERNAME)
+    assert scan.union(ORGANIZATION_SELECTORS) == soup.select(', '.join(ORGANIZATION_SELECTORS))
+
+
+def test_within_matches_area_select(soup, extractor):
+    scan = extractor.scan(soup, USERNAME)
+    for area_css in PROFILE_AREA_SELECTORS:
+        for area in select(soup, area_css):
+            for css in [LINK_SELECTOR] + INFO_ITEM_SELECTORS:
+                assert scan.within(css, area) == area.select(css), (area_css, css)
+    assert scan.within(LINK_SELECTOR, None) == soup.select(LINK_SELECTOR)
+
+
+def test_text_matches_get_text(soup, extractor):
+    assert extractor.scan(soup, USERNAME).text == soup.get_text()
+
+
+def test_extract_profile(soup, crawler):
+    profile = crawler._initialize_profile_structure(USERNAME)
+    crawler._merge_contact_info_to_profile(profile, crawler.profile_extractor.extract(soup, profile))
+
+    assert profile['avatar_url'] == 'https://avatars.githubusercontent.com/u/583231?v=4'
+    assert profile['name'] == 'The Octocat'
+    assert profile['followers'] == 12400
+    assert profile['twitter'] == 'https://twitter.com/github'
+    assert profile['linkedin'] == 'https://www.linkedin.com/in/octocat'
+    assert profile['website'] == 'https://github.blog'
+    additional_info = profile['additional_info']
+    assert additional_info['contributions'] == {'total_contributions': 1234}
+    assert [repo['name'] for repo in additional_info['pinned_repositories']] == ['Hello-World', 'Spoon-Knife']
+
+
+JOIN_DATE_PAGES = {
+    'time': ('<time class="join-time" datetime="2011-01-25T18:44:36Z">Jan 25, 2011</time>', '2011-01-25T18:44:36Z'),
+    'data-date': ('<span data-date="2011-01-25">Joined</span>', '2011-01-25'),
+    'class': ('<span class="join-date">Jan 25, 2011</span>', 'Jan 25, 2011'),
+    'text': ('<p class="color-fg-muted">Joined on Jan 25, 2011</p>', 'Jan 25, 2011'),
+    'none': ('<p class="color-fg-muted">Overview</p>', None),
+}
+
+
+@pytest.mark.parametrize('name', JOIN_DATE_PAGES)
+def test_join_date_outside_sidebar(crawler, monkeypatch, name):
+    main_html, expected = JOIN_DATE_PAGES[name]
+    content = (
+        '<html><body><div class="Layout-sidebar"><div class="h-card">'
+        '<span class="p-name">The Octocat</span></div></div>'
+        f'<div class="Layout-main"><div class="contribution-activity">{main_html}</div></div></body></html>'
+    ).encode()
+
+    profiles = {}
+    for partial in (True, False):
+        monkeypatch.setattr(html_parser, 'PARTIAL_PARSING', partial)
+        profiles[partial] = crawler._parse_user_profile_page(content, USERNAME)
+
+    assert profiles[True]['additional_info'].get('join_date') == expected
+    assert profiles[True] == profiles[False]
+
+
+def test_partial_parse_matches_full_parse(crawler, monkeypatch):
+    content = FIXTURE.read_bytes()
+    profiles = {}
+    for partial in (True, False):
+        monkeypatch.setattr(html_parser, 'PARTIAL_PARSING', partial)
+        profiles[partial] = crawler._parse_user_profile_page(content, USERNAME)
+    assert profiles[True] == profiles[False]
@@ -0,0 +1,70 @@
+"""在途请求合并：参数归一化和每个调用方各自的截止时间"""
+
+import asyncio
+
+import pytest
+
+from deadline import DeadlineExceeded, deadline_scope
+from singleflight import SingleFlight, coalesced
+
+
+class Fetcher:
+    def __init__(self, delay: float = 0.05):
+        self.singleflight = SingleFlight()
+        self.delay = delay
+        self.calls = 0
+
+    @coalesced
+    async def fetch(self, owner: str, repo: str, limit: int = 10):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"{owner}/{repo}:{limit}"
+
+
+def test_positional_and_keyword_calls_coalesce():
+    fetcher = Fetcher()
+
+    async def run():
+        return await asyncio.gather(
+            fetcher.fetch('octo', 'cat'),
+            fetcher.fetch(owner='octo', repo='cat'),
+            fetcher.fetch('octo', repo='cat', limit=10),
+        )
+
+    assert asyncio.run(run()) == ['octo/cat:10'] * 3
+    assert fetcher.calls == 1
+    assert fetcher.singleflight.stats()['shared'] == 2
+
+
+def test_joiner_waits_under_its_own_deadline():
+    fetcher = Fetcher(delay=0.2)
+
+    async def with_deadline(seconds):
+        with deadline_scope(seconds):
+            return await fetcher.fetch('octo', 'cat')
+
+    async def run():
+        return await asyncio.gather(with_deadline(0.05), with_deadline(5), return_exceptions=True)
+
+    short, long = asyncio.run(run())
+    # 第一个调用方超时，共享的请求继续为第二个调用方执行
+    assert isinstance(short, DeadlineExceeded)
+    assert long == 'octo/cat:10'
+    assert fetcher.calls == 1
+
+
+def test_first_caller_cancellation_does_not_affect_joiner():
+    fetcher = Fetcher(delay=0.1)
+
+    async def run():
+        first = asyncio.ensure_future(fetcher.fetch('octo', 'cat'))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(fetcher.fetch('octo', 'cat'))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == 'octo/cat:10'
+    assert fetcher.calls == 1
@@ -0,0 +1,110 @@
+import os
+import time
+import logging
+from typing import Dict, List, Optional, Mapping
+
+from rate_limit import RateLimitScheduler, identity_for_authorization, CORE, ANONYMOUS
+
+# 设置日志
+logger = logging.getLogger(__name__)
+
+# 返回401的token被隔离的时长（秒），到期后重新参与选择
+DEFAULT_QUARANTINE_SECONDS = float(os.getenv("GITHUB_TOKEN_QUARANTINE_SECONDS", "3600"))
+
+# 尚未观测到限流头时，按GitHub认证用户的默认额度估算
+ASSUMED_TOKEN_BUDGET = 5000
+
+
+class GitHubToken:
+    """token 池中的单个 token"""
+
+    def __init__(self, token: str):
+        self.authorization = f"token {token}"
+        self.identity = identity_for_authorization(self.authorization)
+        self.quarantined_until = 0.0
+        self.unauthorized_count = 0
+
+    def is_quarantined(self, now: float) -> bool:
+        return now < self.quarantined_until
+
+
+class GitHubTokenPool:
+    """多 token 池，爬虫和 MCP 集成共享
+
+    每次请求从未被隔离的 token 中选择剩余额度最多（负载最低）的一个并预扣额度，
+    返回401的 token 会被隔离一段时间；所有 token 都不可用时退回匿名请求。
+    """
+
+    def __init__(self, tokens: List[str], rate_limiter: RateLimitScheduler,
+                 quarantine_seconds: float = DEFAULT_QUARANTINE_SECONDS):
+        self.rate_limiter = rate_limiter
+        self.quarantine_seconds = quarantine_seconds
+        self.tokens = [GitHubToken(token) for token in dict.fromkeys(tokens) if token]
+        self._by_authorization = {token.authorization: token for token in self.tokens}
+
+    @classmethod
+    def from_env(cls, rate_limiter: RateLimitScheduler) -> 'GitHubTokenPool':
+        """从环境变量 GITHUB_TOKENS（逗号分隔）和 GITHUB_TOKEN 读取 token 列表"""
+        raw_tokens = os.getenv("GITHUB_TOKENS", "").split(',') + [os.getenv("GITHUB_TOKEN", "")]
+        tokens = [
+            token.strip() for token in raw_tokens
+            if token.strip() and not token.strip().startswith('your_')
+        ]
+        logger.info("GitHub token 池已加载 %s 个 token", len(set(tokens)))
+        return cls(tokens, rate_limiter)
+
+    def _estimated_budget(self, token: GitHubToken, resource: str) -> int:
+        available = self.rate_limiter.available(resource, token.identity)
+        return ASSUMED_TOKEN_BUDGET if available is None else available
+
+    def has_budget(self, resource: str = CORE) -> bool:
+        """任一可用 token 或匿名身份在资源上还有预算"""
+        now = time.time()
+        for token in self.tokens:
+            if not token.is_quarantined(now) and self.rate_limiter.has_budget(resource, token.identity):
+                return True
+        return self.rate_limiter.has_budget(resource, ANONYMOUS)
+
+    def acquire(self, resource: str = CORE) -> Optional[Dict[str, str]]:
+        """选择负载最低的 token 并预扣额度，返回需附加的请求头
+
+        所有 token 都被隔离或额度耗尽时退回匿名（返回空字典），
+        匿名额度也耗尽时返回 None，调用方应改走网页抓取路径。
+        """
+        now = time.time()
+        candidates = sorted(
+            (token for token in self.tokens if not token.is_quarantined(now)),
+            key=lambda token: self._estimated_budget(token, resource),
+            reverse=True
+        )
+        for token in candidates:
+            if self.rate_limiter.has_budget(resource, token.identity) and \
+                    self.rate_limiter.acquire(resource, token.identity):
+                return {'Authorization': token.authorization}
+        if self.rate_limiter.acquire(resource, ANONYMOUS):
+            return {}
+        return None
+
+    def observe(self, request_headers: Mapping, status: int, response_headers: Mapping):
+        """响应监听器：token 返回401时将其隔离"""
+        if status != 401:
+            return
+        token = self._by_authorization.get(request_headers.get('Authorization'))
+        if token is None:
+            return
+        token.unauthorized_count += 1
+        token.quarantined_until = time.time() + self.quarantine_seconds
+        logger.warning("GitHub token %s 返回401，隔离 %s 秒", token.identity, int(self.quarantine_seconds))
+
+    def snapshot(self) -> Dict:
+        """返回各 token 的隔离状态和剩余额度（不含明文 token）"""
+        now = time.time()
+        return {
+            token.identity: {
+                'quarantined': token.is_quarantined(now),
+                'quarantined_for': max(0, int(token.quarantined_until - now)),
+                'unauthorized_count': token.unauthorized_count,
+                'core_remaining': self.rate_limiter.available(CORE, token.identity)
+            }
+            for token in self.tokens
+        }